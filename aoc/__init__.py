@@ -0,0 +1,24 @@
+"""Shared tooling for running and checking the daily puzzle solutions
+
+Each `dayN/dayN.py` module is importable and describes the puzzle
+inputs it is checked against as a tuple of `Case` objects named
+`CASES`. The runner in `aoc.runner` discovers those modules and solves
+their cases, either in-process or across a pool of worker processes.
+Code shared between the days lives alongside it, such as grids in
+`aoc.grid`, graph searches in `aoc.search`, and positions and sets of
+grid cells packed into ints in `aoc.coords` and `aoc.bitgrid`.
+
+    python -m aoc run            # Run every day
+    python -m aoc run 2 7 day16  # Run only the selected days
+    python -m aoc bench 2        # Benchmark day2's solvers
+    python -m aoc perf 2         # Check day2 against the baseline
+    python -m aoc generate 8     # Write a synthetic day8 input
+    python -m aoc batch 9 DIR    # Solve every day9 input in DIR
+    python -m aoc serve          # Solve inputs sent to a socket
+    python -m aoc imports        # Time importing each day
+"""
+
+from aoc import trace
+from aoc.runner import Answer, Case, Result, runCases
+
+__all__ = ["Answer", "Case", "Result", "runCases", "trace"]
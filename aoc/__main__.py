@@ -0,0 +1,648 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Optional, Sequence
+
+from aoc import (
+    baseline,
+    batch,
+    bench,
+    cache,
+    generate,
+    importtime,
+    performance,
+    runner,
+    server,
+    trace,
+)
+
+
+def selectDays(args: argparse.Namespace) -> list[str]:
+    if not args.days:
+        return runner.findDays()
+    # Paths are accepted too, so this can be handed the list of
+    # changed files by pre-commit; collapse them down to days
+    return sorted(
+        {runner.parseDay(day) for day in args.days},
+        key=runner.dayNumber,
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    days = selectDays(args)
+    startTime = time.perf_counter()
+    results = runner.runDays(
+        days,
+        jobs=args.jobs,
+        level=min(args.verbose, trace.DETAIL),
+        profileDir=args.profile,
+        answers=(
+            None
+            if args.no_cache
+            else cache.AnswerCache(args.cache_dir, args.cache_size)
+        ),
+        measureMemory=args.memory,
+        sampleInterval=args.sample_interval if args.sample else None,
+        timePhases=args.phases,
+    )
+    return runner.report(results, time.perf_counter() - startTime)
+
+
+def benchmark(args: argparse.Namespace) -> int:
+    benchmarks = []
+    for day in selectDays(args):
+        dayBenchmarks = bench.benchmarkDay(
+            day,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            budget=args.budget,
+            inputs=args.inputs,
+        )
+        print(bench.formatBenchmarks(dayBenchmarks))
+        benchmarks.extend(dayBenchmarks)
+    bench.writeJson(
+        args.output,
+        benchmarks,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        budget=args.budget,
+    )
+    print(f"\nWrote {len(benchmarks)} benchmarks to {args.output}")
+    return 0
+
+
+def checkPerformance(args: argparse.Namespace) -> int:
+    previous = baseline.Baseline.load(args.baseline)
+    if not previous.measuredHere():
+        if previous.calibration is not None:
+            checked = "its times are scaled to this machine's speed"
+        else:
+            checked = "only memory is checked"
+        print(
+            "Note: the baseline was measured with Python"
+            f" {previous.python} on"
+            f" {previous.host or previous.machine}; {checked}\n"
+        )
+
+    updated = previous
+    regressed = 0
+    for day in selectDays(args):
+        # The machine can speed up or slow down as other work comes
+        # and goes, so each day is calibrated on both sides of it
+        before = baseline.calibrate()
+        dayBenchmarks = bench.benchmarkDay(
+            day,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            budget=args.budget,
+            inputs=args.inputs,
+        )
+        calibration = (before + baseline.calibrate()) / 2
+        comparisons = baseline.compare(
+            dayBenchmarks, previous, calibration
+        )
+        print(baseline.formatComparisons(comparisons))
+        regressed += sum(1 for c in comparisons if c.regressions())
+        updated = updated.updated(dayBenchmarks, calibration)
+
+    if args.update:
+        updated.write(
+            args.baseline,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            budget=args.budget,
+        )
+        print(f"\nUpdated {args.baseline}")
+        return 0
+    if regressed:
+        print(
+            f"\n{regressed} regressed beyond their tolerance; if"
+            " that's expected, rerun with --update"
+        )
+        return 1
+    return 0
+
+
+def solveBatch(args: argparse.Namespace) -> int:
+    import json
+
+    paths = batch.findInputs(args.inputs)
+    if not paths:
+        print(f"No inputs found in {args.inputs}", file=sys.stderr)
+        return 1
+    failures = 0
+    for path, result in batch.solveBatch(
+        runner.parseDay(args.day),
+        paths,
+        parts=args.part,
+        solver=args.solver,
+        jobs=args.jobs,
+        chunkSize=args.chunk_size,
+    ):
+        failures += result.error is not None
+        print(json.dumps(batch.toJson(path, result)), flush=True)
+    return 1 if failures else 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    print(f"Listening on {args.socket}")
+    try:
+        server.serve(
+            args.socket,
+            jobs=args.jobs,
+            level=min(args.verbose, trace.DETAIL),
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def solve(args: argparse.Namespace) -> int:
+    message = dict(day=args.day, part=args.part, solver=args.solver)
+    if args.input == "-":
+        message["input"] = sys.stdin.read()
+    else:
+        message["path"] = os.path.abspath(args.input)
+    response = server.request(message, args.socket)
+    if response.get("error"):
+        print(response["error"], file=sys.stderr)
+        return 1
+    print(response["answer"])
+    return 0
+
+
+def generateInput(args: argparse.Namespace) -> int:
+    day = runner.parseDay(args.day)
+    if args.output == "-":
+        generate.writeInput(day, args.scale, args.seed, sys.stdout)
+        return 0
+    with open(args.output, "w", encoding="utf-8") as outputFile:
+        count = generate.writeInput(
+            day, args.scale, args.seed, outputFile
+        )
+    print(f"Wrote {count} lines to {args.output}")
+    return 0
+
+
+def importTimes(args: argparse.Namespace) -> int:
+    times = []
+    for day in selectDays(args):
+        times.append(
+            importtime.measureImport(
+                f"{day}.{day}", repeat=args.repeat
+            )
+        )
+    print(importtime.formatImportTimes(times, args.budget))
+    over = [
+        t.module for t in times if t.microseconds / 1000 > args.budget
+    ]
+    if over:
+        print(
+            f"\n{len(over)} over the budget of {args.budget}ms:"
+            f" {', '.join(over)}"
+        )
+        return 1
+    return 0
+
+
+def writeDocs(args: argparse.Namespace) -> int:
+    scaling = []
+    for day in selectDays(args):
+        scaling.extend(
+            performance.timeScaling(day, args.scales, args.budget)
+        )
+    performance.writeJson(
+        args.output, baseline.Baseline.load(args.benchmarks), scaling
+    )
+    print(f"Wrote {args.output}")
+    return 0
+
+
+def compileDays(args: argparse.Namespace) -> int:
+    from aoc import compiled
+
+    days = [
+        day
+        for day in selectDays(args)
+        if args.days or day not in compiled.UNCHECKED
+    ]
+    try:
+        compiled.build(days)
+    except ImportError:
+        print(
+            "Compiling needs mypyc, which comes with mypy",
+            file=sys.stderr,
+        )
+        return 1
+    print(
+        f"Compiled {len(days)} days into {compiled.DEFAULT_DIRECTORY}"
+    )
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(required=True)
+
+    parserRun = subparsers.add_parser(
+        "run", help="solve and check the selected days"
+    )
+    parserRun.add_argument(
+        "days",
+        nargs="*",
+        help=(
+            "days to run such as 2, day2 or day2/day2.py (default:"
+            " all)"
+        ),
+    )
+    parserRun.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parserRun.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help=(
+            "show the solvers' own output, with more for -vv and -vvv"
+        ),
+    )
+    parserRun.add_argument(
+        "--profile",
+        metavar="DIR",
+        help=(
+            "write cProfile and tracemalloc reports for each case to"
+            " DIR"
+        ),
+    )
+    parserRun.add_argument(
+        "--sample",
+        action="store_true",
+        help=(
+            "with --profile, sample the stacks instead of using"
+            " cProfile, which slows long searches down far less"
+        ),
+    )
+    parserRun.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.005,
+        metavar="SECONDS",
+        help="how often to sample them (default: %(default)s)",
+    )
+    parserRun.add_argument(
+        "--memory",
+        action="store_true",
+        help=(
+            "report the memory each phase of each case uses, which"
+            " slows solving down"
+        ),
+    )
+    parserRun.add_argument(
+        "--phases",
+        action="store_true",
+        help="report the time each phase of each case takes",
+    )
+    parserRun.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve every case, even if its answer is cached",
+    )
+    parserRun.add_argument(
+        "--cache-dir",
+        default=cache.DEFAULT_DIRECTORY,
+        help="directory of cached answers (default: %(default)s)",
+    )
+    parserRun.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help=(
+            "most answers to keep, dropping the least recently used"
+            " (default: %(default)s)"
+        ),
+    )
+    parserRun.set_defaults(func=run)
+
+    parserBench = subparsers.add_parser(
+        "bench", help="time the selected days and write JSON results"
+    )
+    parserBench.add_argument(
+        "days",
+        nargs="*",
+        help="days to benchmark, as for run (default: all)",
+    )
+    parserBench.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="untimed runs before sampling (default: %(default)s)",
+    )
+    parserBench.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="timed runs to sample (default: %(default)s)",
+    )
+    parserBench.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help=(
+            "seconds after which no more runs of a case are started"
+            " (default: %(default)s)"
+        ),
+    )
+    parserBench.add_argument(
+        "--inputs",
+        choices=("test", "full", "all"),
+        default="all",
+        help="which inputs to benchmark (default: %(default)s)",
+    )
+    parserBench.add_argument(
+        "-o",
+        "--output",
+        default="benchmark.json",
+        help="path to write results to (default: %(default)s)",
+    )
+    parserBench.set_defaults(func=benchmark)
+
+    parserPerf = subparsers.add_parser(
+        "perf",
+        help=(
+            "benchmark the selected days and fail if any are slower"
+            " or use more memory than the baseline"
+        ),
+    )
+    parserPerf.add_argument(
+        "days",
+        nargs="*",
+        help="days to check, as for run (default: all)",
+    )
+    parserPerf.add_argument(
+        "--baseline",
+        default=baseline.BASELINE,
+        help="baseline results (default: %(default)s)",
+    )
+    parserPerf.add_argument(
+        "--update",
+        action="store_true",
+        help="record the results in the baseline instead",
+    )
+    parserPerf.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="untimed runs before sampling (default: %(default)s)",
+    )
+    parserPerf.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="timed runs to sample (default: %(default)s)",
+    )
+    parserPerf.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help=(
+            "seconds after which no more runs of a case are started"
+            " (default: %(default)s)"
+        ),
+    )
+    parserPerf.add_argument(
+        "--inputs",
+        choices=("test", "full", "all"),
+        default="full",
+        help="which inputs to benchmark (default: %(default)s)",
+    )
+    parserPerf.set_defaults(func=checkPerformance)
+
+    parserBatch = subparsers.add_parser(
+        "batch",
+        help=(
+            "solve a directory of inputs for a day in parallel,"
+            " writing JSON lines"
+        ),
+    )
+    parserBatch.add_argument("day", help="day to solve, as for run")
+    parserBatch.add_argument(
+        "inputs", help="directory of inputs, or a glob matching them"
+    )
+    parserBatch.add_argument(
+        "--part",
+        type=int,
+        action="append",
+        default=[],
+        help="part to solve, which can be repeated (default: all)",
+    )
+    parserBatch.add_argument(
+        "--solver",
+        help="solver to use (default: the day's first for each part)",
+    )
+    parserBatch.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parserBatch.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help=(
+            "inputs sent to a worker at a time (default: a quarter of"
+            " each worker's share)"
+        ),
+    )
+    parserBatch.set_defaults(func=solveBatch)
+
+    parserServe = subparsers.add_parser(
+        "serve",
+        help=(
+            "solve inputs sent to a socket with warm worker processes"
+        ),
+    )
+    parserServe.add_argument(
+        "--socket",
+        default=server.DEFAULT_SOCKET,
+        help=(
+            "path of the Unix socket to listen on (default:"
+            " %(default)s)"
+        ),
+    )
+    parserServe.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parserServe.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="show the solvers' own output on the server",
+    )
+    parserServe.set_defaults(func=serve)
+
+    parserSolve = subparsers.add_parser(
+        "solve", help="solve an input with a running `aoc serve`"
+    )
+    parserSolve.add_argument("day", help="day to solve, as for run")
+    parserSolve.add_argument("part", type=int, help="part to solve")
+    parserSolve.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="path of the input to solve (default: stdin)",
+    )
+    parserSolve.add_argument(
+        "--solver",
+        help="solver to use (default: the day's first for the part)",
+    )
+    parserSolve.add_argument(
+        "--socket",
+        default=server.DEFAULT_SOCKET,
+        help="path of the server's socket (default: %(default)s)",
+    )
+    parserSolve.set_defaults(func=solve)
+
+    parserGenerate = subparsers.add_parser(
+        "generate", help="write a synthetic input for a day"
+    )
+    parserGenerate.add_argument(
+        "day", help="day to generate an input for, as for run"
+    )
+    parserGenerate.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help=(
+            "size relative to the real puzzle input (default:"
+            " %(default)s)"
+        ),
+    )
+    parserGenerate.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for the random numbers (default: %(default)s)",
+    )
+    parserGenerate.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="path to write the input to (default: stdout)",
+    )
+    parserGenerate.set_defaults(func=generateInput)
+
+    parserImports = subparsers.add_parser(
+        "imports",
+        help="time importing the selected days, flagging slow ones",
+    )
+    parserImports.add_argument(
+        "days",
+        nargs="*",
+        help="days to check, as for run (default: all)",
+    )
+    parserImports.add_argument(
+        "--budget",
+        type=float,
+        default=250.0,
+        help=(
+            "milliseconds each day may take to import (default:"
+            " %(default)s)"
+        ),
+    )
+    parserImports.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help=(
+            "imports to time, keeping the fastest (default:"
+            " %(default)s)"
+        ),
+    )
+    parserImports.set_defaults(func=importTimes)
+
+    parserDocs = subparsers.add_parser(
+        "docs",
+        help=(
+            "write the performance data shown on the site from"
+            " benchmark results"
+        ),
+    )
+    parserDocs.add_argument(
+        "days",
+        nargs="*",
+        help="days to time scaling for, as for run (default: all)",
+    )
+    parserDocs.add_argument(
+        "--benchmarks",
+        default=baseline.BASELINE,
+        help=(
+            "results from `bench` or `perf` to show (default:"
+            " %(default)s)"
+        ),
+    )
+    parserDocs.add_argument(
+        "--scales",
+        type=float,
+        nargs="*",
+        default=list(performance.DEFAULT_SCALES),
+        help=(
+            "sizes of generated input to time each solver on, none"
+            " to skip timing them (default: %(default)s)"
+        ),
+    )
+    parserDocs.add_argument(
+        "--budget",
+        type=float,
+        default=5.0,
+        help=(
+            "seconds after which a solver isn't timed on any larger"
+            " inputs (default: %(default)s)"
+        ),
+    )
+    parserDocs.add_argument(
+        "-o",
+        "--output",
+        default=performance.DEFAULT_OUTPUT,
+        help="path to write the data to (default: %(default)s)",
+    )
+    parserDocs.set_defaults(func=writeDocs)
+
+    parserCompile = subparsers.add_parser(
+        "compile",
+        help=(
+            "compile the selected days with mypyc, which the runner"
+            " then prefers"
+        ),
+    )
+    parserCompile.add_argument(
+        "days",
+        nargs="*",
+        help=(
+            "days to compile, as for run (default: all those checked"
+            " by mypy)"
+        ),
+    )
+    parserCompile.set_defaults(func=compileDays)
+
+    args = parser.parse_args(argv)
+    ret: int = args.func(args)
+    return ret
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Stopping optimisation searches early with the best found so far
+
+Solvers which search for the best of something, such as days 16 and
+19, take a `deadline` in seconds. Once it passes they stop and return
+the best answer they've found, along with a proven upper bound on
+what they'd have found by carrying on, so how far from optimal the
+answer could be is known:
+
+    python -m day16.day16 --deadline 1
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from aoc.runner import Case
+
+
+@dataclass(frozen=True)
+class Bound:
+    """The best answer found, and the most the best could be"""
+
+    best: int
+    upper: int
+
+    @property
+    def optimal(self) -> bool:
+        return self.best >= self.upper
+
+    @property
+    def gap(self) -> float:
+        """How much better the best could be, relative to the bound"""
+        if self.upper <= 0:
+            return 0.0
+        return (self.upper - self.best) / self.upper
+
+    def __str__(self) -> str:
+        if self.optimal:
+            return f"{self.best} (optimal)"
+        return (
+            f"{self.best} (at most {self.upper}, gap {self.gap:.1%})"
+        )
+
+
+def deadlineAfter(seconds: Optional[float]) -> Optional[float]:
+    """Return the `time.monotonic` time `seconds` from now"""
+    return None if seconds is None else time.monotonic() + seconds
+
+
+def expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def share(deadline: Optional[float], parts: int) -> Optional[float]:
+    """Return the deadline for the next of `parts` searches sharing
+    the time left until `deadline` evenly"""
+    if deadline is None:
+        return None
+    now = time.monotonic()
+    return now + max(0.0, deadline - now) / parts
+
+
+def withDeadline(cases: Sequence[Case], seconds: float) -> list[Case]:
+    """Give `cases` whose solvers take a deadline one of `seconds`"""
+    return [
+        (
+            replace(case, kwargs=dict(case.kwargs, deadline=seconds))
+            if "deadline" in inspect.signature(case.solve).parameters
+            else case
+        )
+        for case in cases
+    ]
@@ -0,0 +1,280 @@
+"""Benchmarks checked against a committed baseline
+
+`benchmark-baseline.json` holds `python -m aoc bench` results for
+every day, along with how far each day may drift from them before it
+counts as a regression:
+
+    "tolerances": {
+        "default": {"time": 0.25, "memory": 0.1},
+        "day19": {"time": 0.5, "memory": 0.1}
+    }
+
+A case regresses when its median time grows by more than the `time`
+fraction, and by more than `NOISE_FLOOR` seconds, so that the
+examples which solve in microseconds don't fail on jitter, or when
+its peak RSS grows by more than the `memory` fraction. Cases missing
+from the baseline are reported as new rather than failing.
+
+Times only mean anything next to others from the same machine, so
+the baseline also records how long `calibrate`'s fixed workload took
+when it was measured. Checking it against another machine, or the
+same one under more load, scales its times by how much slower or
+faster that workload runs there. A baseline without a calibration
+can only have its times checked with the same Python on the same
+host; elsewhere only memory is checked.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from aoc.bench import Benchmark, resultsJson
+from aoc.runner import ROOT
+
+BASELINE = os.path.join(ROOT, "benchmark-baseline.json")
+
+# Seconds a median may grow by regardless of its tolerance
+NOISE_FLOOR = 0.005
+# Times `calibrate` runs its workload, taking the median
+CALIBRATION_REPEAT = 7
+
+
+def calibrationWorkload() -> int:
+    """A fixed mix of the loops, arithmetic and dict lookups most
+    solvers spend their time on, taking tens of milliseconds"""
+    counts: dict[int, int] = {}
+    for i in range(200_000):
+        key = i * 7919 % 1021
+        counts[key] = counts.get(key, 0) + i
+    return sum(counts.values())
+
+
+def calibrate(repeat: int = CALIBRATION_REPEAT) -> float:
+    """Return the median seconds `calibrationWorkload` takes here"""
+    samples = []
+    for _ in range(repeat):
+        startTime = time.perf_counter()
+        calibrationWorkload()
+        samples.append(time.perf_counter() - startTime)
+    return statistics.median(samples)
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    # Fractions of the baseline by which a case may grow
+    time: float = 0.25
+    memory: float = 0.1
+
+
+@dataclass(frozen=True)
+class Baseline:
+    benchmarks: list[Benchmark]
+    tolerances: dict[str, Tolerance]
+    # Where the baseline was measured, as in `bench.resultsJson`
+    python: Optional[str] = None
+    machine: Optional[str] = None
+    host: Optional[str] = None
+    # Seconds `calibrate` took alongside the benchmarks
+    calibration: Optional[float] = None
+
+    @classmethod
+    def load(cls, path: str) -> Baseline:
+        try:
+            with open(path, "r", encoding="utf-8") as baselineFile:
+                results = json.load(baselineFile)
+        except FileNotFoundError:
+            return cls([], {})
+        return cls(
+            [Benchmark.fromJson(b) for b in results["benchmarks"]],
+            {
+                day: Tolerance(**tolerance)
+                for day, tolerance in results.get(
+                    "tolerances", {}
+                ).items()
+            },
+            results.get("python"),
+            results.get("machine"),
+            results.get("host"),
+            results.get("calibration"),
+        )
+
+    def tolerance(self, day: str) -> Tolerance:
+        return self.tolerances.get(
+            day, self.tolerances.get("default", Tolerance())
+        )
+
+    def measuredHere(self) -> bool:
+        """Return whether this baseline was measured with this Python
+        on this host, or on this kind of machine if it doesn't say
+        which host"""
+        if self.python is None:
+            return True
+        if self.host is None:
+            return (self.python, self.machine) == (
+                platform.python_version(),
+                platform.machine(),
+            )
+        return (self.python, self.host) == (
+            platform.python_version(),
+            platform.node(),
+        )
+
+    def updated(
+        self,
+        benchmarks: Iterable[Benchmark],
+        calibration: Optional[float] = None,
+    ) -> Baseline:
+        """Return this baseline with the days in `benchmarks`, measured
+        alongside `calibration`, replaced by them, keeping the
+        tolerances
+
+        The days kept were measured at this baseline's calibration, so
+        the new ones are scaled to match it.
+        """
+        benchmarks = list(benchmarks)
+        if calibration is not None and self.calibration is not None:
+            benchmarks = [
+                b.scaled(self.calibration / calibration)
+                for b in benchmarks
+            ]
+            calibration = self.calibration
+        days = {b.day for b in benchmarks}
+        kept = [b for b in self.benchmarks if b.day not in days]
+        return Baseline(
+            kept + benchmarks,
+            self.tolerances,
+            calibration=calibration,
+        )
+
+    def write(
+        self, path: str, warmup: int, repeat: int, budget: float
+    ) -> None:
+        results = resultsJson(self.benchmarks, warmup, repeat, budget)
+        results["calibration"] = self.calibration
+        results["tolerances"] = {
+            day: vars(tolerance)
+            for day, tolerance in sorted(self.tolerances.items())
+        }
+        with open(path, "w", encoding="utf-8") as outputFile:
+            json.dump(results, outputFile, indent=2)
+            outputFile.write("\n")
+
+
+def benchmarkKey(b: Benchmark) -> tuple[str, str, str, str, str]:
+    return (
+        b.day,
+        b.phase,
+        b.solver,
+        b.input,
+        json.dumps(b.kwargs, sort_keys=True, default=repr),
+    )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    benchmark: Benchmark
+    baseline: Optional[Benchmark]
+    tolerance: Tolerance
+    # False when the baseline's times were measured somewhere else
+    checkTime: bool = True
+
+    @property
+    def timeChange(self) -> Optional[float]:
+        if self.baseline is None or self.baseline.median <= 0:
+            return None
+        return self.benchmark.median / self.baseline.median - 1
+
+    @property
+    def memoryChange(self) -> Optional[float]:
+        if (
+            self.baseline is None
+            or not self.baseline.peakRss
+            or self.benchmark.peakRss is None
+        ):
+            return None
+        return self.benchmark.peakRss / self.baseline.peakRss - 1
+
+    def regressions(self) -> list[str]:
+        if self.baseline is None:
+            return []
+        found = []
+        timeChange = self.timeChange
+        if (
+            self.checkTime
+            and timeChange is not None
+            and timeChange > self.tolerance.time
+            and self.benchmark.median - self.baseline.median
+            > NOISE_FLOOR
+        ):
+            found.append("time")
+        memoryChange = self.memoryChange
+        if (
+            memoryChange is not None
+            and memoryChange > self.tolerance.memory
+        ):
+            found.append("memory")
+        return found
+
+
+def compare(
+    benchmarks: Iterable[Benchmark],
+    baseline: Baseline,
+    calibration: Optional[float] = None,
+) -> list[Comparison]:
+    """Pair each of `benchmarks` with the same case in `baseline`
+
+    Given the `calibration` measured alongside `benchmarks`, the
+    baseline's times are scaled by how it compares with the
+    baseline's own.
+    """
+    scale = 1.0
+    checkTime = baseline.measuredHere()
+    if calibration is not None and baseline.calibration:
+        scale = calibration / baseline.calibration
+        checkTime = True
+    previous = {
+        benchmarkKey(b): b.scaled(scale) for b in baseline.benchmarks
+    }
+    return [
+        Comparison(
+            b,
+            previous.get(benchmarkKey(b)),
+            baseline.tolerance(b.day),
+            checkTime,
+        )
+        for b in benchmarks
+    ]
+
+
+def formatChange(change: Optional[float]) -> str:
+    return "" if change is None else f"{change:+.0%}"
+
+
+def formatComparisons(comparisons: Iterable[Comparison]) -> str:
+    out = [
+        f"{'Day':<6} {'Phase':<6} {'Solver':<14} {'Input':<27}"
+        f" {'Median':>10} {'Change':>7} {'Peak RSS':>10} {'Change':>7}"
+    ]
+    for c in comparisons:
+        b = c.benchmark
+        rss = (
+            "" if b.peakRss is None else f"{b.peakRss / 2**20:.1f}MiB"
+        )
+        if c.baseline is None:
+            status = "  new"
+        elif c.regressions():
+            status = f"  REGRESSED ({', '.join(c.regressions())})"
+        else:
+            status = ""
+        out.append(
+            f"{b.day:<6} {b.phase:<6} {b.solver:<14} {b.input:<27}"
+            f" {b.median:>9.4f}s {formatChange(c.timeChange):>7}"
+            f" {rss:>10} {formatChange(c.memoryChange):>7}{status}"
+        )
+    return "\n".join(out)
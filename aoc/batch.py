@@ -0,0 +1,93 @@
+"""Solving a whole directory of inputs for a day
+
+`solveBatch` spreads every (input, part) pair across a pool of worker
+processes in chunks, so each worker gets a run of inputs to solve per
+round trip rather than one, and yields each chunk's results as soon
+as it's done rather than in order. `python -m aoc batch` writes them
+out as JSON lines:
+
+    {"path": "inputs/alice.txt", "part": 1, "answer": 1909, ...}
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterator, Optional, Sequence
+
+from aoc import trace
+from aoc.runner import Result, initWorker, loadCases, quiet, solvePath
+
+
+def findInputs(pattern: str) -> list[str]:
+    """Return every file in the directory `pattern`, or every file
+    matching the glob `pattern`, sorted"""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    return sorted(
+        path
+        for path in glob.glob(pattern, recursive=True)
+        if os.path.isfile(path)
+    )
+
+
+def solveChunk(
+    day: str, chunk: Sequence[tuple[str, int]], solver: Optional[str]
+) -> list[tuple[str, Result]]:
+    results = []
+    # Anything the solvers print would end up mixed into the results
+    with quiet():
+        for path, part in chunk:
+            results.append((path, solvePath(day, part, path, solver)))
+    return results
+
+
+def toJson(path: str, result: Result) -> dict[str, Any]:
+    return dict(
+        path=path,
+        day=result.day,
+        part=result.part,
+        solver=result.solver,
+        answer=result.answer,
+        seconds=result.seconds,
+        error=result.error,
+    )
+
+
+def solveBatch(
+    day: str,
+    paths: Sequence[str],
+    parts: Sequence[int] = (),
+    solver: Optional[str] = None,
+    jobs: Optional[int] = None,
+    chunkSize: Optional[int] = None,
+) -> Iterator[tuple[str, Result]]:
+    """Solve each of `paths` for each of `parts` of `day` (default:
+    all of them), yielding (path, result) pairs as they're done
+
+    By default each worker is sent about a quarter of its share of
+    the inputs at a time, which keeps the workers busy to the end
+    without a round trip per input.
+    """
+    if not parts:
+        parts = sorted({case.part for case in loadCases(day)})
+    work = [(path, part) for path in paths for part in parts]
+    if not work:
+        return
+    jobs = jobs or os.cpu_count() or 1
+    if chunkSize is None:
+        chunkSize = max(1, len(work) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initWorker,
+        initargs=(trace.QUIET,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                solveChunk, day, work[i : i + chunkSize], solver
+            )
+            for i in range(0, len(work), chunkSize)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import platform
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from aoc import memory
+from aoc.runner import Case, loadCases, quiet
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the `fraction` percentile of `samples`,
+    interpolating linearly between the closest ranks"""
+    assert samples
+    assert 0 <= fraction <= 1
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * fraction
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = rank - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    day: str
+    # One of "parse", "part1" or "part2"
+    phase: str
+    solver: str
+    input: str
+    # Distinguishes cases which share an input, such as day6's
+    kwargs: dict[str, Any]
+    samples: list[float]
+    # The peak resident set size, in bytes, of the fresh process which
+    # solved the case, or None for parsing, which isn't measured
+    peakRss: Optional[int] = None
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 0.95)
+
+    def scaled(self, factor: float) -> Benchmark:
+        """Return this benchmark with its times multiplied by
+        `factor`"""
+        return replace(
+            self, samples=[sample * factor for sample in self.samples]
+        )
+
+    @classmethod
+    def fromJson(cls, entry: dict[str, Any]) -> Benchmark:
+        return cls(
+            day=entry["day"],
+            phase=entry["phase"],
+            solver=entry["solver"],
+            input=entry["input"],
+            kwargs=entry["kwargs"],
+            samples=entry["samples"],
+            peakRss=entry.get("peakRss"),
+        )
+
+    def toJson(self) -> dict[str, Any]:
+        return dict(
+            asdict(self),
+            median=self.median,
+            p95=self.p95,
+            min=min(self.samples),
+            max=max(self.samples),
+        )
+
+
+def sample(
+    func: Callable[[], object],
+    warmup: int,
+    repeat: int,
+    budget: float,
+) -> list[float]:
+    """Time `repeat` calls of `func` after `warmup` untimed calls
+
+    Once `budget` seconds have been spent on either the warmup or the
+    timed calls, no more are started, so the slowest days are only
+    sampled once rather than holding up the whole suite.
+    """
+    spent = 0.0
+    for _ in range(warmup):
+        startTime = time.perf_counter()
+        func()
+        spent += time.perf_counter() - startTime
+        if spent >= budget:
+            break
+
+    samples: list[float] = []
+    spent = 0.0
+    while len(samples) < repeat:
+        startTime = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - startTime)
+        spent += samples[-1]
+        if spent >= budget:
+            break
+    return samples
+
+
+def readAll(case: Case) -> Any:
+    """Read `case`'s input, collecting the lines of streamed inputs
+    so that they can be solved more than once"""
+    contents = case.read()
+    if isinstance(contents, Iterator):
+        return list(contents)
+    return contents
+
+
+def sampleCase(
+    day: str, index: int, warmup: int, repeat: int, budget: float
+) -> tuple[list[float], int]:
+    """Sample solving one of `day`'s cases in this process, returning
+    the samples and the process's peak RSS"""
+    case = loadCases(day)[index]
+    contents = readAll(case)
+
+    def solve() -> object:
+        # Some solvers modify the lines they're given,
+        # so each call needs its own copy
+        if isinstance(contents, list):
+            return case.solve(contents[:], **case.kwargs)
+        return case.solve(contents, **case.kwargs)
+
+    with quiet():
+        samples = sample(solve, warmup, repeat, budget)
+    return samples, memory.peakRss()
+
+
+def benchmarkDay(
+    day: str,
+    warmup: int,
+    repeat: int,
+    budget: float,
+    inputs: str = "all",
+) -> list[Benchmark]:
+    """Benchmark reading each of `day`'s inputs, then each of its
+    cases, which are solved with their output silenced
+
+    Each case is solved in a fresh process, so that the peak memory
+    of that process is the case's own. `inputs` selects the "test"
+    inputs, the "full" puzzle inputs, or "all" of them.
+    """
+    indexes = [
+        index
+        for index, case in enumerate(loadCases(day))
+        if inputs == "all" or (inputs == "test") == case.isTest
+    ]
+    cases = [loadCases(day)[index] for index in indexes]
+    benchmarks = []
+
+    parsed: dict[tuple[str, str], Case] = {}
+    for case in cases:
+        parsed.setdefault(
+            (case.input, case.reader.__qualname__), case
+        )
+    for case in parsed.values():
+        benchmarks.append(
+            Benchmark(
+                day=day,
+                phase="parse",
+                solver=case.reader.__qualname__,
+                input=case.input,
+                kwargs={},
+                samples=sample(
+                    lambda: readAll(case), warmup, repeat, budget
+                ),
+            )
+        )
+
+    for index, case in zip(indexes, cases):
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            samples, rss = executor.submit(
+                sampleCase, day, index, warmup, repeat, budget
+            ).result()
+        benchmarks.append(
+            Benchmark(
+                day=day,
+                phase=f"part{case.part}",
+                solver=case.solve.__name__,
+                input=case.input,
+                kwargs=dict(case.kwargs),
+                samples=samples,
+                peakRss=rss,
+            )
+        )
+    return benchmarks
+
+
+def formatBenchmarks(benchmarks: Iterable[Benchmark]) -> str:
+    out = [
+        f"{'Day':<6} {'Phase':<6} {'Solver':<14} {'Input':<27}"
+        f" {'Median':>10} {'p95':>10} {'Runs':>4} {'Peak RSS':>10}"
+    ]
+    for b in benchmarks:
+        rss = (
+            "" if b.peakRss is None else f"{b.peakRss / 2**20:.1f}MiB"
+        )
+        out.append(
+            f"{b.day:<6} {b.phase:<6} {b.solver:<14} {b.input:<27}"
+            f" {b.median:>9.4f}s {b.p95:>9.4f}s {len(b.samples):>4}"
+            f" {rss:>10}"
+        )
+    return "\n".join(out)
+
+
+def resultsJson(
+    benchmarks: Iterable[Benchmark],
+    warmup: int,
+    repeat: int,
+    budget: float,
+) -> dict[str, Any]:
+    return dict(
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        machine=platform.machine(),
+        host=platform.node(),
+        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        warmup=warmup,
+        repeat=repeat,
+        budget=budget,
+        benchmarks=[b.toJson() for b in benchmarks],
+    )
+
+
+def writeJson(
+    path: str,
+    benchmarks: Iterable[Benchmark],
+    warmup: int,
+    repeat: int,
+    budget: float,
+) -> None:
+    results = resultsJson(benchmarks, warmup, repeat, budget)
+    with open(path, "w", encoding="utf-8") as outputFile:
+        json.dump(results, outputFile, indent=2)
+        outputFile.write("\n")
@@ -0,0 +1,73 @@
+"""Sets of grid cells packed into the bits of a Python int
+
+A whole frontier can then be stepped in every direction with a few
+shifts, as when everything reachable in a minute is wanted at once.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+class BitGrid:
+    """Sets of cells of a `height` by `width` grid, packed into ints
+
+    Cell (y, x) is bit `y * stride + x`. Each row is followed by a
+    spare bit which is always clear, so stepping sideways off the end
+    of one row doesn't land on the next.
+    """
+
+    def __init__(self, height: int, width: int) -> None:
+        self.height = height
+        self.width = width
+        self.stride = width + 1
+        row = (1 << width) - 1
+        self.full = 0
+        for y in range(height):
+            self.full |= row << (y * self.stride)
+
+    def bit(self, y: int, x: int) -> int:
+        return 1 << (y * self.stride + x)
+
+    def fromMask(self, mask: npt.NDArray[np.bool_]) -> int:
+        padded = np.zeros((self.height, self.stride), dtype=bool)
+        padded[:, : self.width] = mask
+        packed = np.packbits(padded, bitorder="little")
+        return int.from_bytes(packed.tobytes(), "little")
+
+    def toMask(self, bits: int) -> npt.NDArray[np.bool_]:
+        size = self.height * self.stride
+        packed = np.frombuffer(
+            bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8
+        )
+        unpacked = np.unpackbits(
+            packed, count=size, bitorder="little"
+        )
+        return unpacked.reshape(self.height, self.stride)[
+            :, : self.width
+        ].astype(bool)
+
+    def shift(self, bits: int, dy: int, dx: int) -> int:
+        """Move every cell in `bits` `dy` down and `dx` right,
+        dropping any which leave the grid
+
+        Only a single spare bit separates the rows, so cells can be
+        moved at most one column sideways; any further and they'd
+        wrap onto the neighbouring row.
+        """
+        assert -1 <= dx <= 1, f"Can't shift {dx} columns"
+        offset = dy * self.stride + dx
+        if offset >= 0:
+            return (bits << offset) & self.full
+        return (bits >> -offset) & self.full
+
+    def spread(self, bits: int) -> int:
+        """Return `bits` along with every cell next to one of them"""
+        return (
+            bits
+            | self.shift(bits, -1, 0)
+            | self.shift(bits, 1, 0)
+            | self.shift(bits, 0, -1)
+            | self.shift(bits, 0, 1)
+        )
@@ -0,0 +1,159 @@
+"""Answers remembered between runs
+
+Each answer is stored under a key made from the SHA-256 of the input
+file, a hash of the source of the solver's module and the modules it
+uses from this repository, the same for the reader the input is read
+with, and the solver, reader and arguments it was given. Editing the
+input, the solver or the reader therefore misses the cache, while
+re-running an unchanged day returns straight away.
+
+The cache is a directory holding one small JSON file per answer, and
+keeps at most `maxEntries` of them, evicting the least recently used
+first. Writes go through a temporary file and a rename, so several
+worker processes can share the directory.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import sys
+import types
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from aoc.runner import Answer, Case
+
+# The repository root, as in aoc.runner, which imports this module
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DEFAULT_DIRECTORY = os.path.join(ROOT, ".aoc-cache")
+
+# The harness itself has no bearing on the answers, so changes to it
+# shouldn't throw every answer away
+IGNORED_MODULES = frozenset(("aoc", "aoc.runner"))
+
+
+def fileHash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as inputFile:
+        for block in iter(lambda: inputFile.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def isLocal(module: types.ModuleType) -> bool:
+    path = getattr(module, "__file__", None)
+    return path is not None and os.path.realpath(path).startswith(
+        ROOT + os.sep
+    )
+
+
+def localModules(module: types.ModuleType) -> list[types.ModuleType]:
+    """Return `module` and every module from this repository which it
+    uses, directly or indirectly, sorted by name"""
+    found: dict[str, types.ModuleType] = {}
+    toVisit = [module]
+    while toVisit:
+        current = toVisit.pop()
+        if current.__name__ in found or not isLocal(current):
+            continue
+        found[current.__name__] = current
+        for value in vars(current).values():
+            if isinstance(value, types.ModuleType):
+                used = value
+            else:
+                name = getattr(value, "__module__", None)
+                if (
+                    not isinstance(name, str)
+                    or name not in sys.modules
+                ):
+                    continue
+                used = sys.modules[name]
+            if used.__name__ not in IGNORED_MODULES:
+                toVisit.append(used)
+    return [found[name] for name in sorted(found)]
+
+
+@functools.cache
+def sourceHash(moduleName: str) -> str:
+    digest = hashlib.sha256()
+    for module in localModules(sys.modules[moduleName]):
+        assert module.__file__ is not None
+        digest.update(module.__name__.encode())
+        digest.update(fileHash(module.__file__).encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class AnswerCache:
+    directory: str = DEFAULT_DIRECTORY
+    maxEntries: int = 256
+
+    def key(self, case: Case) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            fileHash(case.path),
+            sourceHash(case.solve.__module__),
+            case.solve.__qualname__,
+            sourceHash(case.reader.__module__),
+            case.reader.__qualname__,
+            json.dumps(
+                dict(case.kwargs), sort_keys=True, default=repr
+            ),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Answer]:
+        path = self.path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as cacheFile:
+                answer: Answer = json.load(cacheFile)["answer"]
+            # Mark the entry as recently used
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return answer
+
+    def put(self, key: str, answer: Answer) -> None:
+        import tempfile
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temporaryPath = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as cacheFile:
+            json.dump({"answer": answer}, cacheFile)
+        os.replace(temporaryPath, self.path(key))
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond
+        `maxEntries`, which is left until the end of a run rather than
+        repeated by every worker"""
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    entries.append(
+                        (entry.stat().st_mtime, entry.path)
+                    )
+                except FileNotFoundError:
+                    pass
+        entries.sort()
+        for _, path in entries[
+            : max(0, len(entries) - self.maxEntries)
+        ]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another run
+                pass
@@ -0,0 +1,96 @@
+"""Saving long searches part way through, to carry on with later
+
+A search which can take minutes asks for a `Checkpoint` named after
+itself and whatever determines its result, such as the puzzle input:
+
+    saved = checkpoint.forSearch("day19", minutes, costs)
+
+That's None unless checkpointing has been turned on with `configure`,
+which days run directly do when given `--checkpoint DIR`. Otherwise
+the search checks whether one is `due` every so often, at a point
+where everything it needs to carry on is consistent, and `save`s
+that as plain JSON data, so checkpoints can be moved between
+machines. With `--resume`, it starts from whatever it `load`s
+instead. Once finished, it `remove`s the checkpoint.
+
+Only what's been saved survives a crash or Ctrl-C, so up to
+`interval` seconds of work are lost.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+# Bump this whenever what a search saves changes shape, so that older
+# checkpoints are ignored rather than misread
+VERSION = 1
+
+# Where checkpoints are written, or None to not write any
+directory: Optional[str] = None
+# Whether to carry on from checkpoints found there
+resume = False
+# Seconds between saves
+interval = 60.0
+
+
+def configure(
+    newDirectory: Optional[str],
+    newResume: bool = False,
+    newInterval: float = 60.0,
+) -> None:
+    global directory, resume, interval
+    directory = newDirectory
+    resume = newResume
+    interval = newInterval
+
+
+class Checkpoint:
+    def __init__(self, path: str, resume: bool, interval: float):
+        self.path = path
+        self.resume = resume
+        self.interval = interval
+        self.lastSaved = time.monotonic()
+
+    def due(self) -> bool:
+        return time.monotonic() - self.lastSaved >= self.interval
+
+    def load(self) -> Optional[Any]:
+        """Return the state last saved, if resuming from it"""
+        if not self.resume or not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("version") != VERSION:
+            return None
+        return saved["state"]
+
+    def save(self, state: Any) -> None:
+        """Save `state`, replacing the file all at once so that a
+        crash part way through leaves the last checkpoint intact"""
+        temporaryPath = f"{self.path}.tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as f:
+            json.dump(dict(version=VERSION, state=state), f)
+        os.replace(temporaryPath, self.path)
+        self.lastSaved = time.monotonic()
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def forSearch(name: str, *key: object) -> Optional[Checkpoint]:
+    """Return the checkpoint for the search `name` given `key`, or
+    None if checkpointing is off"""
+    if directory is None:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+    return Checkpoint(
+        os.path.join(directory, f"{name}-{digest}.json"),
+        resume,
+        interval,
+    )
@@ -0,0 +1,150 @@
+"""Solvers compiled into C extensions with mypyc
+
+The solvers are checked with `mypy --strict`, which is most of what
+mypyc needs to compile them, speeding up their hot loops without
+changing them. Compiling is optional, needs a C compiler, and builds
+each day into `build/mypyc`, away from its source, so that running a
+day directly as a script still works:
+
+    python -m aoc compile 19 23
+
+The runner then prefers the compiled version of a day, as long as it
+was built from the source as it is now, so an edited day runs from
+source until it's compiled again. Set `AOC_COMPILED=0` to always run
+from source, for comparing the two.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+from dataclasses import replace
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from aoc.cache import ROOT, fileHash
+
+if TYPE_CHECKING:
+    from aoc.runner import Case
+
+DEFAULT_DIRECTORY = os.path.join(ROOT, "build", "mypyc")
+
+# Days which opt out of mypy's checks, so whose annotations mypyc
+# would enforce at runtime without their ever having been verified
+UNCHECKED = frozenset(("day3", "day21"))
+
+# Whether to use compiled days
+enabled = os.environ.get("AOC_COMPILED", "1") != "0"
+
+loaded: dict[str, Optional[types.ModuleType]] = {}
+
+
+def sourcePath(day: str) -> str:
+    return os.path.join(ROOT, day, f"{day}.py")
+
+
+def hashPath(day: str, directory: str) -> str:
+    """Return where the hash of the source `day` was compiled from is
+    kept"""
+    return os.path.join(directory, day, f"{day}.sha256")
+
+
+def findExtension(day: str, directory: str) -> Optional[str]:
+    """Return the path of `day` compiled from its current source, if
+    there is one"""
+    try:
+        with open(hashPath(day, directory), encoding="utf-8") as f:
+            compiledHash = f.read().strip()
+    except OSError:
+        return None
+    if compiledHash != fileHash(sourcePath(day)):
+        return None
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        path = os.path.join(directory, day, f"{day}{suffix}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load(
+    day: str, directory: str = DEFAULT_DIRECTORY
+) -> Optional[types.ModuleType]:
+    """Return the compiled module for `day`, or None to run it from
+    source"""
+    if not enabled:
+        return None
+    if day in loaded:
+        return loaded[day]
+    module = None
+    path = findExtension(day, directory)
+    if path is not None:
+        # The module's native code is in a library beside it, which
+        # it imports from its own package
+        package = importlib.import_module(day)
+        packageDirectory = os.path.dirname(path)
+        if packageDirectory not in package.__path__:
+            package.__path__.append(packageDirectory)
+        name = f"{day}.{day}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        # Cases find their inputs beside their module's file, and
+        # answers are cached by its source, so point both at the
+        # source it was compiled from
+        module.__file__ = sourcePath(day)
+        sys.modules[name] = module
+    loaded[day] = module
+    return module
+
+
+def prefer(cases: Sequence[Case]) -> list[Case]:
+    """Return `cases` with each solver swapped for its compiled
+    version, where there is one"""
+    preferred = []
+    for case in cases:
+        module = load(case.day)
+        solve = getattr(module, case.solve.__name__, None)
+        preferred.append(
+            case if solve is None else replace(case, solve=solve)
+        )
+    return preferred
+
+
+def build(
+    days: Sequence[str], directory: str = DEFAULT_DIRECTORY
+) -> None:
+    """Compile `days` into `directory`, raising ImportError if mypyc
+    isn't installed"""
+    # Whether these have types depends on the versions installed,
+    # which the type checks can't rely on, so they're loaded untyped
+    mypycify = importlib.import_module("mypyc.build").mypycify
+    setup = importlib.import_module("setuptools").setup
+
+    hashes = {day: fileHash(sourcePath(day)) for day in days}
+    temporary = os.path.join(directory, "temp")
+    setup(
+        name="aoc-compiled",
+        ext_modules=mypycify(
+            [sourcePath(day) for day in days],
+            opt_level="3",
+            # Each day in a library of its own, so they can be
+            # rebuilt one at a time
+            separate=True,
+            target_dir=temporary,
+        ),
+        script_args=[
+            "--quiet",
+            "build_ext",
+            f"--build-lib={directory}",
+            f"--build-temp={temporary}",
+        ],
+    )
+    for day, sourceHash in hashes.items():
+        with open(
+            hashPath(day, directory), "w", encoding="utf-8"
+        ) as f:
+            f.write(f"{sourceHash}\n")
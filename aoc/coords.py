@@ -0,0 +1,84 @@
+"""Positions packed into single ints
+
+Sets and dicts of positions keyed by tuples allocate a tuple for
+every probe and hash all of its parts. Packing a position into one
+int instead makes it cheap to hash, and a step to a neighbour is a
+single addition of a precomputed offset:
+
+    visited = {pack2(0, 0)}
+    for step in NEIGHBOURS2:
+        visited.add(pack2(0, 0) + step)
+
+Each coordinate gets `BITS` bits, offset by `BIAS` so that negative
+coordinates pack too. Coordinates must stay within `BIAS` of zero,
+or they carry into the next field and positions collide. Packing one
+further out fails an assertion, but adding offsets isn't checked, so
+code stepping far from where it packed has to check `inRange` itself.
+For the same reason, unpack a position before checking whether it's
+left some bounds.
+"""
+
+from __future__ import annotations
+
+BITS = 21
+BIAS = 1 << (BITS - 1)
+MASK = (1 << BITS) - 1
+
+
+def inRange(*coordinates: int) -> bool:
+    """Return whether `coordinates` are all close enough to zero to
+    pack"""
+    return all(-BIAS <= c < BIAS for c in coordinates)
+
+
+def pack2(x: int, y: int) -> int:
+    assert inRange(x, y), f"({x}, {y}) is too far out to pack"
+    return ((y + BIAS) << BITS) | (x + BIAS)
+
+
+def unpack2(position: int) -> tuple[int, int]:
+    return (position & MASK) - BIAS, (position >> BITS) - BIAS
+
+
+def pack3(x: int, y: int, z: int) -> int:
+    assert inRange(x, y, z), f"({x}, {y}, {z}) is too far out to pack"
+    return (
+        ((z + BIAS) << (2 * BITS)) | ((y + BIAS) << BITS) | (x + BIAS)
+    )
+
+
+def unpack3(position: int) -> tuple[int, int, int]:
+    return (
+        (position & MASK) - BIAS,
+        ((position >> BITS) & MASK) - BIAS,
+        (position >> (2 * BITS)) - BIAS,
+    )
+
+
+def offset2(dx: int, dy: int) -> int:
+    """Return what to add to a packed position to move it by
+    (dx, dy)"""
+    return pack2(dx, dy) - pack2(0, 0)
+
+
+def offset3(dx: int, dy: int, dz: int) -> int:
+    return pack3(dx, dy, dz) - pack3(0, 0, 0)
+
+
+# Offsets to the four positions sharing an edge with one in 2D
+NEIGHBOURS2 = tuple(
+    offset2(dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+)
+
+# Offsets to the six positions sharing a face with one in 3D
+NEIGHBOURS3 = tuple(
+    offset3(dx, dy, dz)
+    for dx, dy, dz in (
+        (1, 0, 0),
+        (-1, 0, 0),
+        (0, 1, 0),
+        (0, -1, 0),
+        (0, 0, 1),
+        (0, 0, -1),
+    )
+)
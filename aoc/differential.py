@@ -0,0 +1,143 @@
+"""Checking faster solvers against the ones they replace
+
+Where a day has more than one solver for a part, as day 1 does with
+`solveBulk`, the first of its full puzzle input cases for that part is
+taken as the reference and every other solver as a variant of it.
+Each variant is run on the day's edge cases and then on inputs
+generated from one seed after another, through its own reader, and
+stops at the first input on which it disagrees with the reference:
+
+    mismatch = firstMismatch(reference, variant, seeds=range(1000))
+
+Adding a faster solver to a day is then a matter of adding a case for
+it alongside the reference's, and running the `test_differential`
+tests, which check as many seeds as `AOC_DIFFERENTIAL_SEEDS` says.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Sequence
+
+from aoc.generate import generateLines, loadEdgeCases
+from aoc.runner import Answer, Case, dayNumber, loadCases
+
+# The scale of the generated inputs, small enough to solve thousands
+SCALE = 0.02
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    reference: Case
+    variant: Case
+    # How to get the input disagreed on
+    source: str
+    referenceAnswer: Optional[Answer]
+    variantAnswer: Optional[Answer]
+    error: Optional[str] = None
+
+    def __str__(self) -> str:
+        got = (
+            f"raised {self.error}"
+            if self.error is not None
+            else f"gave {self.variantAnswer!r}"
+        )
+        return (
+            f"{self.reference.day} part {self.reference.part}:"
+            f" {self.variant.solve.__name__} {got} where"
+            f" {self.reference.solve.__name__} gave"
+            f" {self.referenceAnswer!r}, on {self.source}"
+        )
+
+
+def solverKey(case: Case) -> tuple[str, str, str]:
+    return (
+        case.solve.__name__,
+        getattr(case.reader, "__qualname__", ""),
+        repr(sorted(case.kwargs.items())),
+    )
+
+
+def referencesAndVariants(
+    day: str,
+) -> list[tuple[Case, list[Case]]]:
+    """Return each part of `day` with a reference case and the
+    variants of it to check"""
+    byPart: dict[int, list[Case]] = {}
+    for case in loadCases(day):
+        if case.isTest:
+            continue
+        cases = byPart.setdefault(case.part, [])
+        if solverKey(case) not in map(solverKey, cases):
+            cases.append(case)
+    return [
+        (cases[0], cases[1:])
+        for _, cases in sorted(byPart.items())
+        if len(cases) > 1
+    ]
+
+
+def inputs(
+    day: str, seeds: Iterable[int], scale: float = SCALE
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield where each input to check comes from, and its lines"""
+    for i, lines in enumerate(loadEdgeCases(day)):
+        yield f"edge case {i} of {day}/generate.py", lines
+    for seed in seeds:
+        yield (
+            (
+                f"python -m aoc generate {dayNumber(day)} --scale"
+                f" {scale} --seed {seed}"
+            ),
+            list(generateLines(day, scale, seed)),
+        )
+
+
+def firstMismatch(
+    reference: Case,
+    variant: Case,
+    seeds: Iterable[int],
+    scale: float = SCALE,
+) -> Optional[Mismatch]:
+    """Return the first input on which `variant` disagrees with
+    `reference`, or None if it never does"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        for source, lines in inputs(reference.day, seeds, scale):
+            with open(path, "w", encoding="utf-8") as inputFile:
+                inputFile.write(
+                    "".join(f"{line}\n" for line in lines)
+                )
+            expected = reference.solve(
+                reference.reader(path), **reference.kwargs
+            )
+            try:
+                answer = variant.solve(
+                    variant.reader(path), **variant.kwargs
+                )
+            except Exception as e:
+                return Mismatch(
+                    reference,
+                    variant,
+                    source,
+                    expected,
+                    None,
+                    f"{type(e).__name__}: {e}",
+                )
+            if answer != expected:
+                return Mismatch(
+                    reference, variant, source, expected, answer
+                )
+    return None
+
+
+def findVariants(days: Sequence[str]) -> list[tuple[Case, Case]]:
+    """Return every reference and variant pair in `days`"""
+    return [
+        (reference, variant)
+        for day in days
+        for reference, variants in referencesAndVariants(day)
+        for variant in variants
+    ]
@@ -0,0 +1,69 @@
+"""Synthetic puzzle inputs at a chosen scale
+
+Each `dayN/generate.py` defines `generate(rng, scale)`, yielding the
+lines of a valid puzzle input built only from `rng`, so the same seed
+always gives the same input. A scale of 1 gives roughly the size of
+the real puzzle input, and larger scales grow the amount of input
+(lines, grid cells, sensors, valves and so on) in proportion.
+
+Inputs are generated to suit the `kwargs` of the day's full puzzle
+input cases, so they can be solved the same way.
+
+A generator can also define `edgeCases()`, returning small inputs
+which random ones are unlikely to hit, such as empty stacks or
+negative coordinates, for checking solvers against each other.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import random
+from typing import Callable, Iterable, Iterator, TextIO
+
+Generator = Callable[[random.Random, float], Iterable[str]]
+
+
+def scaled(count: float, scale: float, minimum: int = 1) -> int:
+    """Return `count` multiplied by `scale`, but never less than
+    `minimum`"""
+    return max(minimum, round(count * scale))
+
+
+def scaledSide(side: int, scale: float, minimum: int = 1) -> int:
+    """Return the side length of a square-ish grid whose area is
+    `scale` times that of a grid with sides of `side`"""
+    return scaled(side, math.sqrt(scale), minimum)
+
+
+def loadGenerator(day: str) -> Generator:
+    module = importlib.import_module(f"{day}.generate")
+    generator: Generator = module.generate
+    return generator
+
+
+def loadEdgeCases(day: str) -> list[list[str]]:
+    """Return the lines of each of `day`'s edge case inputs"""
+    module = importlib.import_module(f"{day}.generate")
+    edgeCases: Callable[[], Iterable[list[str]]] = getattr(
+        module, "edgeCases", list
+    )
+    return list(edgeCases())
+
+
+def generateLines(day: str, scale: float, seed: int) -> Iterator[str]:
+    rng = random.Random(seed)
+    yield from loadGenerator(day)(rng, scale)
+
+
+def writeInput(
+    day: str, scale: float, seed: int, outputFile: TextIO
+) -> int:
+    """Write a generated input for `day` to `outputFile`, returning
+    the number of lines written"""
+    count = 0
+    for line in generateLines(day, scale, seed):
+        outputFile.write(line)
+        outputFile.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,138 @@
+"""Rectangular puzzle grids held in NumPy arrays
+
+A `Grid` wraps a 2D array of cells, indexed `[y, x]` with the
+origin at the top left, as in the puzzle inputs. Parsed grids hold
+the input's bytes as `uint8`, so `grid.cells == ord("#")` is a mask of
+the walls. Whole-grid operations are done with masks and `shift`
+rather than by visiting cells one at a time:
+
+    # Cells with a wall directly above them
+    belowWall = shift(grid.cells == ord("#"), 1, 0, False)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# (dy, dx) for up, down, left and right
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# As NEIGHBOURS, plus the four diagonals
+NEIGHBOURS_DIAGONAL = NEIGHBOURS + (
+    (-1, -1),
+    (-1, 1),
+    (1, -1),
+    (1, 1),
+)
+
+
+@dataclass(eq=False)
+class Grid:
+    cells: npt.NDArray[Any]
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> Grid:
+        """Parse a grid of equal length lines, which may or may not
+        end with a newline, as a read-only view of `data`"""
+        width = data.find(b"\n")
+        if width < 0:
+            width = len(data)
+        stride = width + 1
+        height = (len(data) + 1) // stride
+        flat = np.frombuffer(data, dtype=np.uint8)
+        assert (
+            len(data) - height * stride in (-1, 0)
+            and (flat[width::stride] == ord("\n")).all()
+        ), "Lines differ in length"
+        # View each line, stepping over the newline after it
+        cells = np.lib.stride_tricks.as_strided(
+            flat, shape=(height, width), strides=(stride, 1)
+        )
+        return cls(cells)
+
+    @classmethod
+    def fromLines(cls, lines: Sequence[str], fill: str = " ") -> Grid:
+        """Parse a grid from `lines`, padding any short lines with
+        `fill`"""
+        width = max((len(line) for line in lines), default=0)
+        data = "".join(line.ljust(width, fill) for line in lines)
+        cells = np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+        return cls(cells.reshape(len(lines), width).copy())
+
+    @classmethod
+    def filled(
+        cls,
+        height: int,
+        width: int,
+        fill: int,
+        dtype: npt.DTypeLike = np.uint8,
+    ) -> Grid:
+        return cls(np.full((height, width), fill, dtype=dtype))
+
+    @property
+    def height(self) -> int:
+        return int(self.cells.shape[0])
+
+    @property
+    def width(self) -> int:
+        return int(self.cells.shape[1])
+
+    def inBounds(self, y: int, x: int) -> bool:
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def find(self, char: str) -> list[tuple[int, int]]:
+        """Return the (y, x) of every cell holding `char`"""
+        return [
+            (int(y), int(x))
+            for y, x in np.argwhere(self.cells == ord(char))
+        ]
+
+    def padded(self, margin: int, fill: int) -> Grid:
+        return Grid(np.pad(self.cells, margin, constant_values=fill))
+
+    def toLines(self) -> list[str]:
+        return [
+            row.tobytes().decode("ascii")
+            for row in self.cells.astype(np.uint8)
+        ]
+
+
+def shift(
+    array: npt.NDArray[Any], dy: int, dx: int, fill: Any
+) -> npt.NDArray[Any]:
+    """Return a copy of `array` moved `dy` cells down and `dx` cells
+    right, so that `shifted[y + dy, x + dx] == array[y, x]`, with the
+    cells uncovered at the edges set to `fill`"""
+    height, width = array.shape
+    shifted = np.full_like(array, fill)
+    if abs(dy) >= height or abs(dx) >= width:
+        return shifted
+    shifted[
+        max(dy, 0) : height + min(dy, 0),
+        max(dx, 0) : width + min(dx, 0),
+    ] = array[
+        max(-dy, 0) : height + min(-dy, 0),
+        max(-dx, 0) : width + min(-dx, 0),
+    ]
+    return shifted
+
+
+def boundingBox(
+    mask: npt.NDArray[np.bool_],
+) -> Optional[tuple[int, int, int, int]]:
+    """Return the (minY, maxY, minX, maxX) of the cells set in `mask`,
+    inclusive, or `None` if none are"""
+    rows = np.flatnonzero(mask.any(axis=1))
+    if len(rows) == 0:
+        return None
+    columns = np.flatnonzero(mask.any(axis=0))
+    return (
+        int(rows[0]),
+        int(rows[-1]),
+        int(columns[0]),
+        int(columns[-1]),
+    )
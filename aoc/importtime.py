@@ -0,0 +1,116 @@
+"""How long each day's solution takes to import
+
+Many runs, especially on the example inputs, spend longer starting up
+than solving. `measureImport` imports a module in a fresh interpreter
+under `python -X importtime` and totals the time, along with the
+modules it imported which took the longest.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterable
+
+from aoc.runner import ROOT
+
+# How many of the slowest imports to report for each module
+HEAVIEST = 3
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    # Including everything the module imported
+    microseconds: int
+    # The module's own imports, and theirs, which took the longest,
+    # as (name, microseconds) pairs
+    heaviest: list[tuple[str, int]]
+
+
+def parseImportTime(stderr: str, module: str) -> ImportTime:
+    """Total the time spent importing `module` and the packages it's
+    in from the output of `python -X importtime`
+
+    Each line of that looks like
+
+        import time:  self [us] | cumulative | imported package
+
+    where nested imports are indented under the module importing
+    them, and come before it.
+    """
+    packages = set()
+    parts = module.split(".")
+    for i in range(1, len(parts) + 1):
+        packages.add(".".join(parts[:i]))
+
+    total = 0
+    imported: list[tuple[str, int]] = []
+    children: list[tuple[str, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if not fields[1].strip().isdigit():
+            # The header
+            continue
+        cumulative = int(fields[1])
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if depth == 0:
+            if name in packages:
+                total += cumulative
+                imported.extend(children)
+            children = []
+        else:
+            # Report what each package of `module` imported itself,
+            # not what those imports imported in turn
+            if depth == 1:
+                children.append((name, cumulative))
+    imported.sort(key=lambda item: item[1], reverse=True)
+    return ImportTime(module, total, imported[:HEAVIEST])
+
+
+def measureImport(module: str, repeat: int = 3) -> ImportTime:
+    """Import `module` in `repeat` fresh interpreters, returning the
+    fastest, which is least affected by anything else running"""
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                f"import {module}",
+            ],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        measured = parseImportTime(completed.stderr, module)
+        if best is None or measured.microseconds < best.microseconds:
+            best = measured
+    assert best is not None
+    return best
+
+
+def formatImportTimes(
+    times: Iterable[ImportTime], budget: float
+) -> str:
+    """Tabulate `times`, flagging any over `budget` milliseconds"""
+    out = [f"{'Module':<14} {'Import':>9}  Slowest imports"]
+    for t in times:
+        heaviest = ", ".join(
+            f"{name} {microseconds / 1000:.1f}ms"
+            for name, microseconds in t.heaviest
+        )
+        milliseconds = t.microseconds / 1000
+        flag = "  OVER BUDGET" if milliseconds > budget else ""
+        out.append(
+            f"{t.module:<14} {milliseconds:>7.1f}ms  {heaviest}{flag}"
+        )
+    return "\n".join(out)
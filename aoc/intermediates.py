@@ -0,0 +1,107 @@
+"""Intermediate results remembered between runs
+
+Answers are cached by the source of their solver, so editing a solver
+throws its answers away, even where most of the time went into
+building something the edit didn't touch. A solver can keep that
+separately, under a name and a version of its own:
+
+    table = intermediates.cached(
+        "day15-table", 1, (rows, clampX, clampY), lambda: build(rows)
+    )
+
+The value is looked up by its name, its version and a hash of the
+`key`, which should include the parts of the input it's built from,
+and only computed if it isn't found. Bump the version whenever what's
+computed changes, since nothing else will notice.
+
+Values are pickled, so should be plain data rather than instances of
+the solvers' own classes, which might be defined in `__main__` or
+compiled. Caching is off unless `configure`d, which the runner does
+whenever it caches answers, keeping benchmarks honest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable, Optional, TypeVar
+
+from aoc import cache
+
+DEFAULT_DIRECTORY = os.path.join(
+    cache.DEFAULT_DIRECTORY, "intermediates"
+)
+
+# Bump this whenever how values are stored changes
+VERSION = 1
+
+# Where values are kept, or None to always compute them
+directory: Optional[str] = None
+# Most values to keep, dropping the least recently used
+maxEntries = 16
+
+T = TypeVar("T")
+
+
+def configure(newDirectory: Optional[str]) -> None:
+    global directory
+    directory = newDirectory
+
+
+def path(name: str, version: int, key: object) -> str:
+    assert directory is not None
+    digest = hashlib.sha256(
+        repr((VERSION, version, key)).encode()
+    ).hexdigest()[:16]
+    return os.path.join(
+        directory, f"{name}-v{version}-{digest}.pickle"
+    )
+
+
+def cached(
+    name: str, version: int, key: object, compute: Callable[[], T]
+) -> T:
+    """Return what `compute` returns, unless this `version` of it has
+    been computed for `key` already"""
+    if directory is None:
+        return compute()
+    valuePath = path(name, version, key)
+    try:
+        with open(valuePath, "rb") as valueFile:
+            value: T = pickle.load(valueFile)
+        # Mark the value as recently used
+        os.utime(valuePath)
+        return value
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    value = compute()
+    os.makedirs(directory, exist_ok=True)
+    fd, temporaryPath = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as valueFile:
+        pickle.dump(
+            value, valueFile, protocol=pickle.HIGHEST_PROTOCOL
+        )
+    os.replace(temporaryPath, valuePath)
+    evict()
+    return value
+
+
+def evict() -> None:
+    """Remove the least recently used values beyond `maxEntries`"""
+    assert directory is not None
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".pickle"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    entries.sort()
+    for _, valuePath in entries[: max(0, len(entries) - maxEntries)]:
+        try:
+            os.remove(valuePath)
+        except FileNotFoundError:
+            # Already evicted by another process
+            pass
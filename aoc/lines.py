@@ -0,0 +1,59 @@
+"""Puzzle inputs read as lines of text, or as characters
+
+These are the readers a `Case` can be given, apart from
+`aoc.reader.InputFile.open`. They're kept out of `aoc.runner`, which
+the answer cache ignores, so that editing one misses the cache the
+way editing a solver does.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterable, Iterator, TextIO
+
+# The input path standing for standard input
+STDIN = "-"
+# How many characters `streamChars` reads at once
+CHUNK_SIZE = 4096
+
+
+def readLines(path: str) -> list[str]:
+    with open(path, "r", encoding="utf-8") as inputFile:
+        return inputFile.read().splitlines()
+
+
+def iterLines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield each of `lines`, such as those of an open file, without
+    its line ending"""
+    for line in lines:
+        yield line.rstrip("\r\n")
+
+
+def streamLines(path: str) -> Iterator[str]:
+    """Read the file at `path`, or standard input if `path` is `-`,
+    a line at a time rather than all at once"""
+    if path == STDIN:
+        yield from iterLines(sys.stdin)
+        return
+    with open(path, "r", encoding="utf-8") as inputFile:
+        yield from iterLines(inputFile)
+
+
+def iterChars(
+    inputFile: TextIO, chunkSize: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield each character of `inputFile`, line endings included,
+    reading `chunkSize` of them at a time"""
+    for chunk in iter(lambda: inputFile.read(chunkSize), ""):
+        yield from chunk
+
+
+def streamChars(path: str) -> Iterator[str]:
+    """Read the file at `path`, or standard input if `path` is `-`,
+    a character at a time, for inputs whose lines are too long to
+    hold whole"""
+    if path == STDIN:
+        yield from iterChars(sys.stdin)
+        return
+    with open(path, "r", encoding="utf-8") as inputFile:
+        yield from iterChars(inputFile)
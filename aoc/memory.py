@@ -0,0 +1,115 @@
+"""How much memory each solve uses
+
+A `MemoryTracker` runs each phase of a solve, reading the input and
+then solving it, with tracemalloc on, and records for each:
+
+- the peak memory traced while it ran, which is the phase's own since
+  the peak is reset at its start
+- how many of the objects the garbage collector tracks which were
+  made during it were still alive at its end, which counts the
+  containers and instances it left alive, such as the lines read from
+  the input, but not ints or strings
+
+along with the peak RSS of the process at the end, which is a
+high-water mark over everything the process has run so far, not only
+this solve. Tracing allocations slows most solvers down by a factor
+of two or three, so it's only done on request, which is also when
+cases' memory budgets are checked.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from aoc.runner import Result
+
+
+@dataclass(frozen=True)
+class PhaseMemory:
+    phase: str
+    peakTraced: int
+    objectsKept: int
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    phases: list[PhaseMemory]
+    peakRss: int
+
+    @property
+    def peakTraced(self) -> int:
+        return max((p.peakTraced for p in self.phases), default=0)
+
+
+def peakRss() -> int:
+    import resource
+
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes, but macOS bytes
+    return maxRss if sys.platform == "darwin" else maxRss * 1024
+
+
+@dataclass
+class MemoryTracker:
+    phases: list[PhaseMemory] = field(default_factory=list)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        gc.collect()
+        # Set aside everything alive already, so that objects from
+        # before the phase which it frees don't offset the count
+        gc.freeze()
+        wasTracing = tracemalloc.is_tracing()
+        if not wasTracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            if not wasTracing:
+                tracemalloc.stop()
+            gc.collect()
+            objectsKept = len(gc.get_objects())
+            gc.unfreeze()
+            self.phases.append(PhaseMemory(name, peak, objectsKept))
+
+    def usage(self) -> MemoryUsage:
+        return MemoryUsage(list(self.phases), peakRss())
+
+
+def formatBytes(size: int) -> str:
+    return f"{size / 2**10:.0f}KiB"
+
+
+def formatMemory(results: Iterable[Result]) -> str:
+    """Tabulate the memory used by each of `results` which measured
+    it, by phase"""
+    out = [
+        f"{'Day':<6} {'Part':<4} {'Input':<27} {'Phase':<6}"
+        f" {'Traced':>10} {'Kept':>9} {'Peak RSS':>10}"
+        f" {'Budget':>10}"
+    ]
+    for result in results:
+        if result.memory is None:
+            continue
+        budget = (
+            ""
+            if result.memoryBudget is None
+            else formatBytes(result.memoryBudget)
+        )
+        for p in result.memory.phases:
+            out.append(
+                f"{result.day:<6} {result.part:<4} {result.input:<27}"
+                f" {p.phase:<6} {formatBytes(p.peakTraced):>10}"
+                f" {p.objectsKept:>9}"
+                f" {formatBytes(result.memory.peakRss):>10}"
+                f" {budget:>10}"
+            )
+    return "\n".join(out)
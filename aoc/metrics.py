@@ -0,0 +1,268 @@
+"""Statistics the solvers publish about their searches
+
+Solvers register metrics once, at import, and publish to them as they
+run, such as how many states a search has visited or how many
+branches a prune has cut:
+
+    STATES = metrics.counter("day16_states_total", "States visited")
+    ...
+    STATES.inc(states)
+
+There are three kinds, as in Prometheus: counters only go up, gauges
+are set to whatever they currently are, and histograms count
+observations into buckets. Publishing takes a lock, so hot loops
+count in a local variable and publish every so often instead.
+
+Each value is kept separately for the labels current when it was
+published, which the runner sets to the case being solved. The whole
+registry can be rendered in the Prometheus text format, and
+`dumping` writes it to a file every few seconds while a long run
+goes on, for watching it live or comparing runs afterwards:
+
+    python -m day19.day19 --metrics day19.prom
+"""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import math
+import os
+import threading
+from typing import Any, Iterator, Sequence
+
+# Label names and values, sorted by name
+Labels = tuple[tuple[str, str], ...]
+
+# Powers of ten, which suit counts of states
+DEFAULT_BUCKETS = tuple(10.0**i for i in range(8))
+
+
+class Metric(abc.ABC):
+    kind = ""
+    # The value published for each set of labels
+    values: dict[Labels, Any]
+
+    def __init__(self, registry: Registry, name: str, help: str):
+        self.registry = registry
+        self.name = name
+        self.help = help
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Yield the name, labels and value of each sample, which the
+        registry's lock must be held for"""
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, registry: Registry, name: str, help: str):
+        super().__init__(registry, name, help)
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1) -> None:
+        assert amount >= 0, "Counters only go up"
+        with self.registry.lock:
+            labels = self.registry.labels
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        for labels, value in self.values.items():
+            yield self.name, labels, value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        with self.registry.lock:
+            self.values[self.registry.labels] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: Registry,
+        name: str,
+        help: str,
+        buckets: Sequence[float],
+    ):
+        super().__init__(registry, name, help)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # The count in each bucket, not including the ones before,
+        # then the sum of the observations
+        self.values: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float) -> None:
+        with self.registry.lock:
+            labels = self.registry.labels
+            values = self.values.get(labels)
+            if values is None:
+                values = self.values[labels] = [0] * (
+                    len(self.buckets) + 1
+                )
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[i] += 1
+                    break
+            values[-1] += value
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        for labels, values in self.values.items():
+            count = 0.0
+            for bound, inBucket in zip(self.buckets, values):
+                count += inBucket
+                yield (
+                    f"{self.name}_bucket",
+                    labels + (("le", formatValue(bound)),),
+                    count,
+                )
+            yield f"{self.name}_sum", labels, values[-1]
+            yield f"{self.name}_count", labels, count
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.metrics: dict[str, Metric] = {}
+        self.labels: Labels = ()
+
+    def register(self, metric: Metric) -> Metric:
+        """Add `metric`, or return the one registered already under
+        its name, so modules can be reloaded"""
+        with self.lock:
+            existing = self.metrics.setdefault(metric.name, metric)
+        if type(existing) is not type(metric):
+            raise ValueError(
+                f"{metric.name} is already registered as a"
+                f" {existing.kind}"
+            )
+        return existing
+
+    def counter(self, name: str, help: str) -> Counter:
+        metric = self.register(Counter(self, name, help))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        metric = self.register(Gauge(self, name, help))
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = self.register(Histogram(self, name, help, buckets))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    @contextlib.contextmanager
+    def labelled(self, **labels: str) -> Iterator[None]:
+        """Publish with `labels` as well as the current ones for the
+        duration"""
+        previous = self.labels
+        with self.lock:
+            self.labels = tuple(
+                sorted(dict(previous, **labels).items())
+            )
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.labels = previous
+
+    def clear(self) -> None:
+        """Forget every value published, keeping the metrics"""
+        with self.lock:
+            for metric in self.metrics.values():
+                metric.values.clear()
+
+    def text(self) -> str:
+        """Render every metric published to in the Prometheus text
+        format"""
+        out = []
+        with self.lock:
+            for name, metric in sorted(self.metrics.items()):
+                samples = list(metric.samples())
+                if not samples:
+                    continue
+                out.append(f"# HELP {name} {escape(metric.help)}")
+                out.append(f"# TYPE {name} {metric.kind}")
+                for sampleName, labels, value in samples:
+                    out.append(
+                        f"{sampleName}{formatLabels(labels)}"
+                        f" {formatValue(value)}"
+                    )
+        return "".join(f"{line}\n" for line in out)
+
+    def write(self, path: str) -> None:
+        """Write the metrics to `path`, replacing it all at once so
+        that readers never see half of them"""
+        temporaryPath = f"{path}.tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as f:
+            f.write(self.text())
+        os.replace(temporaryPath, path)
+
+
+def escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def formatLabels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{escapeLabel(value)}"' for name, value in labels
+    )
+    return f"{{{pairs}}}"
+
+
+def escapeLabel(value: str) -> str:
+    # Label values escape quotes as well, unlike help text
+    return escape(value).replace('"', '\\"')
+
+
+def formatValue(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# The registry the solvers publish to
+REGISTRY = Registry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+labelled = REGISTRY.labelled
+
+
+@contextlib.contextmanager
+def dumping(
+    path: str, interval: float = 5, registry: Registry = REGISTRY
+) -> Iterator[None]:
+    """Write `registry` to `path` every `interval` seconds, and once
+    more at the end"""
+    stop = threading.Event()
+
+    def dump() -> None:
+        while not stop.wait(interval):
+            registry.write(path)
+
+    thread = threading.Thread(
+        target=dump, name="metrics", daemon=True
+    )
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        registry.write(path)
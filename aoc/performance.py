@@ -0,0 +1,163 @@
+"""What each day costs, for the documentation
+
+The site shows a table of each day's benchmarks on its solution page,
+a chart of how its solvers scale with the size of their input, and a
+leaderboard of every day, slowest first. This writes the data for all
+of those to a single JSON file the site reads:
+
+    python -m aoc docs --benchmarks benchmark-baseline.json
+
+The benchmarks are any results written by `python -m aoc bench` or
+`perf`, and only those on the full puzzle inputs are shown. How the
+solvers scale is measured here, by solving generated inputs of
+increasing `scales`, stopping for each solver once one takes longer
+than `budget` seconds, or fails.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Iterable, Sequence
+
+from aoc.baseline import Baseline
+from aoc.bench import Benchmark, readAll
+from aoc.generate import writeInput
+from aoc.runner import ROOT, loadCases, quiet
+
+DEFAULT_OUTPUT = os.path.join(
+    ROOT, "docs", "src", "data", "performance.json"
+)
+DEFAULT_SCALES = (0.25, 0.5, 1.0, 2.0)
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    day: str
+    phase: str
+    solver: str
+    scale: float
+    seconds: float
+
+
+def timeScaling(
+    day: str,
+    scales: Sequence[float],
+    budget: float,
+    seed: int = 0,
+) -> list[ScalingPoint]:
+    """Time each solver of `day`'s full puzzle input cases on an
+    input generated at each of `scales`, smallest first"""
+    cases = {
+        (case.part, case.solve.__name__): case
+        for case in loadCases(day)
+        if not case.isTest
+    }
+    points = []
+    stopped: set[tuple[int, str]] = set()
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in sorted(scales):
+            path = os.path.join(directory, f"{day}-{scale}.txt")
+            with open(path, "w", encoding="utf-8") as inputFile:
+                writeInput(day, scale, seed, inputFile)
+            for key, case in cases.items():
+                if key in stopped:
+                    continue
+                generated = replace(case, input=path)
+                contents = readAll(generated)
+                startTime = time.perf_counter()
+                try:
+                    with quiet():
+                        generated.solve(contents, **generated.kwargs)
+                except Exception:
+                    # Larger inputs can outgrow what a solver assumes
+                    # of the puzzle's, so leave it off from here on
+                    stopped.add(key)
+                    continue
+                seconds = time.perf_counter() - startTime
+                points.append(
+                    ScalingPoint(
+                        day,
+                        f"part{case.part}",
+                        key[1],
+                        scale,
+                        seconds,
+                    )
+                )
+                if seconds > budget:
+                    stopped.add(key)
+    return points
+
+
+def dayTotal(benchmarks: Iterable[Benchmark]) -> float:
+    """Return the seconds a day takes to solve both parts of its
+    puzzle input with its fastest solvers, parsing included"""
+    fastest: dict[str, float] = {}
+    for b in benchmarks:
+        if b.phase != "parse":
+            fastest[b.phase] = min(
+                fastest.get(b.phase, b.median), b.median
+            )
+    parse = min(
+        (b.median for b in benchmarks if b.phase == "parse"),
+        default=0.0,
+    )
+    return parse + sum(fastest.values())
+
+
+def performanceJson(
+    baseline: Baseline, scaling: Iterable[ScalingPoint]
+) -> dict[str, Any]:
+    byDay: dict[str, list[Benchmark]] = {}
+    for b in baseline.benchmarks:
+        # Only the full puzzle inputs are named like `dayN-input.txt`
+        if b.input.endswith("-input.txt"):
+            byDay.setdefault(b.day, []).append(b)
+    scalingByDay: dict[str, list[dict[str, Any]]] = {}
+    for point in scaling:
+        scalingByDay.setdefault(point.day, []).append(asdict(point))
+
+    totals = {
+        day: dayTotal(benchmarks) for day, benchmarks in byDay.items()
+    }
+    days = {
+        day: dict(
+            total=totals[day],
+            benchmarks=[
+                dict(
+                    phase=b.phase,
+                    solver=b.solver,
+                    input=b.input,
+                    median=b.median,
+                    p95=b.p95,
+                    peakRss=b.peakRss,
+                )
+                for b in benchmarks
+            ],
+            scaling=scalingByDay.get(day, []),
+        )
+        for day, benchmarks in byDay.items()
+    }
+    return dict(
+        python=baseline.python,
+        machine=baseline.machine,
+        days=days,
+        # Slowest first
+        leaderboard=sorted(
+            totals, key=totals.__getitem__, reverse=True
+        ),
+    )
+
+
+def writeJson(
+    path: str, baseline: Baseline, scaling: Iterable[ScalingPoint]
+) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as outputFile:
+        json.dump(
+            performanceJson(baseline, scaling), outputFile, indent=2
+        )
+        outputFile.write("\n")
@@ -0,0 +1,365 @@
+"""Profiles of individual solves
+
+`profileCall` runs a solver under both cProfile and tracemalloc and
+writes three reports next to each other, named after the case:
+
+- `NAME.pstats`, for `python -m pstats` or snakeviz
+- `NAME.collapsed.txt`, collapsed stacks in microseconds for
+  flamegraph.pl, speedscope and the like
+- `NAME.allocations.txt`, the peak traced memory and the lines which
+  had allocated the most at around that time
+
+cProfile only records which function called which, not whole stacks,
+so the collapsed stacks are rebuilt by sharing each function's time
+between its callers in proportion to the time spent under each call.
+This is exact for functions with a single caller and an estimate
+otherwise.
+
+cProfile also slows down every call, which distorts searches making
+millions of small ones, such as days 16 and 19, beyond recognition.
+`sampleCall` instead interrupts the solver with a signal every few
+milliseconds of CPU time and records its whole stack, at little cost.
+It writes the collapsed stacks, and a summary of the functions seen
+most, which it also prints every `SUMMARY_INTERVAL` seconds so long
+runs can be watched as they go:
+
+- `NAME.collapsed.txt`, as above, but from samples
+- `NAME.top.txt`, the share of samples in each function and under it
+"""
+
+from __future__ import annotations
+
+import cProfile
+import collections
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from types import CodeType, FrameType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from aoc.runner import Case
+
+T = TypeVar("T")
+
+# pstats' key for a function: (filename, line number, name)
+Function = tuple[str, int, str]
+
+# Edges contributing less than this many microseconds are left out
+# of the collapsed stacks, as the number of paths through the call
+# graph can be enormous
+MIN_MICROSECONDS = 1.0
+
+# Seconds between the summaries printed while sampling
+SUMMARY_INTERVAL = 30.0
+
+# Functions called by each other, outermost first
+Stack = tuple[CodeType, ...]
+
+
+def profileNames(cases: Sequence[Case]) -> list[str]:
+    """Name each of `cases` by day, part and input, numbering any
+    which would otherwise share a name, such as day6's"""
+    names = [
+        f"{case.day}-part{case.part}-{os.path.splitext(case.input)[0]}"
+        for case in cases
+    ]
+    counts = collections.Counter(names)
+    seen: collections.Counter[str] = collections.Counter()
+    unique = []
+    for name in names:
+        if counts[name] > 1:
+            seen[name] += 1
+            name = f"{name}-{seen[name]}"
+        unique.append(name)
+    return unique
+
+
+class PeakSnapshots(threading.Thread):
+    """Keep a tracemalloc snapshot from the moment the most memory
+    was traced, checking every `interval` seconds
+
+    A snapshot taken once the solver has returned would miss
+    everything it held in local variables, so this watches from the
+    side instead.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.size = -1
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+    def check(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+        self.check()
+
+
+def functionLabel(function: Function) -> str:
+    filename, lineno, name = function
+    if filename == "~":
+        # Built-ins, such as <built-in method builtins.len>
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def collapsedStacks(stats: dict[Function, Any]) -> dict[str, float]:
+    """Rebuild stacks from cProfile's caller and callee pairs,
+    returning the microseconds spent in each"""
+    callees: dict[Function, dict[Function, float]] = (
+        collections.defaultdict(dict)
+    )
+    roots = []
+    for function, (_, _, _, _, callers) in stats.items():
+        if "_lsprof.Profiler" in function[2]:
+            # The call which turned the profiler off
+            continue
+        if not any(caller in stats for caller in callers):
+            roots.append(function)
+        for caller, (_, _, _, edgeTime) in callers.items():
+            callees[caller][function] = edgeTime
+
+    stacks: dict[str, float] = collections.defaultdict(float)
+
+    def walk(
+        function: Function,
+        stack: list[str],
+        onStack: set[Function],
+        fraction: float,
+    ) -> None:
+        selfTime = stats[function][2]
+        stack.append(functionLabel(function))
+        onStack.add(function)
+        path = ";".join(stack)
+        stacks[path] += selfTime * fraction * 1e6
+        for callee, edgeTime in callees[function].items():
+            calleeTotal = stats[callee][3]
+            if callee in onStack or calleeTotal <= 0:
+                # Recursion is folded into the outermost call
+                continue
+            calleeFraction = fraction * edgeTime / calleeTotal
+            if calleeFraction * calleeTotal * 1e6 < MIN_MICROSECONDS:
+                continue
+            walk(callee, stack, onStack, calleeFraction)
+        onStack.discard(function)
+        stack.pop()
+
+    for root in roots:
+        walk(root, [], set(), 1.0)
+    return stacks
+
+
+def writeCollapsed(path: str, stats: dict[Function, Any]) -> None:
+    stacks = collapsedStacks(stats)
+    with open(path, "w", encoding="utf-8") as outputFile:
+        for stack, microseconds in sorted(stacks.items()):
+            if round(microseconds) > 0:
+                outputFile.write(f"{stack} {round(microseconds)}\n")
+
+
+def writeAllocations(
+    path: str,
+    peak: int,
+    snapshot: tracemalloc.Snapshot | None,
+    top: int,
+) -> None:
+    with open(path, "w", encoding="utf-8") as outputFile:
+        outputFile.write(
+            f"Peak traced memory: {peak / 1024:.1f} KiB\n"
+        )
+        if snapshot is None:
+            return
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(
+                    False, "<frozen importlib._bootstrap>"
+                ),
+            )
+        )
+        statistics = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in statistics)
+        outputFile.write(
+            f"Traced near the peak: {total / 1024:.1f} KiB\n\n"
+            f"Top {top} allocation sites:\n"
+        )
+        for stat in statistics[:top]:
+            frame = stat.traceback[0]
+            outputFile.write(
+                f"{stat.size / 1024:12.1f} KiB {stat.count:10} blocks"
+                f"  {frame.filename}:{frame.lineno}\n"
+            )
+
+
+def profileCall(
+    func: Callable[[], T], prefix: str, top: int = 25
+) -> T:
+    """Call `func` under cProfile and tracemalloc, writing reports to
+    paths starting with `prefix`, even if `func` raises"""
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    wasTracing = tracemalloc.is_tracing()
+    if not wasTracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    snapshots = PeakSnapshots()
+    snapshots.start()
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        snapshots.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        if not wasTracing:
+            tracemalloc.stop()
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(f"{prefix}.pstats")
+        writeCollapsed(
+            f"{prefix}.collapsed.txt",
+            stats.stats,  # type: ignore[attr-defined]
+        )
+        writeAllocations(
+            f"{prefix}.allocations.txt", peak, snapshots.snapshot, top
+        )
+
+
+def codeLabel(code: CodeType) -> str:
+    return functionLabel(
+        (code.co_filename, code.co_firstlineno, code.co_name)
+    )
+
+
+class Sampler:
+    """Count the stacks seen every `interval` seconds of CPU time"""
+
+    def __init__(self, interval: float, top: int = 25) -> None:
+        self.interval = interval
+        self.top = top
+        self.stacks: collections.Counter[Stack] = (
+            collections.Counter()
+        )
+        # Frames from here outwards belong to whatever's sampling
+        self.root: Optional[FrameType] = None
+        self.lastSummary = time.monotonic()
+
+    def sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None and frame is not self.root:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        self.stacks[tuple(reversed(stack))] += 1
+        if time.monotonic() - self.lastSummary >= SUMMARY_INTERVAL:
+            print(self.summary(), file=sys.stderr, flush=True)
+            self.lastSummary = time.monotonic()
+
+    def run(self, func: Callable[[], T]) -> T:
+        """Call `func`, sampling it, which has to be done from the
+        main thread"""
+        self.root = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(
+            signal.ITIMER_PROF, self.interval, self.interval
+        )
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def topFunctions(self) -> list[tuple[CodeType, int, int]]:
+        """Return the functions sampled most, with the samples in
+        each and the samples under each"""
+        inside: collections.Counter[CodeType] = collections.Counter()
+        under: collections.Counter[CodeType] = collections.Counter()
+        for stack, count in self.stacks.items():
+            if stack:
+                inside[stack[-1]] += count
+            # Recursive functions are only counted once per sample
+            for code in set(stack):
+                under[code] += count
+        return [
+            (code, inside[code], count)
+            for code, count in under.most_common(self.top)
+        ]
+
+    def summary(self) -> str:
+        total = sum(self.stacks.values())
+        out = [
+            f"{total} samples, {total * self.interval:.1f}s of CPU",
+            f"{'Self':>6} {'Total':>6}  Function",
+        ]
+        for code, inside, under in self.topFunctions():
+            out.append(
+                f"{inside / total:6.1%} {under / total:6.1%} "
+                f" {codeLabel(code)}"
+            )
+        return "\n".join(out)
+
+    def collapsed(self) -> dict[str, float]:
+        """Return the microseconds spent in each stack"""
+        return {
+            ";".join(map(codeLabel, stack)): (
+                count * self.interval * 1e6
+            )
+            for stack, count in self.stacks.items()
+            if stack
+        }
+
+
+def sampleCall(
+    func: Callable[[], T],
+    prefix: str,
+    interval: float = 0.005,
+    top: int = 25,
+) -> T:
+    """Call `func`, sampling its stack every `interval` seconds of
+    CPU time, and write reports to paths starting with `prefix`, even
+    if `func` raises"""
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    sampler = Sampler(interval, top)
+    try:
+        return sampler.run(func)
+    finally:
+        with open(
+            f"{prefix}.collapsed.txt", "w", encoding="utf-8"
+        ) as outputFile:
+            for stack, microseconds in sorted(
+                sampler.collapsed().items()
+            ):
+                outputFile.write(f"{stack} {round(microseconds)}\n")
+        if sampler.stacks:
+            with open(
+                f"{prefix}.top.txt", "w", encoding="utf-8"
+            ) as outputFile:
+                outputFile.write(f"{sampler.summary()}\n")
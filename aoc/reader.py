@@ -0,0 +1,115 @@
+"""Puzzle inputs read through a memory map
+
+Reading an input with `read().splitlines()` copies the whole file into
+a string and then again into one string per line, before any of it
+has been parsed. An `InputFile` maps the file into memory instead, and
+hands out lines as `memoryview`s of the mapping, or parses all of the
+integers in it at once with NumPy:
+
+    Case(1, solve, "day20-input.txt", reader=InputFile.open)
+
+    def solve(inputFile: InputFile) -> int:
+        numbers = inputFile.ints()
+"""
+
+from __future__ import annotations
+
+import array
+import mmap
+from typing import TYPE_CHECKING, Iterator, Sequence, Union
+
+# Days which only want the lines shouldn't pay for importing NumPy, so
+# it's only imported once the integers are parsed
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Longer runs of digits than this don't fit in an int64
+MAX_DIGITS = 18
+
+
+class InputFile:
+    def __init__(self, data: Union[bytes, mmap.mmap]) -> None:
+        self.data = data
+
+    @classmethod
+    def open(cls, path: str) -> InputFile:
+        with open(path, "rb") as inputFile:
+            try:
+                data = mmap.mmap(
+                    inputFile.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files can't be mapped
+                return cls(b"")
+        # The mapping stays valid once the file is closed
+        return cls(data)
+
+    @classmethod
+    def fromLines(cls, lines: Sequence[str]) -> InputFile:
+        """Make an `InputFile` holding `lines`, such as a generated
+        input"""
+        return cls("".join(f"{line}\n" for line in lines).encode())
+
+    def lines(self) -> Iterator[memoryview]:
+        """Yield each line, without its newline, as a view of the
+        file's contents"""
+        view = memoryview(self.data)
+        start = 0
+        end = self.data.find(b"\n")
+        while end >= 0:
+            yield view[start:end]
+            start = end + 1
+            end = self.data.find(b"\n", start)
+        if start < len(self.data):
+            yield view[start:]
+
+    def ints(self) -> npt.NDArray[np.int64]:
+        """Return every integer in the file, in order"""
+        return self.intsByLine()[0]
+
+    def intsByLine(
+        self,
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Return every integer in the file, in order, along with the
+        (zero-based) number of the line each is on
+
+        Integers are runs of digits, negative if just after a `-`.
+        """
+        import numpy as np
+
+        chars = np.frombuffer(self.data, dtype=np.uint8)
+        isDigit = (chars >= ord("0")) & (chars <= ord("9"))
+        edges = np.diff(isDigit.view(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        lengths = ends - starts
+        assert len(lengths) == 0 or lengths.max() <= MAX_DIGITS
+
+        # Build every number up at once, a digit at a time from the
+        # right
+        values = np.zeros(len(starts), dtype=np.int64)
+        place = 1
+        for digit in range(int(lengths.max(initial=0))):
+            hasDigit = lengths > digit
+            positions = ends[hasDigit] - 1 - digit
+            values[hasDigit] += (
+                chars[positions].astype(np.int64) - ord("0")
+            ) * place
+            place *= 10
+
+        negative = np.zeros(len(starts), dtype=bool)
+        afterChar = starts > 0
+        negative[afterChar] = chars[starts[afterChar] - 1] == ord("-")
+        values[negative] *= -1
+
+        newlines = np.flatnonzero(chars == ord("\n"))
+        lineNumbers = np.searchsorted(newlines, starts).astype(
+            np.int64
+        )
+        return values, lineNumbers
+
+    def intArray(self) -> array.array[int]:
+        """Return every integer in the file, in order, for code which
+        is faster with plain Python sequences than NumPy arrays"""
+        return array.array("q", self.ints().tobytes())
@@ -0,0 +1,715 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from aoc import trace
+from aoc.lines import STDIN, readLines, streamChars, streamLines
+
+# Every day's script imports this module, and most runs of them have
+# no use for caching, profiling or worker processes, so the modules
+# for those are only imported once they're needed
+if TYPE_CHECKING:
+    from aoc import cache
+    from aoc.memory import MemoryUsage
+    from aoc.timing import PhaseTime
+
+# Solutions are either numbers or strings of characters
+Answer = Union[int, str]
+
+# The repository root, which holds one directory per day
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+@dataclass(frozen=True)
+class Case:
+    """A single puzzle input a solver is checked against
+
+    `input` is the name of an input file next to the module defining
+    `solve`, and `kwargs` are passed through to `solve` alongside the
+    contents of that file, as read by `reader`. By default that's a
+    list of its lines, but solvers can take an `aoc.reader.InputFile`
+    instead by passing `reader=InputFile.open`, or an iterator over
+    its lines, read as they're needed, by passing
+    `reader=streamLines`, or over its characters with
+    `reader=streamChars`. Those can also be solved with their input
+    streamed from anywhere else, such as standard input.
+
+    A case with a `memoryBudget` fails if solving it, or reading its
+    input, traces more than that many bytes at once, which is only
+    checked when its memory is measured.
+    """
+
+    part: int
+    solve: Callable[..., Answer]
+    input: str
+    solution: Optional[Answer]
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    reader: Callable[[str], Any] = readLines
+    memoryBudget: Optional[int] = None
+
+    @property
+    def directory(self) -> str:
+        module = sys.modules[self.solve.__module__]
+        assert module.__file__ is not None
+        return os.path.dirname(os.path.realpath(module.__file__))
+
+    @property
+    def path(self) -> str:
+        if self.input == STDIN:
+            return STDIN
+        return os.path.join(self.directory, self.input)
+
+    @property
+    def day(self) -> str:
+        return os.path.basename(self.directory)
+
+    @property
+    def isTest(self) -> bool:
+        # Full puzzle inputs are all named like `dayN-input.txt`,
+        # whereas examples have names like `dayN-input-test.txt`
+        return not self.input.endswith("-input.txt")
+
+    def read(self) -> Any:
+        return self.reader(self.path)
+
+
+@dataclass(frozen=True)
+class Result:
+    day: str
+    part: int
+    solver: str
+    input: str
+    answer: Optional[Answer]
+    solution: Optional[Answer]
+    seconds: float
+    error: Optional[str] = None
+    cached: bool = False
+    memory: Optional[MemoryUsage] = None
+    memoryBudget: Optional[int] = None
+    phases: Optional[list[PhaseTime]] = None
+
+    @property
+    def overBudget(self) -> bool:
+        return (
+            self.memory is not None
+            and self.memoryBudget is not None
+            and self.memory.peakTraced > self.memoryBudget
+        )
+
+    @property
+    def ok(self) -> bool:
+        if self.error is not None or self.overBudget:
+            return False
+        return self.solution is None or self.answer == self.solution
+
+
+def dayNumber(day: str) -> int:
+    return int(day.removeprefix("day"))
+
+
+def findDays() -> list[str]:
+    """Return the name of every day with an importable solution"""
+    days = []
+    for name in os.listdir(ROOT):
+        if not re.fullmatch(r"day\d+", name):
+            continue
+        if os.path.exists(os.path.join(ROOT, name, f"{name}.py")):
+            days.append(name)
+    return sorted(days, key=dayNumber)
+
+
+def parseDay(arg: str) -> str:
+    """Convert `2`, `day2` or a path such as `day2/day2.py`
+    into the name of the day it refers to"""
+    if arg.isdigit():
+        return f"day{int(arg)}"
+    m = re.match(r"(?:\./)?(day\d+)(?:/|$)", arg)
+    assert m, f"Unable to determine which day '{arg}' refers to"
+    return m.group(1)
+
+
+def loadCases(day: str) -> Sequence[Case]:
+    """Return the cases of `day`, preferring its compiled module"""
+    from aoc import compiled
+
+    module = compiled.load(day) or importlib.import_module(
+        f"{day}.{day}"
+    )
+    cases: Sequence[Case] = module.CASES
+    return cases
+
+
+def streamedCases(
+    cases: Sequence[Case], path: str, parts: Iterable[int] = ()
+) -> list[Case]:
+    """Return a case reading `path` for each of `cases` which streams
+    the full puzzle input, or only those for `parts` if given
+
+    Standard input can only be read once, so when `path` is `-` only
+    the first case for each part is kept.
+    """
+    parts = set(parts)
+    streamed = []
+    seenParts = set()
+    for case in cases:
+        if (
+            case.isTest
+            or case.reader not in (streamLines, streamChars)
+            or (parts and case.part not in parts)
+            or (path == STDIN and case.part in seenParts)
+        ):
+            continue
+        seenParts.add(case.part)
+        streamed.append(
+            replace(
+                case,
+                input=(
+                    path if path == STDIN else os.path.abspath(path)
+                ),
+                solution=None,
+                memoryBudget=None,
+            )
+        )
+    return streamed
+
+
+def solveCase(
+    case: Case,
+    profile: Optional[str] = None,
+    answers: Optional[cache.AnswerCache] = None,
+    measureMemory: bool = False,
+    sampleInterval: Optional[float] = None,
+    timePhases: bool = False,
+) -> Result:
+    """Solve `case`, profiling it into files starting with `profile`
+    if given, or looking its answer up in `answers` if given
+
+    The profile samples the stacks every `sampleInterval` seconds if
+    given, rather than using cProfile. The memory each phase uses is
+    measured, and the case's memory budget checked, if
+    `measureMemory` is set, and the time spent in each of the solver's
+    own phases is recorded if `timePhases` is set.
+    """
+    if profile is not None or timePhases:
+        # Profiling and timing need the solver to actually run
+        answers = None
+    startTime = time.perf_counter()
+    # A cached answer says nothing about how much memory solving takes
+    if answers is not None and not measureMemory:
+        key = answers.key(case)
+        cachedAnswer = answers.get(key)
+        if cachedAnswer is not None:
+            return Result(
+                day=case.day,
+                part=case.part,
+                solver=case.solve.__name__,
+                input=case.input,
+                answer=cachedAnswer,
+                solution=case.solution,
+                seconds=time.perf_counter() - startTime,
+                cached=True,
+            )
+
+    tracker = None
+    phase: Callable[[str], ContextManager[None]] = nullPhase
+    if measureMemory:
+        from aoc import memory
+
+        tracker = memory.MemoryTracker()
+        phase = tracker.phase
+
+    with phase("read"):
+        contents = case.read()
+    answer: Optional[Answer] = None
+    error = None
+    phaseTimes = None
+    recording: ContextManager[Any] = contextlib.nullcontext()
+    if timePhases:
+        from aoc import timing
+
+        recording = timing.recording()
+    startTime = time.perf_counter()
+    try:
+        with phase("solve"), recording as phaseTimes:
+            if profile is None:
+                answer = case.solve(contents, **case.kwargs)
+            elif sampleInterval is not None:
+                from aoc import profiling
+
+                answer = profiling.sampleCall(
+                    lambda: case.solve(contents, **case.kwargs),
+                    profile,
+                    sampleInterval,
+                )
+            else:
+                from aoc import profiling
+
+                answer = profiling.profileCall(
+                    lambda: case.solve(contents, **case.kwargs),
+                    profile,
+                )
+    except Exception:
+        import traceback
+
+        error = traceback.format_exc()
+    elapsed = time.perf_counter() - startTime
+    if answers is not None and answer is not None:
+        answers.put(answers.key(case), answer)
+    return Result(
+        day=case.day,
+        part=case.part,
+        solver=case.solve.__name__,
+        input=case.input,
+        answer=answer,
+        solution=case.solution,
+        seconds=elapsed,
+        error=error,
+        memory=None if tracker is None else tracker.usage(),
+        memoryBudget=case.memoryBudget,
+        phases=phaseTimes,
+    )
+
+
+@contextlib.contextmanager
+def nullPhase(name: str) -> Iterator[None]:
+    yield
+
+
+def selectCase(day: str, part: int, solver: Optional[str]) -> Case:
+    """Return the case whose solver and arguments are used for `part`
+    of `day`, preferring ones for the full puzzle input"""
+    cases = sorted(
+        (case for case in loadCases(day) if case.part == part),
+        key=lambda case: case.isTest,
+    )
+    for case in cases:
+        if solver is None or case.solve.__name__ == solver:
+            return case
+    raise ValueError(
+        f"{day} has no part {part}"
+        + ("" if solver is None else f" solved by {solver}")
+    )
+
+
+def solvePath(
+    day: str, part: int, path: str, solver: Optional[str] = None
+) -> Result:
+    """Solve the input at `path` for `part` of `day`, with the solver
+    and arguments `selectCase` picks"""
+    case = selectCase(day, part, solver)
+    return solveCase(
+        replace(
+            case,
+            input=os.path.abspath(path),
+            solution=None,
+            memoryBudget=None,
+        )
+    )
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Silence the solvers' own output for the duration"""
+    with trace.levelSet(trace.QUIET):
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                yield
+
+
+def initWorker(
+    level: int, intermediatesDirectory: Optional[str] = None
+) -> None:
+    # Solvers are chatty, and output from several processes
+    # interleaved together isn't useful to anyone, so they're
+    # quiet unless asked otherwise
+    trace.setLevel(level)
+    if intermediatesDirectory is not None:
+        from aoc import intermediates
+
+        intermediates.configure(intermediatesDirectory)
+
+
+def profilePath(
+    profileDir: Optional[str], cases: Sequence[Case], index: int
+) -> Optional[str]:
+    if profileDir is None:
+        return None
+    from aoc import profiling
+
+    return os.path.join(
+        profileDir, profiling.profileNames(cases)[index]
+    )
+
+
+def solveCaseByIndex(
+    day: str,
+    index: int,
+    profileDir: Optional[str] = None,
+    answers: Optional[cache.AnswerCache] = None,
+    measureMemory: bool = False,
+    sampleInterval: Optional[float] = None,
+    timePhases: bool = False,
+) -> Result:
+    # Cases are looked up again inside the worker process rather than
+    # being pickled, since they hold references to module functions
+    cases = loadCases(day)
+    return solveCase(
+        cases[index],
+        profilePath(profileDir, cases, index),
+        answers,
+        measureMemory,
+        sampleInterval,
+        timePhases,
+    )
+
+
+def runDays(
+    days: Iterable[str],
+    jobs: Optional[int],
+    level: int = trace.QUIET,
+    profileDir: Optional[str] = None,
+    answers: Optional[cache.AnswerCache] = None,
+    measureMemory: bool = False,
+    sampleInterval: Optional[float] = None,
+    timePhases: bool = False,
+) -> list[Result]:
+    """Solve every case of every one of `days` across a pool of
+    `jobs` worker processes, returning results in case order
+
+    `level` is the `trace` level the solvers run at, each solve is
+    profiled into `profileDir` if given, by sampling every
+    `sampleInterval` seconds if that's given too, answers are looked
+    up in and saved to `answers` if given, the memory each solve uses
+    is measured if `measureMemory` is set, and the time spent in each
+    of its phases if `timePhases` is.
+    """
+    work = [
+        (day, index)
+        for day in days
+        for index in range(len(loadCases(day)))
+    ]
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Intermediate results are cached alongside the answers
+    intermediatesDirectory = (
+        None
+        if answers is None
+        else os.path.join(answers.directory, "intermediates")
+    )
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initWorker,
+        initargs=(level, intermediatesDirectory),
+    ) as executor:
+        futures = [
+            executor.submit(
+                solveCaseByIndex,
+                day,
+                index,
+                profileDir,
+                answers,
+                measureMemory,
+                sampleInterval,
+                timePhases,
+            )
+            for day, index in work
+        ]
+        results = [future.result() for future in futures]
+    if answers is not None:
+        answers.evict()
+    return results
+
+
+def formatAnswer(answer: Optional[Answer]) -> str:
+    if answer is None:
+        return ""
+    # Keep answers which are pictures, such as day10's, to one row
+    rows = str(answer).splitlines()
+    return rows[0] + " ..." if len(rows) > 1 else str(answer)
+
+
+def formatResults(results: Sequence[Result]) -> str:
+    header = ("Day", "Part", "Solver", "Input", "Answer", "Expected")
+    rows = [
+        (
+            result.day,
+            str(result.part),
+            result.solver,
+            result.input,
+            "error" if result.error else formatAnswer(result.answer),
+            formatAnswer(result.solution),
+            f"{result.seconds:.3f}s",
+            ("ok" if result.ok else "FAIL")
+            + (" (cached)" if result.cached else "")
+            + (" (over memory budget)" if result.overBudget else ""),
+        )
+        for result in results
+    ]
+    widths = [
+        max([len(h)] + [len(row[i]) for row in rows])
+        for i, h in enumerate(header)
+    ]
+    secondsWidth = max([len("Time")] + [len(row[6]) for row in rows])
+
+    def formatRow(row: Sequence[str]) -> str:
+        cells = [
+            f"{cell:<{width}}" for cell, width in zip(row, widths)
+        ]
+        cells.append(f"{row[6]:>{secondsWidth}}")
+        cells.append(row[7])
+        return "  ".join(cells).rstrip()
+
+    out = [formatRow(header + ("Time", ""))]
+    out.extend(formatRow(row) for row in rows)
+    return "\n".join(out)
+
+
+def report(results: Sequence[Result], elapsed: float) -> int:
+    """Print a table of `results` along with the traceback of any
+    solver which raised, returning a process exit code"""
+    for result in results:
+        if result.error:
+            print(f"{result.day} {result.solver} ({result.input}):")
+            print(result.error)
+    print(formatResults(results))
+    if any(result.memory is not None for result in results):
+        from aoc import memory
+
+        print()
+        print(memory.formatMemory(results))
+    if any(result.phases is not None for result in results):
+        from aoc import timing
+
+        print()
+        print(timing.formatPhases(results))
+    failures = sum(1 for result in results if not result.ok)
+    total = sum(result.seconds for result in results)
+    print(
+        f"\n{len(results) - failures}/{len(results)} passed in"
+        f" {elapsed:.2f}s ({total:.2f}s of solving)"
+    )
+    return 1 if failures else 0
+
+
+def parseArgs(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Parse the options for a day run directly, setting `level` to
+    the `trace` level, which shows the solvers' summaries unless `-q`
+    or more `-v`s are given"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="show more of the solvers' output (-vv, -vvv for more)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="show only the answers",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="write cProfile and tracemalloc reports for each case",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help=(
+            "with --profile, sample the stacks instead of using"
+            " cProfile, which slows long searches down far less"
+        ),
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.005,
+        metavar="SECONDS",
+        help="how often to sample them (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse answers from unchanged solvers and inputs",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the memory each phase of each case uses",
+    )
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="report the time each phase of each case takes",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help=(
+            "write the solvers' search statistics to PATH in the"
+            " Prometheus text format as they run"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=5,
+        metavar="SECONDS",
+        help="how often to write --metrics (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="DIR",
+        help="save long searches to DIR as they go",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=60,
+        metavar="SECONDS",
+        help="how often to save them (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="carry on from searches saved in the --checkpoint DIR",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "stop searches which can after SECONDS, with the best"
+            " answer found so far"
+        ),
+    )
+    parser.add_argument(
+        "--input",
+        metavar="PATH",
+        help=(
+            "solve PATH, or standard input if PATH is -, a line at a"
+            " time instead of the usual inputs"
+        ),
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        action="append",
+        default=[],
+        help="with --input, solve only this part",
+    )
+    args = parser.parse_args(argv)
+    if args.resume and args.checkpoint is None:
+        parser.error(
+            "--resume needs a --checkpoint DIR to resume from"
+        )
+    if args.sample and args.profile is None:
+        parser.error("--sample needs a --profile DIR to write to")
+    if args.input == STDIN and len(set(args.part)) != 1:
+        parser.error(
+            "standard input can only be read once, so choose a part"
+            " with --part"
+        )
+    if args.quiet:
+        args.level = trace.QUIET
+    else:
+        args.level = min(
+            max(trace.SUMMARY, args.verbose), trace.DETAIL
+        )
+    return args
+
+
+def runCases(
+    cases: Sequence[Case], argv: Optional[Sequence[str]] = None
+) -> None:
+    """Solve `cases` one after another in this process, with the
+    solvers' own output left visible, and exit non-zero on failure
+
+    This is what each `dayN/dayN.py` does when run directly, with
+    the options taken from `argv` (default: the command line).
+    """
+    args = parseArgs(argv)
+    trace.setLevel(args.level)
+    if cases:
+        from aoc import compiled
+
+        cases = compiled.prefer(cases)
+    if args.checkpoint is not None:
+        from aoc import checkpoint
+
+        checkpoint.configure(
+            args.checkpoint, args.resume, args.checkpoint_interval
+        )
+    if args.input is not None:
+        cases = streamedCases(cases, args.input, args.part)
+        if not cases:
+            sys.exit("Nothing here can be solved from a stream")
+    if args.deadline is not None:
+        from aoc import anytime
+
+        cases = anytime.withDeadline(cases, args.deadline)
+    answers = None
+    # Answers found by a deadline depend on how fast this machine is
+    if args.cache and args.input != STDIN and args.deadline is None:
+        from aoc import cache
+
+        answers = cache.AnswerCache()
+    if args.cache:
+        from aoc import intermediates
+
+        intermediates.configure(intermediates.DEFAULT_DIRECTORY)
+    dumping: ContextManager[None] = contextlib.nullcontext()
+    if args.metrics is not None:
+        from aoc import metrics
+
+        dumping = metrics.dumping(args.metrics, args.metrics_interval)
+    startTime = time.perf_counter()
+    results = []
+    with dumping:
+        for index, case in enumerate(cases):
+            labels: ContextManager[None] = contextlib.nullcontext()
+            if args.metrics is not None:
+                labels = metrics.labelled(
+                    day=case.day,
+                    part=str(case.part),
+                    input=case.input,
+                )
+            with labels:
+                result = solveCase(
+                    case,
+                    profilePath(args.profile, cases, index),
+                    answers,
+                    args.memory,
+                    args.sample_interval if args.sample else None,
+                    args.phases,
+                )
+            if result.error is None:
+                print(f"Calculated:  {result.answer}")
+                if result.solution is not None:
+                    print(f"=> Expecting {result.solution}")
+            results.append(result)
+    if answers is not None:
+        answers.evict()
+    print()
+    sys.exit(report(results, time.perf_counter() - startTime))
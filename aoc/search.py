@@ -0,0 +1,31 @@
+"""Graph searches shared between the days
+
+`bfs` finds how many steps away everything reachable is. Nodes can
+be anything hashable. Neighbours come from a callable, so graphs
+never need building up front.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Hashable, Iterable, TypeVar
+
+Node = TypeVar("Node", bound=Hashable)
+
+
+def bfs(
+    starts: Iterable[Node],
+    neighbours: Callable[[Node], Iterable[Node]],
+) -> dict[Node, int]:
+    """Return the number of steps from the nearest of `starts` to
+    every node reachable from them, in the order they were reached"""
+    distances = {start: 0 for start in starts}
+    queue = deque(distances)
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                queue.append(neighbour)
+    return distances
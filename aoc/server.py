@@ -0,0 +1,134 @@
+"""A local service solving puzzle inputs with warm worker processes
+
+Starting Python and importing a day takes far longer than solving a
+small input, so tools which solve many inputs can instead send them to
+`python -m aoc serve`. It imports every day into a pool of worker
+processes up front, then listens on a Unix domain socket for requests,
+one JSON object per line:
+
+    {"day": 6, "part": 1, "input": "mjqjpqmgbljsphdztnvjfqwrcgsmlb"}
+
+Each gets a JSON line back, in order, holding the `answer` and the
+`seconds` spent solving, or an `error`. Rather than its `input`, a
+request can give the `path` of a file to solve, and a `solver` to use
+other than the day's first for that part.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Optional
+
+from aoc import trace
+from aoc.runner import ROOT, findDays, loadCases, parseDay, solvePath
+
+DEFAULT_SOCKET = os.path.join(ROOT, ".aoc.sock")
+
+
+def preload(level: int) -> None:
+    trace.setLevel(level)
+    for day in findDays():
+        loadCases(day)
+
+
+def handleRequest(executor: Executor, request: Any) -> dict[str, Any]:
+    if not isinstance(request, dict):
+        raise ValueError("Requests must be JSON objects")
+    day = parseDay(str(request["day"]))
+    part = int(request["part"])
+    solver = request.get("solver")
+
+    temporaryPath = None
+    if "path" in request:
+        path = str(request["path"])
+    else:
+        fd, temporaryPath = tempfile.mkstemp(
+            prefix=f"{day}-", suffix=".txt"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as inputFile:
+            inputFile.write(str(request["input"]))
+        path = temporaryPath
+    try:
+        result = executor.submit(
+            solvePath, day, part, path, solver
+        ).result()
+    finally:
+        if temporaryPath is not None:
+            os.remove(temporaryPath)
+    return dict(
+        day=result.day,
+        part=result.part,
+        solver=result.solver,
+        answer=result.answer,
+        seconds=result.seconds,
+        error=result.error,
+    )
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: Server
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = handleRequest(
+                    self.server.executor, json.loads(line)
+                )
+            except Exception as e:
+                response = dict(error=f"{type(e).__name__}: {e}")
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, executor: Executor) -> None:
+        self.executor = executor
+        super().__init__(path, RequestHandler)
+
+
+def serve(
+    path: str = DEFAULT_SOCKET,
+    jobs: Optional[int] = None,
+    level: int = trace.QUIET,
+) -> None:
+    """Answer requests on the socket at `path` with `jobs` workers
+    until interrupted"""
+    if os.path.exists(path):
+        # Left behind by a server which didn't shut down cleanly
+        os.remove(path)
+    # Workers forked from here start with every day imported already
+    preload(level)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=preload, initargs=(level,)
+    ) as executor:
+        # Start the workers before the first request needs them
+        executor.submit(int).result()
+        with Server(path, executor) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(path)
+
+
+def request(
+    message: dict[str, Any], path: str = DEFAULT_SOCKET
+) -> dict[str, Any]:
+    """Send one request to the server at `path`, returning its
+    response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as responses:
+            response: dict[str, Any] = json.loads(
+                responses.readline()
+            )
+    return response
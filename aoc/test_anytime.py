@@ -0,0 +1,67 @@
+# type: ignore
+import time
+
+import pytest
+
+from aoc.anytime import Bound, share, withDeadline
+from aoc.lines import readLines
+from aoc.runner import Case
+
+
+@pytest.mark.parametrize(
+    "best, upper, text",
+    [(10, 10, "10 (optimal)"), (9, 12, "9 (at most 12, gap 25.0%)")],
+)
+def test_bound(best, upper, text):
+    assert str(Bound(best, upper)) == text
+
+
+def test_share():
+    assert share(None, 3) is None
+    deadline = time.monotonic() + 30
+    assert share(deadline, 3) == pytest.approx(deadline - 20, abs=1)
+
+
+def bounded(lines, deadline=None):
+    return 0
+
+
+def unbounded(lines):
+    return 0
+
+
+def test_withDeadline():
+    cases = withDeadline(
+        [
+            Case(1, bounded, "a.txt", None, {}),
+            Case(1, unbounded, "a.txt", None, {}),
+        ],
+        2.5,
+    )
+    assert [case.kwargs for case in cases] == [{"deadline": 2.5}, {}]
+
+
+@pytest.mark.parametrize(
+    "actors, minutes, solution", [(1, 30, 1651), (2, 26, 1707)]
+)
+def test_findBestPathDeadline(actors, minutes, solution):
+    from day16 import day16
+
+    rooms = day16.parseRooms(readLines("day16/day16-input-test.txt"))
+    distances = day16.findDistances(rooms)
+
+    def findBestPath(deadline):
+        return day16.findBestPath(
+            rooms["AA"],
+            distances,
+            minutes,
+            actors,
+            frozenset(),
+            verbose=False,
+            deadline=deadline,
+        )
+
+    best, _, upper = findBestPath(time.monotonic())
+    assert best <= solution <= upper
+    best, _, upper = findBestPath(None)
+    assert best == upper == solution
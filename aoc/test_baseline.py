@@ -0,0 +1,106 @@
+# type: ignore
+import pytest
+
+from aoc.baseline import Baseline, Tolerance, compare
+from aoc.bench import Benchmark
+
+
+def benchmark(day, median, peakRss):
+    return Benchmark(
+        day,
+        "part1",
+        "solve",
+        f"{day}-input.txt",
+        {},
+        [median],
+        peakRss,
+    )
+
+
+@pytest.mark.parametrize(
+    "median, peakRss, expected",
+    [
+        (1.2, 100, []),
+        (1.3, 100, ["time"]),
+        (1.2, 111, ["memory"]),
+        (1.5, 120, ["time", "memory"]),
+    ],
+)
+def test_compare(median, peakRss, expected):
+    baseline = Baseline(
+        [benchmark("day1", 1.0, 100)],
+        {"default": Tolerance(time=0.25, memory=0.1)},
+    )
+    (comparison,) = compare(
+        [benchmark("day1", median, peakRss)], baseline
+    )
+    assert comparison.regressions() == expected
+
+
+def test_compareNoiseAndTolerances():
+    baseline = Baseline(
+        [benchmark("day1", 0.001, 100), benchmark("day2", 1.0, 100)],
+        {"day2": Tolerance(time=1.0)},
+    )
+    comparisons = compare(
+        [
+            # Doubled, but by less than the noise floor
+            benchmark("day1", 0.002, 100),
+            benchmark("day2", 1.9, 100),
+            benchmark("day3", 1.0, 100),
+        ],
+        baseline,
+    )
+    assert [c.regressions() for c in comparisons] == [[], [], []]
+    assert comparisons[2].baseline is None
+
+
+def test_compareCalibrated():
+    baseline = Baseline(
+        [benchmark("day1", 1.0, 100)],
+        {"default": Tolerance(time=0.25)},
+        calibration=0.02,
+    )
+    # Twice as slow, on a machine running the calibration twice as
+    # slowly
+    (comparison,) = compare(
+        [benchmark("day1", 2.0, 100)], baseline, calibration=0.04
+    )
+    assert comparison.baseline.median == pytest.approx(2.0)
+    assert comparison.regressions() == []
+
+    (comparison,) = compare(
+        [benchmark("day1", 2.0, 100)], baseline, calibration=0.02
+    )
+    assert comparison.regressions() == ["time"]
+
+
+def test_compareElsewhere():
+    # Measured without a calibration, on some other host
+    baseline = Baseline(
+        [benchmark("day1", 1.0, 100)],
+        {},
+        python="2.7.18",
+        machine="pdp11",
+        host="elsewhere",
+    )
+    assert not baseline.measuredHere()
+    (comparison,) = compare(
+        [benchmark("day1", 2.0, 120)], baseline, calibration=0.02
+    )
+    assert comparison.regressions() == ["memory"]
+
+
+def test_updated():
+    baseline = Baseline(
+        [benchmark("day1", 1.0, 100), benchmark("day2", 1.0, 100)],
+        {},
+        calibration=0.02,
+    )
+    updated = baseline.updated(
+        [benchmark("day2", 3.0, 100)], calibration=0.03
+    )
+    assert updated.calibration == 0.02
+    assert [b.median for b in updated.benchmarks] == pytest.approx(
+        [1.0, 2.0]
+    )
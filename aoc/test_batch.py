@@ -0,0 +1,32 @@
+# type: ignore
+from .batch import findInputs, solveBatch
+
+STREAMS = {
+    "a.txt": ("mjqjpqmgbljsphdztnvjfqwrcgsmlb", 7, 19),
+    "b.txt": ("bvwbjplbgvbhsrlpgdmjqwftvncz", 5, 23),
+    "c.txt": ("nppdvjthqldpwncqszvftbrmjlhg", 6, 23),
+}
+
+
+def test_solveBatch(tmp_path):
+    for name, (stream, _, _) in STREAMS.items():
+        (tmp_path / name).write_text(f"{stream}\n")
+    (tmp_path / "notes").mkdir()
+
+    paths = findInputs(str(tmp_path))
+    assert [path.rsplit("/", 1)[1] for path in paths] == sorted(
+        STREAMS
+    )
+    assert findInputs(str(tmp_path / "[ab].txt")) == paths[:2]
+
+    answers = {
+        (path.rsplit("/", 1)[1], result.part): result.answer
+        for path, result in solveBatch(
+            "day6", paths, jobs=2, chunkSize=2
+        )
+    }
+    assert answers == {
+        (name, part): solutions[part]
+        for name, solutions in STREAMS.items()
+        for part in (1, 2)
+    }
@@ -0,0 +1,29 @@
+# type: ignore
+
+import pytest
+
+from .bench import percentile, sample
+
+
+@pytest.mark.parametrize(
+    "samples,fraction,expected",
+    [
+        ([3.0], 0.95, 3.0),
+        ([1.0, 2.0, 3.0], 0.0, 1.0),
+        ([3.0, 1.0, 2.0], 0.5, 2.0),
+        ([1.0, 2.0, 3.0], 1.0, 3.0),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 0.95, 4.8),
+    ],
+)
+def test_percentile(samples, fraction, expected):
+    assert percentile(samples, fraction) == pytest.approx(expected)
+
+
+def test_sample_budget():
+    calls = []
+    samples = sample(
+        lambda: calls.append(1), warmup=2, repeat=5, budget=0
+    )
+    # A zero budget still allows one warmup and one timed run
+    assert len(calls) == 2
+    assert len(samples) == 1
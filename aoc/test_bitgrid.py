@@ -0,0 +1,30 @@
+# type: ignore
+import numpy as np
+import pytest
+
+from .bitgrid import BitGrid
+
+
+def test_bitGrid():
+    mask = np.array(
+        [
+            [1, 0, 0],
+            [0, 0, 1],
+        ],
+        dtype=bool,
+    )
+    grid = BitGrid(2, 3)
+    bits = grid.fromMask(mask)
+    assert bits == grid.bit(0, 0) | grid.bit(1, 2)
+    assert np.array_equal(grid.toMask(bits), mask)
+    # Steps off the edge of a row don't wrap onto the next
+    assert grid.shift(bits, 0, 1) == grid.bit(0, 1)
+    assert grid.shift(bits, 0, -1) == grid.bit(1, 1)
+    assert grid.shift(bits, 1, 0) == grid.bit(1, 0)
+    assert np.array_equal(
+        grid.toMask(grid.spread(grid.bit(0, 0))),
+        np.array([[1, 1, 0], [1, 0, 0]], dtype=bool),
+    )
+    # Any further sideways would wrap onto the next row
+    with pytest.raises(AssertionError):
+        grid.shift(bits, 0, 2)
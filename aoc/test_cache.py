@@ -0,0 +1,49 @@
+# type: ignore
+import dataclasses
+import os
+
+from aoc.cache import IGNORED_MODULES, AnswerCache
+from aoc.lines import readLines, streamLines
+from aoc.reader import InputFile
+from aoc.runner import loadCases, solveCase
+
+
+def test_key():
+    answers = AnswerCache()
+    case = loadCases("day1")[0]
+    assert answers.key(case) == answers.key(case)
+    other = dataclasses.replace(case, kwargs=dict(top=3))
+    assert answers.key(case) != answers.key(other)
+    other = dataclasses.replace(case, input="generate.py")
+    assert answers.key(case) != answers.key(other)
+    assert answers.key(case) != answers.key(loadCases("day1")[1])
+    other = dataclasses.replace(case, reader=readLines)
+    assert answers.key(case) != answers.key(other)
+
+
+def test_readersHashed():
+    # Editing a reader changes what every solver using it is given
+    for reader in (readLines, streamLines, InputFile.open):
+        assert reader.__module__ not in IGNORED_MODULES
+
+
+def test_evict(tmp_path):
+    answers = AnswerCache(str(tmp_path), maxEntries=2)
+    for i, key in enumerate("abc"):
+        answers.put(key, i)
+        os.utime(answers.path(key), (i, i))
+    # Using "a" makes "b" the least recently used
+    assert answers.get("a") == 0
+    answers.evict()
+    assert answers.get("a") == 0
+    assert answers.get("b") is None
+    assert answers.get("c") == 2
+
+
+def test_solveCase(tmp_path):
+    answers = AnswerCache(str(tmp_path))
+    case = loadCases("day1")[0]
+    assert not solveCase(case, answers=answers).cached
+    result = solveCase(case, answers=answers)
+    assert result.cached
+    assert result.ok
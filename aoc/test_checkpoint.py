@@ -0,0 +1,58 @@
+# type: ignore
+import pytest
+
+from aoc import checkpoint
+from aoc.lines import readLines
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    yield tmp_path
+    checkpoint.configure(None)
+
+
+def test_checkpoint(checkpoints):
+    assert checkpoint.forSearch("search", 1) is None
+    checkpoint.configure(str(checkpoints), newResume=False)
+    saved = checkpoint.forSearch("search", 1)
+    saved.save({"best": 3})
+    assert saved.load() is None
+    checkpoint.configure(str(checkpoints), newResume=True)
+    assert checkpoint.forSearch("search", 1).load() == {"best": 3}
+    assert checkpoint.forSearch("search", 2).load() is None
+    saved.remove()
+    assert checkpoint.forSearch("search", 1).load() is None
+
+
+class Interrupted(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "minutes, actors, solution", [(30, 1, 1651), (26, 2, 1707)]
+)
+def test_resume(checkpoints, monkeypatch, minutes, actors, solution):
+    from day16 import day16
+
+    lines = readLines("day16/day16-input-test.txt")
+    checkpoint.configure(str(checkpoints), newInterval=0)
+    save = checkpoint.Checkpoint.save
+    saves = []
+
+    def saveThenStop(self, state):
+        save(self, state)
+        saves.append(state)
+        if len(saves) == 10:
+            raise Interrupted()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(checkpoint.Checkpoint, "save", saveThenStop)
+        with pytest.raises(Interrupted):
+            day16.solve(lines, minutes=minutes, actors=actors)
+    assert list(checkpoints.iterdir())
+
+    checkpoint.configure(str(checkpoints), newResume=True)
+    assert (
+        day16.solve(lines, minutes=minutes, actors=actors) == solution
+    )
+    assert not list(checkpoints.iterdir())
@@ -0,0 +1,23 @@
+# type: ignore
+import importlib.machinery
+
+from aoc import compiled
+from aoc.cache import fileHash
+
+
+def test_findExtension(tmp_path):
+    assert compiled.findExtension("day1", str(tmp_path)) is None
+    (tmp_path / "day1").mkdir()
+    suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+    extension = tmp_path / "day1" / f"day1{suffix}"
+    extension.write_bytes(b"")
+    hashPath = compiled.hashPath("day1", str(tmp_path))
+    with open(hashPath, "w") as f:
+        f.write(f"{fileHash(compiled.sourcePath('day1'))}\n")
+    assert compiled.findExtension("day1", str(tmp_path)) == str(
+        extension
+    )
+    # Compiled from some other version of the source
+    with open(hashPath, "w") as f:
+        f.write("0" * 64)
+    assert compiled.findExtension("day1", str(tmp_path)) is None
@@ -0,0 +1,59 @@
+# type: ignore
+import pytest
+
+from .coords import (
+    NEIGHBOURS2,
+    NEIGHBOURS3,
+    inRange,
+    offset2,
+    offset3,
+    pack2,
+    pack3,
+    unpack2,
+    unpack3,
+)
+
+
+@pytest.mark.parametrize(
+    "x, y", [(0, 0), (3, -7), (-1, -1), (2**20 - 1, -(2**20))]
+)
+def test_pack2(x, y):
+    assert unpack2(pack2(x, y)) == (x, y)
+    assert unpack2(pack2(x, y) + offset2(-2, 5)) == (x - 2, y + 5)
+
+
+@pytest.mark.parametrize(
+    "x, y, z", [(0, 0, 0), (-5, 0, 12), (1, -1, -1)]
+)
+def test_pack3(x, y, z):
+    assert unpack3(pack3(x, y, z)) == (x, y, z)
+    assert unpack3(pack3(x, y, z) + offset3(1, -1, 1)) == (
+        x + 1,
+        y - 1,
+        z + 1,
+    )
+
+
+def test_neighbours():
+    assert sorted(unpack2(pack2(0, 0) + n) for n in NEIGHBOURS2) == [
+        (-1, 0),
+        (0, -1),
+        (0, 1),
+        (1, 0),
+    ]
+    neighbours = {unpack3(pack3(4, -4, 0) + n) for n in NEIGHBOURS3}
+    assert len(neighbours) == 6
+    assert all(
+        sum(abs(a - b) for a, b in zip(n, (4, -4, 0))) == 1
+        for n in neighbours
+    )
+
+
+def test_outOfRange():
+    assert inRange(2**20 - 1, -(2**20))
+    assert not inRange(0, 2**20)
+    # Rather than carrying into the next coordinate
+    with pytest.raises(AssertionError):
+        pack2(2**20, 0)
+    with pytest.raises(AssertionError):
+        pack3(0, -(2**20) - 1, 0)
@@ -0,0 +1,43 @@
+# type: ignore
+import os
+
+import pytest
+
+from aoc.differential import (
+    SCALE,
+    findVariants,
+    firstMismatch,
+    inputs,
+)
+from aoc.runner import findDays, loadCases
+
+SEEDS = int(os.environ.get("AOC_DIFFERENTIAL_SEEDS", 1000))
+
+
+@pytest.mark.parametrize(
+    "reference, variant",
+    [
+        pytest.param(
+            reference,
+            variant,
+            id=(
+                f"{reference.day}-{reference.part}"
+                f"-{variant.solve.__name__}"
+            ),
+        )
+        for reference, variant in findVariants(findDays())
+    ],
+)
+def test_variant(reference, variant):
+    mismatch = firstMismatch(reference, variant, range(SEEDS))
+    assert mismatch is None, str(mismatch)
+
+
+@pytest.mark.parametrize("day", ["day4", "day5", "day18"])
+def test_edgeCases(day, tmp_path):
+    path = tmp_path / "input.txt"
+    for _, lines in inputs(day, [], SCALE):
+        path.write_text("".join(f"{line}\n" for line in lines))
+        for case in loadCases(day):
+            if not case.isTest:
+                case.solve(case.reader(str(path)), **case.kwargs)
@@ -0,0 +1,14 @@
+# type: ignore
+
+import pytest
+
+from .generate import generateLines
+from .runner import findDays
+
+
+@pytest.mark.parametrize("day", findDays())
+def test_generate_is_reproducible(day):
+    lines = list(generateLines(day, scale=0.1, seed=1))
+    assert lines
+    assert lines == list(generateLines(day, scale=0.1, seed=1))
+    assert lines != list(generateLines(day, scale=0.1, seed=2))
@@ -0,0 +1,38 @@
+# type: ignore
+import numpy as np
+import pytest
+
+from aoc.grid import Grid, boundingBox, shift
+
+
+@pytest.mark.parametrize("data", [b"ab\ncd\nef", b"ab\ncd\nef\n"])
+def test_fromBytes(data):
+    grid = Grid.fromBytes(data)
+    assert (grid.height, grid.width) == (3, 2)
+    assert grid.toLines() == ["ab", "cd", "ef"]
+    assert np.array_equal(
+        grid.cells, Grid.fromLines(["ab", "cd", "ef"]).cells
+    )
+
+
+def test_fromBytes_ragged():
+    with pytest.raises(AssertionError):
+        Grid.fromBytes(b"ab\ncde\nf")
+
+
+@pytest.mark.parametrize("dy, dx", [(0, 0), (1, 0), (-2, 1), (0, -3)])
+def test_shift(dy, dx):
+    array = np.arange(12).reshape(3, 4)
+    shifted = shift(array, dy, dx, -1)
+    for y in range(3):
+        for x in range(4):
+            if 0 <= y - dy < 3 and 0 <= x - dx < 4:
+                assert shifted[y, x] == array[y - dy, x - dx]
+            else:
+                assert shifted[y, x] == -1
+
+
+def test_boundingBox():
+    grid = Grid.fromLines(["....", "..#.", ".#..", "...."])
+    assert boundingBox(grid.cells == ord("#")) == (1, 2, 1, 2)
+    assert boundingBox(grid.cells == ord("x")) is None
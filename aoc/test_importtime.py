@@ -0,0 +1,19 @@
+# type: ignore
+from aoc.importtime import parseImportTime
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        150 |   encodings.aliases
+import time:       200 |        350 | encodings
+import time:        10 |         10 | day2
+import time:        50 |         50 |     re._parser
+import time:       100 |        150 |   re
+import time:      1000 |       1000 |   aoc
+import time:        20 |       1170 | day2.day2
+"""
+
+
+def test_parseImportTime():
+    measured = parseImportTime(STDERR, "day2.day2")
+    assert measured.microseconds == 1180
+    assert measured.heaviest == [("aoc", 1000), ("re", 150)]
@@ -0,0 +1,43 @@
+# type: ignore
+import pytest
+
+from aoc import intermediates
+
+
+@pytest.fixture
+def directory(tmp_path):
+    intermediates.configure(str(tmp_path))
+    yield tmp_path
+    intermediates.configure(None)
+
+
+def test_cached(directory):
+    computed = []
+
+    def compute(value):
+        computed.append(value)
+        return {"value": value}
+
+    assert intermediates.cached("a", 1, "x", lambda: compute(1)) == {
+        "value": 1
+    }
+    assert intermediates.cached("a", 1, "x", lambda: compute(2)) == {
+        "value": 1
+    }
+    # Another key, or another version of the computation
+    intermediates.cached("a", 1, "y", lambda: compute(3))
+    intermediates.cached("a", 2, "x", lambda: compute(4))
+    assert computed == [1, 3, 4]
+    assert len(list(directory.iterdir())) == 3
+
+
+def test_evict(directory, monkeypatch):
+    monkeypatch.setattr(intermediates, "maxEntries", 2)
+    for key in "abc":
+        intermediates.cached("a", 1, key, lambda: key)
+    assert len(list(directory.iterdir())) == 2
+
+
+def test_off():
+    assert intermediates.directory is None
+    assert intermediates.cached("a", 1, "x", lambda: 1) == 1
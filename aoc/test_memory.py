@@ -0,0 +1,59 @@
+# type: ignore
+import pytest
+
+from aoc.memory import MemoryTracker
+from aoc.runner import Case, solveCase
+
+
+def allocate(lines, size):
+    return len(bytearray(size))
+
+
+def test_phase():
+    tracker = MemoryTracker()
+    with tracker.phase("solve"):
+        allocate([], 2**20)
+    kept = []
+    with tracker.phase("read"):
+        kept.extend([] for _ in range(1000))
+    solvePhase, readPhase = tracker.usage().phases
+    assert solvePhase.phase == "solve"
+    assert solvePhase.peakTraced >= 2**20
+    # Nothing allocated while solving was kept
+    assert 0 <= solvePhase.objectsKept < 10
+    assert readPhase.objectsKept == pytest.approx(1000, abs=10)
+
+
+@pytest.mark.parametrize(
+    "budget, ok", [(None, True), (2**22, True), (2**19, False)]
+)
+def test_memoryBudget(budget, ok):
+    case = Case(
+        1,
+        allocate,
+        "generate.py",
+        2**20,
+        {"size": 2**20},
+        memoryBudget=budget,
+    )
+    result = solveCase(case, measureMemory=True)
+    assert [p.phase for p in result.memory.phases] == [
+        "read",
+        "solve",
+    ]
+    assert result.ok == ok
+
+
+def test_memoryBudgetUnmeasured():
+    case = Case(
+        1,
+        allocate,
+        "generate.py",
+        2**20,
+        {"size": 2**20},
+        memoryBudget=2**19,
+    )
+    # Budgets are only checked when asked to measure memory
+    result = solveCase(case)
+    assert result.memory is None
+    assert result.ok
@@ -0,0 +1,57 @@
+# type: ignore
+import pytest
+
+from aoc.metrics import Metric, Registry, dumping
+
+
+def test_text():
+    registry = Registry()
+    states = registry.counter("states_total", "States visited")
+    best = registry.gauge("best", 'Best "so far"')
+    sizes = registry.histogram("sizes", "Sizes", buckets=(1, 10))
+    registry.counter("unused_total", "Never published to")
+    states.inc(3)
+    with registry.labelled(part="1"):
+        states.inc()
+        best.set(2.5)
+        for size in (0, 5, 50):
+            sizes.observe(size)
+    assert (
+        registry.text()
+        == '# HELP best Best "so far"\n'
+        "# TYPE best gauge\n"
+        'best{part="1"} 2.5\n'
+        "# HELP sizes Sizes\n"
+        "# TYPE sizes histogram\n"
+        'sizes_bucket{part="1",le="1"} 1\n'
+        'sizes_bucket{part="1",le="10"} 2\n'
+        'sizes_bucket{part="1",le="+Inf"} 3\n'
+        'sizes_sum{part="1"} 55\n'
+        'sizes_count{part="1"} 3\n'
+        "# HELP states_total States visited\n"
+        "# TYPE states_total counter\n"
+        "states_total 3\n"
+        'states_total{part="1"} 1\n'
+    )
+
+
+def test_register():
+    registry = Registry()
+    states = registry.counter("states_total", "States visited")
+    assert (
+        registry.counter("states_total", "States visited") is states
+    )
+    with pytest.raises(ValueError):
+        registry.gauge("states_total", "States visited")
+    # Only the kinds of metric which can be sampled can be made
+    with pytest.raises(TypeError):
+        Metric(registry, "metric", "Not any kind")
+
+
+def test_dumping(tmp_path):
+    registry = Registry()
+    states = registry.counter("states_total", "States visited")
+    path = tmp_path / "metrics.prom"
+    with dumping(str(path), interval=60, registry=registry):
+        states.inc(7)
+    assert path.read_text().endswith("states_total 7\n")
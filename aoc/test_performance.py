@@ -0,0 +1,54 @@
+# type: ignore
+from aoc.baseline import Baseline
+from aoc.bench import Benchmark
+from aoc.performance import dayTotal, performanceJson, timeScaling
+
+
+def benchmark(day, phase, solver, median, input=None):
+    return Benchmark(
+        day, phase, solver, input or f"{day}-input.txt", {}, [median]
+    )
+
+
+def test_dayTotal():
+    assert dayTotal(
+        [
+            benchmark("day1", "parse", "readLines", 0.5),
+            benchmark("day1", "part1", "solve", 2.0),
+            benchmark("day1", "part1", "solveBulk", 1.0),
+            benchmark("day1", "part2", "solve", 3.0),
+        ]
+    ) == (0.5 + 1.0 + 3.0)
+
+
+def test_performanceJson():
+    data = performanceJson(
+        Baseline(
+            [
+                benchmark("day1", "part1", "solve", 1.0),
+                benchmark("day2", "part1", "solve", 2.0),
+                benchmark(
+                    "day2",
+                    "part1",
+                    "solve",
+                    9.0,
+                    "day2-input-test.txt",
+                ),
+            ],
+            {},
+        ),
+        [],
+    )
+    assert data["leaderboard"] == ["day2", "day1"]
+    assert len(data["days"]["day2"]["benchmarks"]) == 1
+
+
+def test_timeScaling():
+    points = timeScaling("day4", [0.5, 0.1], budget=60)
+    assert [point.scale for point in points[::4]] == [0.1, 0.5]
+    assert {(p.phase, p.solver) for p in points} == {
+        ("part1", "solve"),
+        ("part1", "solveBounds"),
+        ("part2", "solve"),
+        ("part2", "solveBounds"),
+    }
@@ -0,0 +1,80 @@
+# type: ignore
+import time
+
+import pytest
+
+from aoc.profiling import collapsedStacks, profileNames, sampleCall
+from aoc.runner import loadCases
+
+MAIN = ("main.py", 1, "main")
+A = ("a.py", 1, "a")
+B = ("b.py", 1, "b")
+
+# main calls a and b, and a calls b too, with b taking 4s from main
+# and 2s from a
+STATS = {
+    MAIN: (1, 1, 1.0, 10.0, {}),
+    A: (1, 1, 3.0, 5.0, {MAIN: (1, 1, 3.0, 5.0)}),
+    B: (
+        2,
+        2,
+        6.0,
+        6.0,
+        {MAIN: (1, 1, 4.0, 4.0), A: (1, 1, 2.0, 2.0)},
+    ),
+}
+
+
+def test_collapsedStacks():
+    stacks = collapsedStacks(STATS)
+    assert stacks == {
+        "main (main.py:1)": pytest.approx(1e6),
+        "main (main.py:1);a (a.py:1)": pytest.approx(3e6),
+        "main (main.py:1);a (a.py:1);b (b.py:1)": pytest.approx(2e6),
+        "main (main.py:1);b (b.py:1)": pytest.approx(4e6),
+    }
+
+
+def test_profileNames():
+    names = profileNames(loadCases("day6"))
+    assert len(set(names)) == len(names)
+    assert names[0] == "day6-part1-day6-input-test-1"
+    assert names[5] == "day6-part1-day6-input"
+
+
+def spin(seconds):
+    endTime = time.process_time() + seconds
+    while time.process_time() < endTime:
+        pass
+
+
+def outer():
+    spin(0.1)
+    inner()
+
+
+def inner():
+    spin(0.3)
+
+
+def test_sampleCall(tmp_path):
+    prefix = str(tmp_path / "outer")
+    sampleCall(outer, prefix, interval=0.001)
+
+    with open(f"{prefix}.collapsed.txt", encoding="utf-8") as f:
+        stacks = [
+            [label.split()[0] for label in line.split(";")]
+            for line in f
+        ]
+    # Only the sampled function and what it calls are recorded
+    assert stacks
+    assert all(stack[0] == "outer" for stack in stacks)
+    assert ["outer", "inner", "spin"] in stacks
+
+    with open(f"{prefix}.top.txt", encoding="utf-8") as f:
+        rows = f.read().splitlines()
+    assert rows[1].split() == ["Self", "Total", "Function"]
+    shares = {row.split()[2]: row.split()[:2] for row in rows[2:]}
+    # Every sample is under outer, and almost all are in spin
+    assert shares["outer"][1] == "100.0%"
+    assert float(shares["spin"][0].rstrip("%")) > 90
@@ -0,0 +1,35 @@
+# type: ignore
+import re
+
+import pytest
+
+from aoc.reader import InputFile
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"1\n22\n\n-333\n",
+        b"Sensor at x=2, y=-18: closest beacon is at x=-2, y=15",
+        b"-0 12-3 9223372036854775 x7",
+    ],
+)
+def test_ints(data):
+    expected = [int(m) for m in re.findall(rb"-?\d+", data)]
+    assert InputFile(data).ints().tolist() == expected
+    assert InputFile(data).intArray().tolist() == expected
+
+
+def test_intsByLine():
+    values, lineNumbers = InputFile(b"1\n2\n\n3 4\n").intsByLine()
+    assert values.tolist() == [1, 2, 3, 4]
+    assert lineNumbers.tolist() == [0, 1, 3, 3]
+
+
+@pytest.mark.parametrize("lines", [[], ["a"], ["a", "", "bc"]])
+def test_lines(lines):
+    inputFile = InputFile.fromLines(lines)
+    assert [
+        bytes(line).decode() for line in inputFile.lines()
+    ] == lines
@@ -0,0 +1,32 @@
+# type: ignore
+import io
+
+from day1 import day1
+
+from .lines import STDIN, iterChars, iterLines
+from .runner import streamedCases
+
+
+def test_iterLines():
+    lines = io.StringIO("1000\n\r\n2000\n3000")
+    assert list(iterLines(lines)) == ["1000", "", "2000", "3000"]
+
+
+def test_iterChars():
+    chars = io.StringIO("mjqj\npqm")
+    assert "".join(iterChars(chars, chunkSize=3)) == "mjqj\npqm"
+
+
+def test_streamedCases():
+    cases = streamedCases(day1.CASES, "day1-input.txt")
+    assert [case.solve for case in cases] == [
+        day1.solvePart1,
+        day1.solvePart2b,
+        day1.solvePart2,
+    ]
+    assert all(case.solution is None for case in cases)
+
+    # Standard input can only be read once per run
+    cases = streamedCases(day1.CASES, STDIN, parts=[2])
+    assert [case.solve for case in cases] == [day1.solvePart2b]
+    assert cases[0].path == STDIN
@@ -0,0 +1,24 @@
+# type: ignore
+from .search import bfs
+
+# A small graph with a long way round and a shortcut
+EDGES = {
+    "a": ["b", "d"],
+    "b": ["c"],
+    "c": ["d"],
+    "d": [],
+    "e": ["a"],
+}
+
+
+def test_bfs():
+    distances = bfs(["a"], EDGES.__getitem__)
+    assert distances == {"a": 0, "b": 1, "d": 1, "c": 2}
+
+
+def test_bfsSeveralStarts():
+    line = bfs(
+        [0, 10], lambda n: [m for m in (n - 1, n + 1) if 0 <= m <= 10]
+    )
+    assert line[5] == 5
+    assert line[8] == 2
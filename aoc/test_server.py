@@ -0,0 +1,50 @@
+# type: ignore
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .server import Server, request
+
+
+@pytest.fixture
+def socketPath(tmp_path):
+    path = str(tmp_path / "aoc.sock")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with Server(path, executor) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            yield path
+            server.shutdown()
+            thread.join()
+
+
+@pytest.mark.parametrize(
+    "message, answer",
+    [
+        (
+            dict(
+                day=6, part=1, input="mjqjpqmgbljsphdztnvjfqwrcgsmlb"
+            ),
+            7,
+        ),
+        (
+            dict(
+                day="day6",
+                part=2,
+                input="bvwbjplbgvbhsrlpgdmjqwftvncz",
+            ),
+            23,
+        ),
+        (dict(day=25, part=1, input="1=\n12\n"), "20"),
+    ],
+)
+def test_request(socketPath, message, answer):
+    response = request(message, socketPath)
+    assert response["error"] is None
+    assert response["answer"] == answer
+
+
+def test_badRequest(socketPath):
+    response = request(dict(day=6, part=3, input=""), socketPath)
+    assert "no part 3" in response["error"]
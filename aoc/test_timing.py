@@ -0,0 +1,48 @@
+# type: ignore
+from aoc import timing
+from aoc.runner import Case, solveCase
+
+
+@timing.timed("count")
+def countDown(n):
+    return 0 if n == 0 else 1 + countDown(n - 1)
+
+
+def phased(lines, n):
+    with timing.phase("parse"):
+        pass
+    for _ in range(3):
+        with timing.phase("search"):
+            countDown(n)
+    return n
+
+
+def test_notRecording():
+    assert phased([], 10) == 10
+    assert timing.phase("parse") is timing.NOT_RECORDING
+    assert timing.seconds == {}
+
+
+def test_recording():
+    with timing.recording() as times:
+        phased([], 10)
+    assert [t.phase for t in times] == [
+        "parse",
+        # Only the outermost recursive call is counted
+        "search/count",
+        "search",
+    ]
+    assert times[2].seconds >= times[1].seconds
+    assert not timing.enabled
+
+
+def test_solveCase():
+    case = Case(1, phased, "generate.py", 5, {"n": 5})
+    assert solveCase(case).phases is None
+    result = solveCase(case, timePhases=True)
+    assert result.ok
+    assert [t.phase for t in result.phases] == [
+        "parse",
+        "search/count",
+        "search",
+    ]
@@ -0,0 +1,31 @@
+# type: ignore
+import pytest
+
+from aoc import trace
+from aoc.runner import parseArgs
+
+
+def test_levelSet():
+    assert not trace.summary
+    with trace.levelSet(trace.STEP):
+        assert trace.summary and trace.step and not trace.detail
+        with trace.levelSet(trace.QUIET):
+            assert not trace.summary
+        assert trace.step
+    assert trace.level == trace.QUIET
+    assert not trace.step
+
+
+@pytest.mark.parametrize(
+    "argv, level",
+    [
+        ([], trace.SUMMARY),
+        (["-q"], trace.QUIET),
+        (["-v"], trace.SUMMARY),
+        (["-vv"], trace.STEP),
+        (["-vvv"], trace.DETAIL),
+        (["-vvvv"], trace.DETAIL),
+    ],
+)
+def test_parseArgs(argv, level):
+    assert parseArgs(argv).level == level
@@ -0,0 +1,145 @@
+"""How long each phase of a solve takes
+
+Solvers mark out their phases, such as parsing the input, building a
+graph from it and searching that, with `phase`, or by decorating a
+function which is a phase of its own with `timed`:
+
+    with timing.phase("parse"):
+        rooms = parseRooms(lines)
+
+    @timing.timed("search")
+    def findBestPath(...):
+
+The runner records the phases of each solve when asked to, with
+`recording`, and prints a breakdown of them alongside the results. A
+phase inside another is named after both, such as "bfs/sim", and one
+run more than once adds up, so a phase inside a loop gives the total
+for the loop. A recursive function only counts its outermost call.
+
+Otherwise nothing is recorded, and `phase` hands back the same
+do-nothing context manager while `timed` calls straight through once
+it's checked the flag. That costs well under a microsecond, which is
+nothing for phases run a few times per solve, but isn't meant for
+inner loops.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from aoc.runner import Result
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+enabled = False
+# Seconds spent in each phase while recording, in the order they
+# were first entered
+seconds: dict[str, float] = {}
+# Names of the phases running, outermost first
+running: list[str] = []
+
+
+@dataclass(frozen=True)
+class PhaseTime:
+    phase: str
+    seconds: float
+
+
+class Phase:
+    """Add the time spent inside to the total for `name`"""
+
+    __slots__ = ("name", "startTime", "counted")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.startTime = 0.0
+        self.counted = False
+
+    def __enter__(self) -> None:
+        # Recursive calls are already inside their own phase
+        self.counted = self.name not in running
+        if self.counted:
+            running.append(self.name)
+        self.startTime = time.perf_counter()
+
+    def __exit__(self, *excInfo: Any) -> None:
+        elapsed = time.perf_counter() - self.startTime
+        if self.counted:
+            name = "/".join(running)
+            running.pop()
+            seconds[name] = seconds.get(name, 0.0) + elapsed
+
+
+NOT_RECORDING: ContextManager[None] = contextlib.nullcontext()
+
+
+def phase(name: str) -> ContextManager[None]:
+    if not enabled:
+        return NOT_RECORDING
+    return Phase(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function whose every call is the phase `name`"""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return func(*args, **kwargs)
+            with Phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[list[PhaseTime]]:
+    """Record the phases run for the duration, into the list given,
+    which is filled in once it ends"""
+    global enabled, seconds, running
+    times: list[PhaseTime] = []
+    enabled, seconds, running = True, {}, []
+    try:
+        yield times
+    finally:
+        times.extend(PhaseTime(*item) for item in seconds.items())
+        enabled, seconds, running = False, {}, []
+
+
+def formatPhases(results: Iterable[Result]) -> str:
+    """Tabulate the time each of `results` which recorded its phases
+    spent in each, and its share of the whole solve"""
+    out = [
+        f"{'Day':<6} {'Part':<4} {'Input':<27} {'Phase':<24}"
+        f" {'Time':>9} {'Share':>6}"
+    ]
+    for result in results:
+        if result.phases is None:
+            continue
+        total: Optional[float] = result.seconds or None
+        for p in result.phases:
+            share = (
+                "" if total is None else f"{p.seconds / total:.1%}"
+            )
+            out.append(
+                f"{result.day:<6} {result.part:<4} {result.input:<27}"
+                f" {p.phase:<24} {p.seconds:>8.4f}s {share:>6}"
+            )
+    return "\n".join(out)
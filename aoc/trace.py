@@ -0,0 +1,104 @@
+"""Verbosity levels for the solvers' own output
+
+Solvers check one of the flags below before printing anything, so
+that output which is turned off costs no more than looking up the
+flag, with no call made and no message formatted:
+
+    if trace.detail:
+        print(f"Checking {pos}")
+
+Loops hot enough for even that to matter can copy the flag into a
+local variable first.
+
+Output with rich's console markup, such as "[green]o[/green]", goes
+through `richPrint` instead. That leaves importing rich until the
+first time it's called, and only does so for output to a terminal,
+printing plainly without the markup otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import re
+import sys
+from typing import Any, Callable, Iterator, Optional
+
+# Nothing beyond the answers
+QUIET = 0
+# A few lines per solve, such as intermediate totals
+SUMMARY = 1
+# A line per step of the puzzle, such as per line of input or round
+STEP = 2
+# Everything, including the innermost loops
+DETAIL = 3
+
+level = QUIET
+summary = False
+step = False
+detail = False
+
+
+def setLevel(newLevel: int) -> None:
+    global level, summary, step, detail
+    level = newLevel
+    summary = level >= SUMMARY
+    step = level >= STEP
+    detail = level >= DETAIL
+
+
+@contextlib.contextmanager
+def levelSet(newLevel: int) -> Iterator[None]:
+    """Set the level for the duration, then restore the previous
+    one"""
+    previousLevel = level
+    setLevel(newLevel)
+    try:
+        yield
+    finally:
+        setLevel(previousLevel)
+
+
+# Tags such as [green] and [/green], but not escaped ones such as \[
+MARKUP = re.compile(r"(?<!\\)\[/?[a-z #]*\]")
+
+# rich's print, or plainPrint, once the first call has chosen
+richPrinter: Optional[Callable[..., None]] = None
+
+
+def plainPrint(
+    *objects: Any, sep: str = " ", end: str = "\n"
+) -> None:
+    """Print `objects` with any rich markup removed"""
+    print(
+        *(
+            MARKUP.sub("", str(o)).replace("\\[", "[")
+            for o in objects
+        ),
+        sep=sep,
+        end=end,
+    )
+
+
+def loadPrinter() -> Callable[..., None]:
+    """Return rich's print for output to a terminal, if it's
+    installed, or otherwise plainPrint"""
+    if sys.stdout.isatty():
+        try:
+            printer: Callable[..., None] = importlib.import_module(
+                "rich"
+            ).print
+            return printer
+        except ImportError:
+            pass
+    return plainPrint
+
+
+def richPrint(*objects: Any, sep: str = " ", end: str = "\n") -> None:
+    """Print `objects` using rich, which takes longer to import than
+    many of the solvers take to run, so it's imported by the first
+    call rather than up front"""
+    global richPrinter
+    if richPrinter is None:
+        richPrinter = loadPrinter()
+    richPrinter(*objects, sep=sep, end=end)
@@ -0,0 +1,222 @@
+import heapq
+from typing import Iterable, Iterator
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
+from aoc.reader import InputFile
+
+
+def terminated(lines: Iterable[str]) -> Iterator[str]:
+    """Yield `lines`, followed by an empty line if they don't already
+    end with one"""
+    line = ""
+    for line in lines:
+        yield line
+    if line:
+        yield ""
+
+
+@timing.timed("count")
+def solvePart1(lines: Iterable[str]) -> int:
+    # Initialize variables used for summation
+    maxElf = 0
+    thisElf = 0
+
+    # @@@SNIPSTART day1-part1-input-termination
+    # Lets make sure we terminate the sequence with
+    # an empty line so we close out that elf's calories
+    lines = terminated(lines)
+    # @@@SNIPEND
+
+    # @@@SNIPSTART day1-part1-main
+    for line in lines:
+        if not line:
+            maxElf = max(maxElf, thisElf)
+            if trace.step:
+                print(
+                    f"This elf was seen carrying {thisElf:6} calories"
+                )
+                print(
+                    "The elf seen carrying the most calories so far"
+                    f" was carrying {maxElf:6} calories"
+                )
+                print()
+            thisElf = 0
+            continue
+        c = int(line)
+        thisElf += c
+        if trace.detail:
+            print(
+                "This elf is carrying an item of food of"
+                f" {c:5} calories, for a total of"
+                f" {thisElf:6} calories so far"
+            )
+    # @@@SNIPEND
+
+    if trace.summary:
+        print("Done iterating")
+        print(
+            "The elf seen carrying the most calories was carrying"
+            f" {maxElf:6} calories"
+        )
+    return maxElf
+
+
+@timing.timed("count")
+def solvePart2(lines: Iterable[str]) -> int:
+    # Initialize variables used for summation
+    # @@@SNIPSTART day1-part2-init
+    allElves = []
+    # @@@SNIPEND
+    thisElf = 0
+
+    # Lets make sure we terminate the sequence with
+    # an empty line so we close out that elf's calories
+    lines = terminated(lines)
+
+    # @@@SNIPSTART day1-part2-main
+    for line in lines:
+        if not line:
+            if trace.step:
+                print(
+                    f"This elf was seen carrying {thisElf:6} calories"
+                )
+            allElves += [thisElf]
+            thisElf = 0
+            continue
+        c = int(line)
+        thisElf += c
+    # @@@SNIPEND
+
+    if trace.summary:
+        print("Done iterating")
+        print(f"We have collected data on {len(allElves)} elves")
+    # @@@SNIPSTART day1-part2-print-solution
+    topThree = sum(sorted(allElves, reverse=True)[0:3])
+    if trace.summary:
+        print(
+            "The top three elves are carrying a sum of"
+            f" {topThree:6} calories"
+        )
+    # @@@SNIPEND
+    return topThree
+
+
+@timing.timed("count")
+def solvePart2b(lines: Iterable[str]) -> int:
+    # @@@SNIPSTART day1-part2b-init
+    # Initialize variables used for summation
+    numberOfElvesToTrack = 3
+    # We'll start with a value of `-1` since
+    # that should be smaller than any value any elf can carry
+    allElves = [-1] * numberOfElvesToTrack
+    # @@@SNIPEND
+    thisElf = 0
+
+    # Lets make sure we terminate the sequence with
+    # an empty line so we close out that elf's calories
+    lines = terminated(lines)
+
+    # @@@SNIPSTART day1-part2b-main
+    for line in lines:
+        if not line:
+            if trace.step:
+                print(
+                    f"This elf was seen carrying {thisElf:6} calories"
+                )
+            # We assume that `-1` is smaller than any
+            # possible calorie amount
+            assert thisElf > 0
+            # `heappushpop` will add `thisElf` to `allElves` and pop the smallest value
+            heapq.heappushpop(allElves, thisElf)
+            thisElf = 0
+            continue
+        c = int(line)
+        thisElf += c
+    # @@@SNIPEND
+
+    if trace.summary:
+        print("Done iterating")
+        print(f"We have collected data on {len(allElves)} elves")
+    # Lets make sure we popped off all of those calorie counts
+    assert len(allElves) >= numberOfElvesToTrack
+    topThree = sum(allElves)
+    if trace.summary:
+        print(
+            "The top three elves are carrying a sum of"
+            f" {topThree:6} calories"
+        )
+    return topThree
+
+
+def solveBulk(inputFile: InputFile, top: int) -> int:
+    """Solve either part straight from the input file, parsing and
+    summing every elf's calories at once"""
+    import numpy as np
+
+    with timing.phase("parse"):
+        calories, lineNumbers = inputFile.intsByLine()
+    with timing.phase("count"):
+        # Each elf's list of calories ends with a blank line, so a new
+        # elf starts wherever a number isn't on the line after the
+        # last one
+        firstItems = np.flatnonzero(
+            np.diff(lineNumbers, prepend=-2) > 1
+        )
+        allElves = np.add.reduceat(calories, firstItems)
+    if trace.summary:
+        print(f"We have collected data on {len(allElves)} elves")
+    with timing.phase("rank"):
+        topElves = int(np.sort(allElves)[-top:].sum())
+    if trace.summary:
+        print(
+            f"The top {top} elves are carrying a sum of"
+            f" {topElves:6} calories"
+        )
+    return topElves
+
+
+# Check against the solutions we previously submitted
+CASES = (
+    Case(
+        1,
+        solvePart1,
+        "day1-input.txt",
+        solution=71506,
+        reader=streamLines,
+    ),
+    Case(
+        1,
+        solveBulk,
+        "day1-input.txt",
+        solution=71506,
+        kwargs=dict(top=1),
+        reader=InputFile.open,
+    ),
+    # Only keeps the top three elves, so is streamed first
+    Case(
+        2,
+        solvePart2b,
+        "day1-input.txt",
+        solution=209603,
+        reader=streamLines,
+    ),
+    Case(
+        2,
+        solvePart2,
+        "day1-input.txt",
+        solution=209603,
+        reader=streamLines,
+    ),
+    Case(
+        2,
+        solveBulk,
+        "day1-input.txt",
+        solution=209603,
+        kwargs=dict(top=3),
+        reader=InputFile.open,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Elves carrying a handful of items each, separated by
+    blank lines"""
+    for elf in range(scaled(250, scale)):
+        if elf:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
@@ -1,17 +1,20 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-import os
-from typing import Optional
+from typing import Iterable
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
 
 
 class Program:
-    def __init__(self) -> None:
+    def __init__(self, drawPixels: bool = True) -> None:
         self.x = 1
         self.signalStrength = 0
         self.signalStrengthCycle = 40
         self.signalStrengthCycleOffset = 20
+        # Part 1 has no use for the picture, which otherwise grows
+        # with every cycle
+        self.drawPixels = drawPixels
         self.pixels: list[str] = list()
         self.cycle = 1
 
@@ -22,11 +25,12 @@ class Program:
         ):
             thisSignalStrength = self.x * self.cycle
             self.signalStrength += thisSignalStrength
-            self.trace(
-                f"recordSignalStrength of {thisSignalStrength}"
-            )
+            if trace.step:
+                self.print(
+                    f"recordSignalStrength of {thisSignalStrength}"
+                )
 
-    def trace(self, str: str) -> None:
+    def print(self, str: str) -> None:
         print(f"[{self.cycle:3}] [x={self.x:3}] {str}")
 
     def recordPixel(self) -> None:
@@ -39,41 +43,44 @@ class Program:
         self.pixels.append(c)
         if self.cycle % 40 == 0:
             self.pixels.append("\n")
-        self.trace(
-            f"Pixels with new='{c}'; horiz={horiz}; x={self.x}"
-        )
-        print("".join(self.pixels))
-        self.trace("/Pixels")
+        if trace.detail:
+            self.print(
+                f"Pixels with new='{c}'; horiz={horiz}; x={self.x}"
+            )
+            print("".join(self.pixels))
+            self.print("/Pixels")
 
     def advanceCycle(self, cycleCost: int) -> None:
         assert (
             self.signalStrengthCycle > self.signalStrengthCycleOffset
         )
         for _ in range(cycleCost):
-            self.recordPixel()
+            if self.drawPixels:
+                self.recordPixel()
             self.recordSignalStrength()
             self.cycle += 1
 
     def addx(self, value: int) -> None:
-        self.trace(f"Begin addx {value}")
+        if trace.step:
+            self.print(f"Begin addx {value}")
         self.advanceCycle(1)
         self.advanceCycle(1)
         self.x += value
-        self.trace(f"Execute addx {value}")
+        if trace.step:
+            self.print(f"Execute addx {value}")
 
     def noop(self) -> None:
-        self.trace("Begin noop")
+        if trace.step:
+            self.print("Begin noop")
         cycleCost = 1
         self.advanceCycle(cycleCost)
-        self.trace("Execute noop")
+        if trace.step:
+            self.print("Execute noop")
 
 
-def solve(
-    lines: list[str],
-    expectedPattern: Optional[str],
-    sumOfSignalStrengths: int,
-) -> None:
-    program = Program()
+@timing.timed("run")
+def solve(lines: Iterable[str], part1: bool) -> int | str:
+    program = Program(drawPixels=not part1)
 
     # Read in data
     for lineFull in lines:
@@ -93,82 +100,68 @@ def solve(
             case _:
                 assert False
 
-    print(f"Calculated: {program.signalStrength}")
-    print(f"=> Expecting {sumOfSignalStrengths}")
-    assert program.signalStrength == sumOfSignalStrengths
-
-    if expectedPattern:
-        calculated = "".join(program.pixels)
-
-        print("Checking pattern...")
-        for i, (p1, p2) in enumerate(
-            zip(calculated, expectedPattern)
-        ):
-            assert (
-                p1 == p2
-            ), f"Index {i} does not match: '{p1}' != '{p2}'"
-        print("=> Matches expected pattern:")
-        print(expectedPattern)
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open(
-    "day10-input-trivial.txt", "r", encoding="utf-8"
-) as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    expectedPattern=None,
-    sumOfSignalStrengths=0,
+    if part1:
+        return program.signalStrength
+    else:
+        # Drop the newline closing out the final row of pixels
+        return "".join(program.pixels).rstrip("\n")
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day10-input-trivial.txt",
+        solution=0,
+        kwargs=dict(part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day10-input-test.txt",
+        solution=13140,
+        kwargs=dict(part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day10-input.txt",
+        solution=17940,
+        kwargs=dict(part1=True),
+        reader=streamLines,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day10-input-test.txt",
+        solution=(
+            "##..##..##..##..##..##..##..##..##..##..\n"
+            "###...###...###...###...###...###...###.\n"
+            "####....####....####....####....####....\n"
+            "#####.....#####.....#####.....#####.....\n"
+            "######......######......######......####\n"
+            "#######.......#######.......#######....."
+        ),
+        kwargs=dict(part1=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day10-input.txt",
+        solution=(
+            "####..##..###...##....##.####...##.####.\n"
+            "...#.#..#.#..#.#..#....#.#.......#....#.\n"
+            "..#..#....###..#..#....#.###.....#...#..\n"
+            ".#...#....#..#.####....#.#.......#..#...\n"
+            "#....#..#.#..#.#..#.#..#.#....#..#.#....\n"
+            "####..##..###..#..#..##..#.....##..####."
+        ),
+        kwargs=dict(part1=False),
+        reader=streamLines,
+    ),
 )
 
-with open("day10-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    expectedPattern=None,
-    sumOfSignalStrengths=13140,
-)
-
-with open("day10-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    expectedPattern=None,
-    sumOfSignalStrengths=17940,
-)
-
-# Part 2
-expectedPattern = (
-    "##..##..##..##..##..##..##..##..##..##..\n"
-    "###...###...###...###...###...###...###.\n"
-    "####....####....####....####....####....\n"
-    "#####.....#####.....#####.....#####.....\n"
-    "######......######......######......####\n"
-    "#######.......#######.......#######....."
-)
-with open("day10-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    expectedPattern=expectedPattern,
-    sumOfSignalStrengths=13140,
-)
-
-expectedPattern = (
-    "####..##..###...##....##.####...##.####.\n"
-    "...#.#..#.#..#.#..#....#.#.......#....#.\n"
-    "..#..#....###..#..#....#.###.....#...#..\n"
-    ".#...#....#..#.####....#.#.......#..#...\n"
-    "#....#..#.#..#.#..#.#..#.#....#..#.#....\n"
-    "####..##..###..#..#..##..#.....##..####."
-)
-with open("day10-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    expectedPattern=expectedPattern,
-    sumOfSignalStrengths=17940,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A program of `addx` and `noop` instructions, which keeps the
+    sprite somewhere near the screen"""
+    x = 1
+    for _ in range(scaled(140, scale)):
+        if rng.random() < 0.3:
+            yield "noop"
+            continue
+        value = rng.randint(-20, 20)
+        if not -5 <= x + value <= 45:
+            value = -value
+        x += value
+        yield f"addx {value}"
@@ -1,17 +1,10 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 from collections import deque
 
-import os
 import re
 from typing import Any, Optional, Tuple, Union
-import logging
-
 
-# There's a lot of output for this puzzle solution,
-# so make the output configurable via a logger
-logging.basicConfig(format="%(message)s", level=logging.WARNING)
+from aoc import Case, runCases, timing, trace
 
 
 class Monkey:
@@ -40,9 +33,11 @@ class Monkey:
 
     def inspect(self, item: int, worryReducer: Optional[int]) -> int:
         self.inspections += 1
-        logging.info(
-            f"  Monkey inspects an item with a worry level of {item}."
-        )
+        if trace.detail:
+            print(
+                "  Monkey inspects an item with a worry level of"
+                f" {item}."
+            )
         match self.op:
             case "*":
                 # Type narrowing to satisfy mypy
@@ -51,10 +46,11 @@ class Monkey:
                     item *= item
                 else:
                     item *= self.opParam
-                logging.debug(
-                    "    Worry level is multiplied by"
-                    f" {self.opParam} to {item}."
-                )
+                if trace.detail:
+                    print(
+                        "    Worry level is multiplied by"
+                        f" {self.opParam} to {item}."
+                    )
             case "+":
                 # Type narrowing to satisfy mypy
                 if isinstance(self.opParam, str):
@@ -62,10 +58,11 @@ class Monkey:
                     item += item
                 else:
                     item += self.opParam
-                logging.debug(
-                    f"    Worry level increases by {self.opParam} to"
-                    f" {item}."
-                )
+                if trace.detail:
+                    print(
+                        "    Worry level increases by"
+                        f" {self.opParam} to {item}."
+                    )
             case _:
                 assert False
         if worryReducer is not None:
@@ -74,22 +71,22 @@ class Monkey:
 
     def test(self, item: int) -> Tuple[bool, int]:
         if item % self.testOp == 0:
-            logging.debug(
-                "    Current worry level is divisible by"
-                f" {self.testOp}."
-            )
+            if trace.detail:
+                print(
+                    "    Current worry level is divisible by"
+                    f" {self.testOp}."
+                )
             return True, item
         else:
-            logging.debug(
-                "    Current worry level is not divisible by"
-                f" {self.testOp}."
-            )
+            if trace.detail:
+                print(
+                    "    Current worry level is not divisible by"
+                    f" {self.testOp}."
+                )
             return False, item
 
 
-def solve(
-    lines: list[str], rounds: int, part1: bool, solution: int
-) -> None:
+def parseMonkeys(lines: list[str]) -> list[Monkey]:
     patternsStr = (
         r"Monkey (\d+):",
         r"  Starting items: ([\d, ]+)",
@@ -112,7 +109,8 @@ def solve(
         lines.append("")
     # Read in data
     for i, line in enumerate(lines):
-        logging.warning(line)
+        if trace.step:
+            print(line)
         pattern: Optional[re.Pattern[str]] = patterns[
             i % len(patterns)
         ]
@@ -129,7 +127,8 @@ def solve(
                 pass
             else:
                 operation = operation[0], int(operation[1])
-            logging.warning(operation)
+            if trace.step:
+                print(operation)
             # Type narrowing to satisfy mypy
             assert isinstance(number, str)
             assert isinstance(items, str)
@@ -148,104 +147,121 @@ def solve(
             monkeys.append(monkey)
             matches.clear()
     assert len(matches) == 0
+    return monkeys
 
-    for monkey in monkeys:
-        logging.warning(monkey)
-
-    if part1:
-        worryReducer = None
-    else:
-        worryReducer = 1
-        for monkey in monkeys:
-            worryReducer *= monkey.testOp
 
+@timing.timed("simulate")
+def simulate(
+    monkeys: list[Monkey],
+    rounds: int,
+    part1: bool,
+    worryReducer: Optional[int],
+) -> None:
     for round in range(rounds):
-        logging.warning(f"=== Simulating round {round}...")
+        if trace.step:
+            print(f"=== Simulating round {round}...")
 
         for monkey in monkeys:
-            logging.info(f"Monkey {monkey.number}")
+            if trace.detail:
+                print(f"Monkey {monkey.number}")
             while monkey.items:
                 item = monkey.items.popleft()
                 item = monkey.inspect(item, worryReducer)
                 if part1:
                     item //= 3
-                    logging.info(
-                        "    Monkey gets bored with item. Worry"
-                        f" level is divided by 3 to {item}."
-                    )
+                    if trace.detail:
+                        print(
+                            "    Monkey gets bored with item. Worry"
+                            f" level is divided by 3 to {item}."
+                        )
                 interested, item = monkey.test(item)
                 if interested:
                     throwTarget = monkey.ifTrue
                 else:
                     throwTarget = monkey.ifFalse
-                logging.info(
-                    f"    Item with worry level {item} is thrown to"
-                    f" monkey {throwTarget}."
-                )
+                if trace.detail:
+                    print(
+                        f"    Item with worry level {item} is thrown"
+                        f" to monkey {throwTarget}."
+                    )
                 monkeys[throwTarget].items.append(item)
 
-        logging.info(
-            f"After round {round}, the monkeys are holding items with"
-            " these worry levels:"
-        )
+        if trace.step:
+            print(
+                f"After round {round}, the monkeys are holding items"
+                " with these worry levels:"
+            )
         for monkey in monkeys:
-            logging.info(f"Monkey {monkey.number}: {monkey.items}")
+            if trace.step:
+                print(f"Monkey {monkey.number}: {monkey.items}")
+
+
+def solve(lines: list[str], rounds: int, part1: bool) -> int:
+    with timing.phase("parse"):
+        monkeys = parseMonkeys(lines)
 
     for monkey in monkeys:
-        logging.warning(
-            f"Monkey {monkey.number}: inspected items"
-            f" {monkey.inspections} times"
-        )
+        if trace.step:
+            print(monkey)
 
-    inspections = [monkey.inspections for monkey in monkeys]
-    inspections = sorted(inspections, reverse=True)[0:2]
+    if part1:
+        worryReducer = None
+    else:
+        worryReducer = 1
+        for monkey in monkeys:
+            worryReducer *= monkey.testOp
 
-    monkeyBusiness = inspections[0] * inspections[1]
+    simulate(monkeys, rounds, part1, worryReducer)
 
-    logging.info(f"Monkey business: {monkeyBusiness}")
-    logging.info(f"=>    Expecting: {solution}")
-    assert monkeyBusiness == solution, (
-        f"Calculated monkey business was {monkeyBusiness} but"
-        f" expected {solution}"
-    )
+    for monkey in monkeys:
+        if trace.summary:
+            print(
+                f"Monkey {monkey.number}: inspected items"
+                f" {monkey.inspections} times"
+            )
 
+    inspections = [monkey.inspections for monkey in monkeys]
+    inspections = sorted(inspections, reverse=True)[0:2]
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
+    monkeyBusiness = inspections[0] * inspections[1]
 
-# Part 1
-with open("day11-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=20,
-    part1=True,
-    solution=10605,
-)
+    if trace.summary:
+        print(f"Monkey business: {monkeyBusiness}")
+    return monkeyBusiness
 
-with open("day11-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=20,
-    part1=True,
-    solution=90294,
-)
 
-# Part 2
-with open("day11-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=10000,
-    part1=False,
-    solution=2713310158,
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day11-input-test.txt",
+        solution=10605,
+        kwargs=dict(rounds=20, part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day11-input.txt",
+        solution=90294,
+        kwargs=dict(rounds=20, part1=True),
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day11-input-test.txt",
+        solution=2713310158,
+        kwargs=dict(rounds=10000, part1=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day11-input.txt",
+        solution=18170818354,
+        kwargs=dict(rounds=10000, part1=False),
+    ),
 )
 
-with open("day11-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=10000,
-    part1=False,
-    solution=18170818354,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def primes() -> Iterator[int]:
+    found: list[int] = []
+    candidate = 2
+    while True:
+        if all(candidate % prime for prime in found):
+            found.append(candidate)
+            yield candidate
+        candidate += 1
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Monkeys holding items, each testing divisibility by a
+    different prime and throwing to two other monkeys"""
+    count = scaled(8, scale, minimum=3)
+    divisors = [prime for prime, _ in zip(primes(), range(count))]
+    rng.shuffle(divisors)
+    # Only one monkey squares the worry level, as in the real input,
+    # since otherwise part 1's worry levels grow out of hand
+    squarer = rng.randrange(count)
+    for number, divisor in enumerate(divisors):
+        if number:
+            yield ""
+        items = [
+            str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))
+        ]
+        if number == squarer:
+            operation = "* old"
+        else:
+            operation = rng.choice(
+                (f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}")
+            )
+        ifTrue, ifFalse = rng.sample(
+            [other for other in range(count) if other != number], 2
+        )
+        yield f"Monkey {number}:"
+        yield f"  Starting items: {', '.join(items)}"
+        yield f"  Operation: new = old {operation}"
+        yield f"  Test: divisible by {divisor}"
+        yield f"    If true: throw to monkey {ifTrue}"
+        yield f"    If false: throw to monkey {ifFalse}"
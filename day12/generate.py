@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaledSide
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A heightmap of mostly low ground, with a winding trail from
+    `S` up to `E` so there's always a route to climb"""
+    width = scaledSide(66, scale, minimum=40)
+    height = scaledSide(41, scale, minimum=3)
+    # Cube the noise so that low ground is more common than peaks
+    grid = [
+        [
+            string.ascii_lowercase[int(26 * rng.random() ** 3)]
+            for _ in range(width)
+        ]
+        for _ in range(height)
+    ]
+
+    # Wander rightwards from the start, never doubling back, and
+    # finish somewhere in the right-hand third of the map
+    y = rng.randrange(height)
+    trail = [(y, 0)]
+    endX = rng.randint(width * 2 // 3, width - 1)
+    direction = 0
+    while trail[-1][1] < endX:
+        y, x = trail[-1]
+        if direction == 0:
+            direction = rng.choice((-1, 0, 0, 1))
+        elif rng.random() < 0.5:
+            direction = 0
+        if direction and 0 <= y + direction < height:
+            trail.append((y + direction, x))
+        else:
+            trail.append((y, x + 1))
+            direction = 0
+    for i, (y, x) in enumerate(trail):
+        grid[y][x] = string.ascii_lowercase[26 * i // len(trail)]
+    grid[trail[0][0]][0] = "S"
+    grid[trail[-1][0]][trail[-1][1]] = "E"
+
+    for row in grid:
+        yield "".join(row)
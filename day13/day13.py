@@ -1,24 +1,20 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 from functools import cmp_to_key
 from itertools import zip_longest
 
-import os
 from typing import Optional, Union
 import ast
 
+from aoc import Case, runCases, timing, trace
+
 
 def compare(
     left: Union[int, list[int]],
     right: Union[int, list[int]],
     depth: int,
-    quiet: bool = True,
 ) -> Optional[bool]:
-    indent = "  " * depth
-    indentPlusOne = "  " * (depth + 1)
-    if not quiet:
-        print(f"{indent}- Compare {left} vs {right}")
+    if trace.detail:
+        print(f"{'  ' * depth}- Compare {left} vs {right}")
     # If both values are integers...
     if isinstance(left, int) and isinstance(right, int):
         left = int(left)
@@ -26,16 +22,16 @@ def compare(
         if left == right:
             return None
         elif left < right:
-            if not quiet:
+            if trace.detail:
                 print(
-                    f"{indentPlusOne}- Left side is smaller, so"
+                    f"{'  ' * (depth + 1)}- Left side is smaller, so"
                     " inputs are in the right order"
                 )
             return True
         elif left > right:
-            if not quiet:
+            if trace.detail:
                 print(
-                    f"{indentPlusOne}- Right side is smaller, so"
+                    f"{'  ' * (depth + 1)}- Right side is smaller, so"
                     " inputs are not in the right order"
                 )
             return False
@@ -45,16 +41,16 @@ def compare(
     elif isinstance(left, list) and isinstance(right, list):
         for leftI, rightI in zip_longest(left, right):
             if leftI is None:
-                if not quiet:
+                if trace.detail:
                     print(
-                        f"{indentPlusOne}- Left side ran out of"
+                        f"{'  ' * (depth + 1)}- Left side ran out of"
                         " items, so inputs are in the right order"
                     )
                 return True
             elif rightI is None:
-                if not quiet:
+                if trace.detail:
                     print(
-                        f"{indentPlusOne}- Right side ran out of"
+                        f"{'  ' * (depth + 1)}- Right side ran out of"
                         " items, so inputs are not in the right"
                         " order"
                     )
@@ -65,20 +61,20 @@ def compare(
                     return r
         return None
     elif isinstance(left, list) and isinstance(right, int):
-        if not quiet:
+        if trace.detail:
             print(
-                f"{indentPlusOne}- Mixed types; convert right to []"
-                " and retry comparison"
+                f"{'  ' * (depth + 1)}- Mixed types; convert right to"
+                " [] and retry comparison"
             )
         r = compare(left, [right], depth)
         if r is not None:
             return r
         return None
     elif isinstance(left, int) and isinstance(right, list):
-        if not quiet:
+        if trace.detail:
             print(
-                f"{indentPlusOne}- Mixed types; convert left to []"
-                " and retry comparison"
+                f"{'  ' * (depth + 1)}- Mixed types; convert left to"
+                " [] and retry comparison"
             )
         r = compare([left], right, depth)
         if r is not None:
@@ -100,12 +96,14 @@ def compareFunction(
         return 1
 
 
-def solve(lines: list[str], solution: int) -> None:
+@timing.timed("compare")
+def solvePart1(lines: list[str]) -> int:
     linesI = iter(lines)
     pairCount = 0
     sum = 0
     while linesI:
-        print("============")
+        if trace.step:
+            print("============")
         pairCount += 1
         left = ast.literal_eval(next(linesI))
         right = ast.literal_eval(next(linesI))
@@ -118,55 +116,50 @@ def solve(lines: list[str], solution: int) -> None:
         except StopIteration:
             break
 
-    print(f"Sum is {sum}")
-    print(f"=> Expecting {solution}")
-    assert sum == solution
+    if trace.summary:
+        print(f"Sum is {sum}")
+    return sum
 
 
-def solvePart2(lines: list[str], solution: int) -> None:
-    linesNonNull = filter(None, (line.rstrip() for line in lines))
-    linesEvaled = [ast.literal_eval(line) for line in linesNonNull]
+def solvePart2(lines: list[str]) -> int:
+    with timing.phase("parse"):
+        linesNonNull = filter(None, (line.rstrip() for line in lines))
+        linesEvaled = [
+            ast.literal_eval(line) for line in linesNonNull
+        ]
     decoder1 = [[2]]
     decoder2 = [[6]]
     linesEvaled.append(decoder1)
     linesEvaled.append(decoder2)
 
-    linesOrdered = sorted(
-        linesEvaled, key=cmp_to_key(compareFunction)
-    )
+    with timing.phase("sort"):
+        linesOrdered = sorted(
+            linesEvaled, key=cmp_to_key(compareFunction)
+        )
 
     sum = None
     for i, line in enumerate(linesOrdered, start=1):
         if line is decoder1 or line is decoder2:
-            print(f"Found decoder at index {i}")
+            if trace.summary:
+                print(f"Found decoder at index {i}")
             if sum is None:
                 sum = i
             else:
                 sum = sum * i
                 break
 
-    print(f"Sum is {sum}")
-    if solution is not None:
-        print(f"=> Expecting {solution}")
-        assert sum == solution
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day13-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=13)
+    if trace.summary:
+        print(f"Sum is {sum}")
+    assert sum is not None
+    return sum
 
-with open("day13-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=5580)
 
-# Part 2
-with open("day13-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, solution=140)
+CASES = (
+    Case(1, solvePart1, "day13-input-test.txt", solution=13),
+    Case(1, solvePart1, "day13-input.txt", solution=5580),
+    Case(2, solvePart2, "day13-input-test.txt", solution=140),
+    Case(2, solvePart2, "day13-input.txt", solution=26200),
+)
 
-with open("day13-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, solution=26200)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator, Union
+
+from aoc.generate import scaled
+
+Packet = Union[int, list["Packet"]]
+
+
+def packet(rng: random.Random, depth: int = 0) -> Packet:
+    if depth and rng.random() < 0.4:
+        return rng.randint(0, 10)
+    if depth >= 4:
+        return [rng.randint(0, 10) for _ in range(rng.randint(0, 5))]
+    return [packet(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Pairs of packets of nested lists of integers"""
+    for pair in range(scaled(150, scale)):
+        if pair:
+            yield ""
+        for _ in range(2):
+            yield str(packet(rng)).replace(" ", "")
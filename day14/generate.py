@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled, scaledSide
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Paths of rock in the cave below the sand's source at 500,0
+
+    The cave is kept shallow and narrow enough that the solver's
+    floor, which spans 1000 either side of the leftmost rock, still
+    catches all of the sand in part 2.
+    """
+    depth = min(scaledSide(170, scale, minimum=20), 600)
+    halfWidth = depth // 2
+    for _ in range(scaled(150, scale)):
+        x = 500 + rng.randint(-halfWidth, halfWidth)
+        y = rng.randint(10, depth)
+        points = [f"{x},{y}"]
+        for _ in range(rng.randint(1, 6)):
+            if len(points) % 2:
+                x = max(
+                    500 - halfWidth,
+                    min(500 + halfWidth, x + rng.randint(-10, 10)),
+                )
+            else:
+                y = max(2, min(depth, y + rng.randint(-10, 10)))
+            points.append(f"{x},{y}")
+        yield " -> ".join(points)
@@ -1,16 +1,16 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 from collections import defaultdict
-import logging
 
-import os
-import re
-from typing import Optional, Tuple, cast
+from typing import Optional, Tuple
+
+from aoc import Case, intermediates, runCases, timing, trace
+from aoc.reader import InputFile
 
-# There's a lot of output for this puzzle solution,
-# so make the output configurable via a logger
-logging.basicConfig(format="%(message)s", level=logging.INFO)
+# The ranges covered on each row, and where the beacons and sensors are
+TableData = Tuple[
+    defaultdict[int, list[Tuple[int, int]]],
+    dict[Tuple[int, int], bool],
+]
 
 
 def distance(sensor: Tuple[int, int], beacon: Tuple[int, int]) -> int:
@@ -26,9 +26,10 @@ def setPosWithinDist(
         minX = sensor[0] - distX
         maxX = sensor[0] + distX
         grid.set(minX=minX, maxX=maxX, y=y)
-        logging.debug(
-            f"setPosWithinDist -> setting {minX}<->{maxX} @ {y}"
-        )
+        if trace.detail:
+            print(
+                f"setPosWithinDist -> setting {minX}<->{maxX} @ {y}"
+            )
 
 
 class SequenceTable:
@@ -58,10 +59,11 @@ class SequenceTable:
                 maxX = self.clampX[1]
 
         seq = self.storage[y]
-        logging.debug(
-            f"* Looking to insert ({minX}, {maxX}) into existing"
-            f" bounds of {seq} @ y={y}"
-        )
+        if trace.detail:
+            print(
+                f"* Looking to insert ({minX}, {maxX}) into existing"
+                f" bounds of {seq} @ y={y}"
+            )
         for prev in seq:
             (prevMinX, prevMaxX) = prev
             minXWithinPrevRange = (
@@ -88,10 +90,11 @@ class SequenceTable:
                     minX = prevMinX
                 if prevMaxX > maxX:
                     maxX = prevMaxX
-                logging.debug(
-                    f"** Extending previous bounds of {prev} to"
-                    f" ({minX}, {maxX}) @ y={y}"
-                )
+                if trace.detail:
+                    print(
+                        f"** Extending previous bounds of {prev} to"
+                        f" ({minX}, {maxX}) @ y={y}"
+                    )
                 if minX != prevMinX or maxX != prevMaxX:
                     seq.remove(prev)
                     self.set(minX, maxX, y)
@@ -100,14 +103,21 @@ class SequenceTable:
                 break
         else:
             # Completely new
-            logging.debug(
-                f"** Adding new bounds of {minX},{maxX} @ y={y}"
-            )
+            if trace.detail:
+                print(
+                    f"** Adding new bounds of {minX},{maxX} @ y={y}"
+                )
             seq.append((minX, maxX))
 
     def setBeaconOrSensor(self, pos: Tuple[int, int]) -> None:
         self.beaconOrSensor[pos] = True
 
+    def toData(self) -> TableData:
+        return self.storage, self.beaconOrSensor
+
+    def loadData(self, data: TableData) -> None:
+        self.storage, self.beaconOrSensor = data
+
     def countAtY(self, y: int) -> int:
         count = 0
         seq = self.storage[y]
@@ -129,103 +139,120 @@ class SequenceTable:
                 x2 = seq[1][0] - 1
                 assert x == x2
                 tuning = x * 4000000 + y
-                logging.info(f"Found empty spot at {x}, {y}")
-                logging.info(f"=> Tuning is {tuning}")
+                if trace.summary:
+                    print(f"Found empty spot at {x}, {y}")
+                    print(f"=> Tuning is {tuning}")
                 return tuning
         assert False
 
 
-def solve(
-    lines: list[str],
-    part1: bool,
+def fillTable(
+    rows: list[list[int]],
     clampX: Optional[Tuple[int, int]],
     clampY: Optional[Tuple[int, int]],
-    solution: int,
-) -> None:
-    # Read in data
+) -> TableData:
+    """Mark every position within range of each sensor"""
     grid = SequenceTable(clampX=clampX, clampY=clampY)
-    pattern = re.compile(
-        r"Sensor at x=([-\d]+), y=([-\d]+): "
-        r"closest beacon is at x=([-\d]+), y=([-\d]+)"
-    )
-    sensorTotal = len(lines)
-    for sensorI, line in enumerate(lines, start=1):
-        logging.info("#" * 20)
-        logging.info(line)
-        m = re.match(pattern, line)
-        assert m
-        logging.info(m.groups())
-        assert len(m.groups()) == 4
-        # mypy is unable to automatically infer the size of these tuples
-        sensor = cast(
-            Tuple[int, int], tuple(int(x) for x in m.group(1, 2))
-        )
-        beacon = cast(
-            Tuple[int, int], tuple(int(x) for x in m.group(3, 4))
-        )
-        logging.info(
-            f"Sensor {sensorI:>2}/{sensorTotal:>2} is at {sensor};"
-            f" beacon is at {beacon}"
-        )
+    sensorTotal = len(rows)
+    for sensorI, (sensorX, sensorY, beaconX, beaconY) in enumerate(
+        rows, start=1
+    ):
+        if trace.step:
+            print("#" * 20)
+        sensor = (sensorX, sensorY)
+        beacon = (beaconX, beaconY)
+        if trace.step:
+            print(
+                f"Sensor {sensorI:>2}/{sensorTotal:>2} is at"
+                f" {sensor}; beacon is at {beacon}"
+            )
         dist = distance(sensor, beacon)
-        logging.info(f"=> dist: {dist}")
+        if trace.step:
+            print(f"=> dist: {dist}")
         setPosWithinDist(sensor, dist, grid)
         grid.setBeaconOrSensor(beacon)
         grid.setBeaconOrSensor(sensor)
-    logging.info("Calculating solution...")
+    return grid.toData()
+
+
+def solve(
+    inputFile: InputFile,
+    part1: bool,
+    clampX: Optional[Tuple[int, int]],
+    clampY: Optional[Tuple[int, int]],
+) -> int:
+    # Read in data, which is four numbers per line:
+    # "Sensor at x=2, y=18: closest beacon is at x=-2, y=15"
+    with timing.phase("parse"):
+        rows = inputFile.ints().reshape(-1, 4).tolist()
+    grid = SequenceTable(clampX=clampX, clampY=clampY)
+    # Filling in the table is nearly all of the work, so it's kept
+    # between runs when caching
+    with timing.phase("fillTable"):
+        grid.loadData(
+            intermediates.cached(
+                "day15-table",
+                1,
+                (rows, clampX, clampY),
+                lambda: fillTable(rows, clampX, clampY),
+            )
+        )
+    if trace.summary:
+        print("Calculating solution...")
     if part1:
         assert clampY is not None
         assert clampY[0] == clampY[1]
-        calculated = grid.countAtY(clampY[0])
+        with timing.phase("countAtY"):
+            calculated = grid.countAtY(clampY[0])
     else:  # Part2
-        calculated = grid.findTuningFrequency()
-
-    logging.info(f"Calculated: {calculated}")
-    if solution is not None:
-        logging.info(f"=> Expecting {solution}")
-        assert calculated == solution
-
+        with timing.phase("findTuningFrequency"):
+            calculated = grid.findTuningFrequency()
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
+    if trace.summary:
+        print(f"Calculated: {calculated}")
+    return calculated
 
-# Part 1
-with open("day15-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    clampX=None,
-    clampY=(10, 10),
-    solution=26,
-)
-
-with open("day15-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    clampX=None,
-    clampY=(2000000, 2000000),
-    solution=5181556,
-)
 
-# Part 2
-with open("day15-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    clampX=(0, 20),
-    clampY=(0, 20),
-    solution=56000011,
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day15-input-test.txt",
+        solution=26,
+        kwargs=dict(part1=True, clampX=None, clampY=(10, 10)),
+        reader=InputFile.open,
+    ),
+    Case(
+        1,
+        solve,
+        "day15-input.txt",
+        solution=5181556,
+        kwargs=dict(
+            part1=True, clampX=None, clampY=(2000000, 2000000)
+        ),
+        reader=InputFile.open,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day15-input-test.txt",
+        solution=56000011,
+        kwargs=dict(part1=False, clampX=(0, 20), clampY=(0, 20)),
+        reader=InputFile.open,
+    ),
+    Case(
+        2,
+        solve,
+        "day15-input.txt",
+        solution=12817603219131,
+        kwargs=dict(
+            part1=False, clampX=(0, 4000000), clampY=(0, 4000000)
+        ),
+        reader=InputFile.open,
+    ),
 )
 
-with open("day15-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    clampX=(0, 4000000),
-    clampY=(0, 4000000),
-    solution=12817603219131,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+# The full puzzle input's cases search this square in part 2
+# and count the row halfway down in part 1
+SIZE = 4000000
+CORNERS = ((0, 0), (SIZE, 0), (0, SIZE), (SIZE, SIZE))
+
+
+def report(
+    rng: random.Random, sensor: tuple[int, int], radius: int
+) -> str:
+    """Report a beacon somewhere exactly `radius` from `sensor`"""
+    dx = rng.randint(-radius, radius)
+    dy = (radius - abs(dx)) * rng.choice((-1, 1))
+    return (
+        f"Sensor at x={sensor[0]}, y={sensor[1]}: closest beacon is"
+        f" at x={sensor[0] + dx}, y={sensor[1] + dy}"
+    )
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Sensors which between them cover every position in the
+    search square bar one, where the distress beacon must be
+
+    Every sensor stops just short of the hidden position. A sensor in
+    each corner of the square then covers the whole quadrant between
+    it and that position, so nowhere else is left uncovered.
+    """
+    hidden = (
+        rng.randint(SIZE // 4, SIZE * 3 // 4),
+        rng.randint(SIZE // 4, SIZE * 3 // 4),
+    )
+
+    def reach(sensor: tuple[int, int]) -> int:
+        return abs(sensor[0] - hidden[0]) + abs(sensor[1] - hidden[1])
+
+    sensors = list(CORNERS)
+    sensors.extend(
+        (rng.randint(0, SIZE), rng.randint(0, SIZE))
+        for _ in range(scaled(23, scale, minimum=4) - 4)
+    )
+    rng.shuffle(sensors)
+    for sensor in sensors:
+        if sensor == hidden:
+            continue
+        radius = reach(sensor) - 1
+        if sensor not in CORNERS:
+            radius = rng.randint(radius // 2, radius)
+        yield report(rng, sensor, radius)
@@ -1,12 +1,37 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
-from collections import defaultdict, deque
 from dataclasses import dataclass
 
-import os
 import re
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
+
+from aoc import (
+    Case,
+    anytime,
+    checkpoint,
+    metrics,
+    runCases,
+    timing,
+    trace,
+)
+from aoc.search import bfs
+
+STATES = metrics.counter(
+    "day16_states_total", "Paths findBestPath has tried extending"
+)
+SEARCH_STATES = metrics.histogram(
+    "day16_search_states", "States each call of findBestPath visits"
+)
+ELEPHANT_CACHE_HITS = metrics.counter(
+    "day16_elephant_cache_hits_total",
+    "Elephant's best paths looked up rather than searched for",
+)
+ELEPHANT_CACHE_MISSES = metrics.counter(
+    "day16_elephant_cache_misses_total",
+    "Elephant's best paths searched for",
+)
+BEST_PRESSURE = metrics.gauge(
+    "day16_best_pressure", "Most pressure released by a path so far"
+)
 
 
 class Room:
@@ -22,52 +47,40 @@ class Room:
         return f"Room{{{self.name}@{self.rate:>02}}}"
 
 
-def findDistance(src: Room, dest: Room, verbose: bool = False) -> int:
-    @dataclass
-    class State:
-        room: Room
-        distance: int
-
-    assert src != dest
-
-    states: deque[State] = deque()
-    states.appendleft(State(room=src, distance=0))
-
-    while len(states) > 0:
-        state = states.pop()
-        nextDistance = state.distance + 1
-        if dest in state.room.connections:
-            # Found it!
-            if verbose:
-                print(
-                    f"Distance from {src} to {dest} is"
-                    f" {state.distance}"
-                )
-            return nextDistance
-
-        for next in state.room.connections:
-            states.appendleft(State(room=next, distance=nextDistance))
-    else:
-        assert False, f"Unable to find a path from {src} to {dest}"
+@dataclass
+class State:
+    timeRemaining: int
+    totalPressure: int
+    path: list[Room]
 
 
+@timing.timed("findDistances")
 def findDistances(
     rooms: dict[str, Room]
 ) -> dict[Room, dict[Room, int]]:
+    """Return the minutes it takes to get from the start, or any room
+    with a working valve, to each other such room and open its
+    valve"""
     distances: dict[Room, dict[Room, int]] = {}
     for src in rooms.values():
+        if src.name != "AA" and src.rate == 0:
+            continue
+        # One search finds the way to every room at once
+        steps = bfs([src], lambda room: room.connections)
         for dest in rooms.values():
-            if src == dest:
-                continue
-            if src.name != "AA" and src.rate == 0:
+            if dest == src or dest.rate == 0:
                 continue
-            if dest.rate == 0:
-                continue
-            dist = findDistance(src, dest)
+            assert (
+                dest in steps
+            ), f"Unable to find a path from {src} to {dest}"
+            if trace.detail:
+                print(
+                    f"Distance from {src} to {dest} is {steps[dest]}"
+                )
             if src not in distances:
                 distances[src] = {}
             # Add one to the distance to account for opening the valve
-            distances[src][dest] = dist + 1
+            distances[src][dest] = steps[dest] + 1
 
     return distances
 
@@ -85,13 +98,18 @@ def findBestPath(
     actors: int,
     alreadyOpen: frozenset[Room],
     verbose: bool = True,
-) -> Tuple[int, Optional[list[Room]]]:
-    @dataclass
-    class State:
-        timeRemaining: int
-        totalPressure: int
-        path: list[Room]
-
+    saved: Optional[checkpoint.Checkpoint] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[int, Optional[list[Room]], int]:
+    """Return the most pressure that can be released, the path taken
+    for it, and an upper bound on the most there could be, saving the
+    search to `saved` every so often if given and resuming from it if
+    it has one
+
+    The search stops early at the `time.monotonic` time `deadline`,
+    if given, returning the best found so far, which the bound is then
+    likely to be above.
+    """
     assert actors in (1, 2)
 
     current: Room = start
@@ -99,14 +117,125 @@ def findBestPath(
     states.append(
         State(timeRemaining=minutes, totalPressure=0, path=[start])
     )
-    otherCache = dict()
-    stats: defaultdict[str, int] = defaultdict(int)
+    otherCache: dict[
+        frozenset[Room], Tuple[int, Optional[list[Room]], int]
+    ] = dict()
+    statesVisited = 0
 
     bestPressure = 0
     bestPath = None
+
+    restored = None if saved is None else saved.load()
+    if restored is not None:
+        byName = {room.name: room for room in distances}
+        states = [
+            State(
+                timeRemaining,
+                totalPressure,
+                [byName[n] for n in path],
+            )
+            for timeRemaining, totalPressure, path in restored[
+                "states"
+            ]
+        ]
+        bestPressure = restored["bestPressure"]
+        bestPath = [byName[name] for name in restored["bestPath"]]
+        statesVisited = restored["statesVisited"]
+
+    # The least time it takes to go from one valve to another and
+    # open it
+    fewestSteps = min(
+        steps
+        for toRooms in distances.values()
+        for steps in toRooms.values()
+    )
+
+    def optimistic(
+        actorsAt: list[tuple[Room, int]], path: list[Room]
+    ) -> int:
+        """Return more pressure than could be released by opening the
+        valves left, for actors in the rooms given with the time given
+        left"""
+        left = [
+            next
+            for next in distances[start]
+            if next not in path and next not in alreadyOpen
+        ]
+        if not left:
+            return 0
+        # As if each valve could be gone straight to by whoever is
+        # nearest
+        direct = sum(
+            next.rate
+            * max(
+                0,
+                max(
+                    timeRemaining - distances[room][next]
+                    for room, timeRemaining in actorsAt
+                ),
+            )
+            for next in left
+        )
+        # As if the biggest valves came first, each as soon as a valve
+        # could be reached after the one before
+        times: list[int] = []
+        for room, timeRemaining in actorsAt:
+            first = timeRemaining - min(
+                distances[room][next] for next in left
+            )
+            times.extend(range(first, 0, -fewestSteps))
+        times.sort(reverse=True)
+        rates = sorted((next.rate for next in left), reverse=True)
+        ordered = sum(rate * time for rate, time in zip(rates, times))
+        return min(direct, ordered)
+
+    def upperBound(state: State) -> int:
+        """Return the most pressure any path from `state` releases"""
+        actorsAt = [(state.path[-1], state.timeRemaining)]
+        bound = state.totalPressure + optimistic(actorsAt, state.path)
+        if actors == 2:
+            # Each valve left could be opened by either
+            bothBound = state.totalPressure + optimistic(
+                actorsAt + [(start, minutes)], state.path
+            )
+            # The elephant can only do worse as more valves are opened
+            other = otherCache.get(frozenset(state.path))
+            bound = (
+                bothBound
+                if other is None
+                else min(bothBound, bound + other[2])
+            )
+        return bound
+
+    def progress() -> dict[str, Any]:
+        # The elephant's paths are left out, since they're only a
+        # cache and can be found again
+        return dict(
+            states=[
+                [
+                    s.timeRemaining,
+                    s.totalPressure,
+                    [room.name for room in s.path],
+                ]
+                for s in states
+            ],
+            bestPressure=bestPressure,
+            bestPath=[room.name for room in bestPath or []],
+            statesVisited=statesVisited,
+        )
+
     while len(states):
+        if anytime.expired(deadline):
+            if verbose and trace.summary:
+                print(
+                    f"Stopped at the deadline with {len(states)} left"
+                )
+            break
+        if saved is not None and saved.due():
+            saved.save(progress())
         state = states.pop()
         current = state.path[-1]
+        nextStates = []
         for next in distances[current]:
             if next in state.path:
                 continue
@@ -134,11 +263,12 @@ def findBestPath(
                         actors=1,
                         alreadyOpen=otherAlreadyOpen,
                         verbose=False,
+                        deadline=deadline,
                     )
-                    stats["otherCacheMisses"] += 1
+                    ELEPHANT_CACHE_MISSES.inc()
                 else:
-                    stats["otherCacheHits"] += 1
-                otherPressure, otherPath = otherCache[
+                    ELEPHANT_CACHE_HITS.inc()
+                otherPressure, otherPath, _ = otherCache[
                     otherAlreadyOpen
                 ]
                 nextTotalPressure += otherPressure
@@ -147,29 +277,46 @@ def findBestPath(
                 bestPressure = nextTotalPressure
                 bestPath = nextPath.copy()
                 if verbose:
+                    BEST_PRESSURE.set(bestPressure)
+                if verbose and trace.step:
                     print(f"New best pressure of {bestPressure}")
                     print(
                         f" + [{thisPressure:>4}]"
                         f" {nextPath} (timeRemaining={nextTimeRemaining})"
                     )
-                if actors == 2:
-                    print(f" + [{otherPressure:>4}] {otherPath} ")
+                    if actors == 2:
+                        print(f" + [{otherPressure:>4}] {otherPath} ")
             nextState = State(
                 timeRemaining=nextTimeRemaining,
                 totalPressure=thisPressure,
                 path=nextPath,
             )
-            stats["states"] += 1
-            states.append(nextState)
-    if verbose:
+            statesVisited += 1
+            nextStates.append((upperBound(nextState), nextState))
+        # Leave the most promising on top of the stack, and drop any
+        # which can't beat the best so far
+        nextStates.sort(key=lambda boundAndState: boundAndState[0])
+        states.extend(
+            nextState
+            for bound, nextState in nextStates
+            if bound > bestPressure
+        )
+    if saved is not None:
+        # Anything stopped at the deadline can be resumed later
+        if states:
+            saved.save(progress())
+        else:
+            saved.remove()
+    STATES.inc(statesVisited)
+    SEARCH_STATES.observe(statesVisited)
+    if verbose and trace.summary:
         print(f"Best is {bestPressure}")
-    return bestPressure, bestPath
+    # Nothing left unexplored could do better than its bound
+    bound = max([bestPressure] + [upperBound(s) for s in states])
+    return bestPressure, bestPath, bound
 
 
-def solve(
-    lines: list[str], minutes: int, actors: int, solution: int
-) -> None:
-    # Read in data
+def parseRooms(lines: list[str]) -> dict[str, Room]:
     pattern = re.compile(
         r"Valve (\w+) has flow rate=(\d+); tunnels* leads* to valves*"
         r" ([ ,\w]+)"
@@ -186,63 +333,77 @@ def solve(
         rooms[room.name] = room
 
     reconcileConnections(rooms)
+    return rooms
 
-    # Calculate distances between rooms
-    distances = findDistances(rooms)
-
-    bestPressure, bestPaths = findBestPath(
-        start=rooms["AA"],
-        distances=distances,
-        minutes=minutes,
-        alreadyOpen=frozenset(),
-        actors=actors,
-    )
 
-    print(
-        f"Received a best pressure of {bestPressure} via {bestPaths}"
-    )
-
-    if solution is not None:
-        print(f"=> Expecting {solution}")
-        assert bestPressure == solution
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day16-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    minutes=30,
-    actors=1,
-    solution=1651,
-)
+def solve(
+    lines: list[str],
+    minutes: int,
+    actors: int,
+    deadline: Optional[float] = None,
+) -> int:
+    """Return the most pressure that can be released, or the most
+    found in `deadline` seconds if given"""
+    with timing.phase("parse"):
+        rooms = parseRooms(lines)
 
-with open("day16-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    minutes=30,
-    actors=1,
-    solution=1584,
-)
+    # Calculate distances between rooms
+    distances = findDistances(rooms)
 
-# Part 2
-with open("day16-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    minutes=26,
-    actors=2,
-    solution=1707,
+    with timing.phase("findBestPath"):
+        bestPressure, bestPaths, upperBound = findBestPath(
+            start=rooms["AA"],
+            distances=distances,
+            minutes=minutes,
+            alreadyOpen=frozenset(),
+            actors=actors,
+            saved=checkpoint.forSearch(
+                "day16", minutes, actors, lines
+            ),
+            deadline=anytime.deadlineAfter(deadline),
+        )
+
+    if trace.summary:
+        print(
+            "Received a best pressure of"
+            f" {anytime.Bound(bestPressure, upperBound)} via"
+            f" {bestPaths}"
+        )
+    return bestPressure
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day16-input-test.txt",
+        solution=1651,
+        kwargs=dict(minutes=30, actors=1),
+    ),
+    Case(
+        1,
+        solve,
+        "day16-input.txt",
+        solution=1584,
+        kwargs=dict(minutes=30, actors=1),
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day16-input-test.txt",
+        solution=1707,
+        kwargs=dict(minutes=26, actors=2),
+    ),
+    Case(
+        2,
+        solve,
+        "day16-input.txt",
+        solution=2052,
+        kwargs=dict(minutes=26, actors=2),
+    ),
 )
 
-with open("day16-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    minutes=26,
-    actors=2,
-    solution=2052,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A sparsely connected network of valves starting from `AA`,
+    around a quarter of which have a non-zero flow rate"""
+    count = scaled(58, scale, minimum=2)
+    letters = 2 if count <= 26 * 26 else 3
+    names = [
+        "".join(name)
+        for name in itertools.product(
+            string.ascii_uppercase, repeat=letters
+        )
+    ]
+    names.remove("A" * letters)
+    names = ["AA"] + rng.sample(names, count - 1)
+
+    # Join each valve to one before it so they're all connected,
+    # then add a few more tunnels to give some choice of route
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+    for i, name in enumerate(names[1:], start=1):
+        other = names[rng.randrange(i)]
+        tunnels[name].add(other)
+        tunnels[other].add(name)
+    for _ in range(count // 8):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    flowing = set(
+        rng.sample(names[1:], min(scaled(15, scale), count - 1))
+    )
+    rng.shuffle(names)
+    for name in names:
+        rate = rng.randint(3, 25) if name in flowing else 0
+        others = sorted(tunnels[name])
+        rng.shuffle(others)
+        if len(others) == 1:
+            leads = f"tunnel leads to valve {others[0]}"
+        else:
+            leads = f"tunnels lead to valves {', '.join(others)}"
+        yield f"Valve {name} has flow rate={rate}; {leads}"
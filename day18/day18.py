@@ -1,151 +1,131 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
-import itertools
-
-import os
-from typing import cast
-import logging
-
-
-logging.basicConfig(format="%(message)s", level=logging.INFO)
 
+import itertools
+from typing import Iterator
 
-class Cube(tuple[int, int, int]):
-    pass
+from aoc import Case, runCases, timing, trace
+from aoc.coords import NEIGHBOURS3, pack3, unpack3
+from aoc.reader import InputFile
+from aoc.search import bfs
 
 
-def solvePart1(cubes: dict[tuple[int, int, int], bool]) -> int:
+def solvePart1(cubes: set[int]) -> int:
     sa = 0
-    cubesToCheck = cubes
-    for cube in cubesToCheck:
-        logging.debug(f"==> Looking for cubes adjacent to {cube}")
-        for dim in range(3):
-            for modifier in (-1, 1):
-                c = list(cube)
-                c[dim] += modifier
-                logging.debug(f"===> Checking {c}")
-                # mypy is unable to automatically infer the size of these tuples
-                c2 = cast(tuple[int, int, int], tuple(c))
-                if cubes.get(c2, None):
-                    pass
-                else:
-                    sa += 1
-                pass
+    for cube in cubes:
+        if trace.detail:
+            print(
+                f"==> Looking for cubes adjacent to {unpack3(cube)}"
+            )
+        for step in NEIGHBOURS3:
+            if trace.detail:
+                print(f"===> Checking {unpack3(cube + step)}")
+            if cube + step not in cubes:
+                sa += 1
     return sa
 
 
-def solvePart2(
-    cubes: dict[tuple[int, int, int], bool],
-    maxIterations: int = 10000,
-) -> int:
+def solvePart2(cubes: set[int]) -> int:
     allMax = 0
     allMin = 100
     for c in cubes:
-        thisMax = max(*c)
+        thisMax = max(*unpack3(c))
         allMax = max(allMax, thisMax)
-        thisMin = min(*c)
+        thisMin = min(*unpack3(c))
         allMin = min(allMin, thisMin)
     boundMin = allMin - 1
     boundMax = allMax + 1
+
+    # Every cube of air in a box one bigger than the droplet on every
+    # side, which is quicker to look steps up in than to unpack each
+    # of them to check its bounds
+    bounds = range(boundMin, boundMax + 1)
+    box = {
+        pack3(x, y, z)
+        for x, y, z in itertools.product(bounds, bounds, bounds)
+    }
+    box -= cubes
+
+    def outside(cube: int) -> Iterator[int]:
+        for step in NEIGHBOURS3:
+            toCheck = cube + step
+            if toCheck in box:
+                yield toCheck
+            elif trace.detail:
+                print(
+                    f"==> Not checking {unpack3(toCheck)} (OOB or"
+                    " solid)"
+                )
+
+    # Lets try a floodfill of the air around the droplet, starting
+    # from a corner of the box
+    air = bfs([pack3(boundMin, boundMin, boundMin)], outside)
+    if trace.step:
+        print(f"Reached {len(air)} cubes of air")
+
+    # Every face of the droplet touching that air is on the outside
     sa = 0
-    # Lets try a floodfill
-    cubesToCheckNext = list()
-    start = (0, 0, 0)
-    cubesToCheckNext.append(start)
-    cubesQueued = list()
-    cubesQueued.append(start)
-    for iteration in range(maxIterations):
-        logging.debug(f"Iteration {iteration} (sa={sa})")
-        cubesToCheck = cubesToCheckNext
-        cubesToCheckNext = list()
-        if len(cubesToCheck) == 0:
-            logging.debug("No cubes to check => ending early")
-            break
-        for cube in cubesToCheck:
-            logging.debug(f"=> From {cube}")
-            for dim, modifier in itertools.product(range(3), (-1, 1)):
-                # FIXME: More elegant way of creating this?
-                # toCheck = cube[:dim] + (cube[dim:dim] + modifier) + cube[dim+1:]
-                toCheck: list[int] = list(cube)
-                toCheck[dim] += modifier
-                if toCheck[dim] < boundMin or toCheck[dim] > boundMax:
-                    logging.debug(f"==> Not checking {toCheck} (OOB)")
-                    continue
-                elif tuple(toCheck) in cubes:
-                    logging.debug(
-                        f"==> Not checking {toCheck} (solid)"
-                    )
-                    sa += 1
-                    continue
-                elif tuple(toCheck) in cubesQueued:
-                    logging.debug(
-                        f"==> Not checking {toCheck} (seen)"
-                    )
-                    continue
-                else:
-                    logging.debug(
-                        f"==>     Checking {toCheck} next iteration"
-                    )
-                    # mypy is unable to automatically infer the size of these tuples
-                    toCheck2 = cast(
-                        tuple[int, int, int], tuple(toCheck)
-                    )
-                    cubesQueued.append(toCheck2)
-                    cubesToCheckNext.append(toCheck2)
+    for cube in air:
+        for step in NEIGHBOURS3:
+            if cube + step in cubes:
+                sa += 1
     return sa
 
 
-def solve(lines: list[str], part1: bool, solution: int) -> None:
+def solve(inputFile: InputFile, part1: bool) -> int:
     # Read in data
-    cubes: dict[tuple[int, int, int], bool] = dict()
-    for i, line in enumerate(lines, start=1):
-        pos = (int(x) for x in line.split(","))
-        cube = Cube(pos)
-        cubes[cube] = True
-
-    if part1:
-        calculated = solvePart1(cubes)
-    else:
-        calculated = solvePart2(cubes)
-
-    logging.info(f"Calculated:  {calculated}")
-    logging.info(f"=> Expecting {solution}")
-    assert calculated == solution
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day18-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    solution=64,
-)
-
-with open("day18-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    solution=3564,
+    with timing.phase("parse"):
+        cubes = {
+            pack3(x, y, z)
+            for x, y, z in inputFile.ints().reshape(-1, 3).tolist()
+        }
+
+    with timing.phase("surfaceArea"):
+        if part1:
+            calculated = solvePart1(cubes)
+        else:
+            calculated = solvePart2(cubes)
+
+    if trace.summary:
+        print(f"Calculated:  {calculated}")
+    return calculated
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day18-input-test.txt",
+        solution=64,
+        kwargs=dict(part1=True),
+        reader=InputFile.open,
+    ),
+    Case(
+        1,
+        solve,
+        "day18-input.txt",
+        solution=3564,
+        kwargs=dict(part1=True),
+        reader=InputFile.open,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day18-input-test.txt",
+        solution=58,
+        kwargs=dict(part1=False),
+        reader=InputFile.open,
+    ),
+    Case(
+        2,
+        solve,
+        "day18-input.txt",
+        solution=2106,
+        kwargs=dict(part1=False),
+        reader=InputFile.open,
+    ),
 )
 
-# Part 2
-with open("day18-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    solution=58,
-)
-
-with open("day18-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    solution=2106,
-)
+if __name__ == "__main__":
+    runCases(CASES)
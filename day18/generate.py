@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A lava droplet of cubes scattered through a sphere, which
+    leaves pockets of air trapped inside
+
+    Coordinates start from 1, since the solver begins its flood fill
+    of the outside from 0,0,0.
+    """
+    count = scaled(2000, scale)
+    # Fill roughly half of the sphere, whose volume is about 4r^3
+    radius = max(2, round((count / 2) ** (1 / 3)))
+    centre = radius + 1
+    # A dict rather than a set keeps the order reproducible
+    cubes: dict[tuple[int, int, int], None] = {}
+    while len(cubes) < count:
+        cube = (
+            rng.randint(1, 2 * radius + 1),
+            rng.randint(1, 2 * radius + 1),
+            rng.randint(1, 2 * radius + 1),
+        )
+        if sum((c - centre) ** 2 for c in cube) <= radius**2:
+            cubes[cube] = None
+    for x, y, z in cubes:
+        yield f"{x},{y},{z}"
+
+
+def edgeCases() -> list[list[str]]:
+    # A hollow cube, with one pocket of air at its centre, and a cube
+    # on its own, both at negative coordinates
+    shell = [
+        f"{x - 5},{y},{z + 3}"
+        for x in range(-1, 2)
+        for y in range(-1, 2)
+        for z in range(-1, 2)
+        if (x, y, z) != (0, 0, 0)
+    ]
+    return [shell, ["-1,-1,-1"]]
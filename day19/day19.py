@@ -1,18 +1,51 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-import copy
 import itertools
-import os
-import random
 import re
 from collections import deque
 from enum import IntEnum, auto
 import time
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional
+
+from aoc import (
+    Case,
+    anytime,
+    checkpoint,
+    metrics,
+    runCases,
+    timing,
+    trace,
+)
 
-from rich import print  # type: ignore
+STATES = metrics.counter(
+    "day19_states_total", "Simulations run to their last minute"
+)
+GEODE_PRUNES = metrics.counter(
+    "day19_geode_prunes_total",
+    "Simulations pruned for having too few geode robots",
+)
+BOUND_PRUNES = metrics.counter(
+    "day19_bound_prunes_total",
+    "Simulations pruned for being unable to beat the best so far",
+)
+WAIT_PRUNES = metrics.counter(
+    "day19_wait_prunes_total",
+    (
+        "Simulations pruned for waiting before buying what they could"
+        " already afford"
+    ),
+)
+BEST_GEODES = metrics.gauge(
+    "day19_best_geodes", "Most geodes the current blueprint has made"
+)
+BLUEPRINT_SECONDS = metrics.histogram(
+    "day19_blueprint_seconds",
+    "Time taken to simulate each blueprint",
+    buckets=(0.01, 0.1, 1, 10, 100),
+)
+# How many simulations to run between publishing the counts, which
+# would slow the search down if done for each of them
+PUBLISH_EVERY = 100000
 
 
 class Resources:
@@ -24,6 +57,14 @@ class Resources:
         self.obsidian = obsidian
         self.geode = geode
 
+    def toList(self) -> list[int]:
+        return [self.ore, self.clay, self.obsidian, self.geode]
+
+    def copy(self) -> Resources:
+        return Resources(
+            self.ore, self.clay, self.obsidian, self.geode
+        )
+
 
 class BuyOrder(IntEnum):
     UNINITIALIZED = auto()
@@ -47,6 +88,15 @@ class State:
         self.robots = robots
         self.buyOrder = BuyOrder.UNINITIALIZED
 
+    def copy(self) -> State:
+        """Return a copy sharing the blueprint, which never changes,
+        so is cheaper than a deep copy and can be compiled"""
+        state = State(
+            self.blueprint, self.resources.copy(), self.robots.copy()
+        )
+        state.buyOrder = self.buyOrder
+        return state
+
     def canBuy(self, buyOrder: BuyOrder) -> bool:
         match buyOrder:
             case BuyOrder.BUY_GEODE:
@@ -177,13 +227,100 @@ class Blueprint:
             )
         )
 
-    def sim(self) -> tuple[int, int, int]:
-        verbose = False
+    def saveState(self) -> list[list[int]]:
+        """Return the states being simulated as plain data"""
+        return [
+            s.resources.toList() + s.robots.toList() + [s.buyOrder]
+            for s in self.state
+        ]
+
+    def loadState(self, saved: list[list[int]]) -> None:
+        self.state.clear()
+        for values in saved:
+            s = State(
+                blueprint=self,
+                resources=Resources(*values[:4]),
+                robots=Resources(*values[4:8]),
+            )
+            s.buyOrder = BuyOrder(values[8])
+            self.state.append(s)
+
+    def upperBound(self, minute: int) -> int:
+        """Return more geodes than could be had from the state at
+        `minute`, by simulating as if ore were free and a robot of
+        every other kind could be bought each minute"""
+        s = self.state[minute]
+        clay = s.resources.clay
+        obsidian = s.resources.obsidian
+        geode = s.resources.geode
+        clayRobots = s.robots.clay
+        obsidianRobots = s.robots.obsidian
+        geodeRobots = s.robots.geode
+        for _ in range(self.totalMinutes - minute):
+            buyObsidian = clay >= self.obsidianRobotCost[1]
+            buyGeode = obsidian >= self.geodeRobotCost[1]
+            clay += clayRobots
+            obsidian += obsidianRobots
+            geode += geodeRobots
+            clayRobots += 1
+            if buyObsidian:
+                clay -= self.obsidianRobotCost[1]
+                obsidianRobots += 1
+            if buyGeode:
+                obsidian -= self.geodeRobotCost[1]
+                geodeRobots += 1
+        return geode
+
+    def frontierBound(self, best: int) -> int:
+        """Return more geodes than the search could still find, were it
+        to carry on from the states being simulated"""
+        bound = best
+        for minute, s in enumerate(self.state):
+            # Only the last state and those with buy orders left to
+            # try have anything left to explore
+            if minute == len(self.state) - 1 or s.buyOrder not in (
+                BuyOrder.BUY_GEODE,
+                BuyOrder.BUY_NONE,
+            ):
+                bound = max(bound, self.upperBound(minute))
+        return bound
+
+    def sim(
+        self, deadline: Optional[float] = None
+    ) -> tuple[int, int, int, int]:
+        """Return the most geodes found, the seconds and simulations it
+        took, and an upper bound on the most geodes the search could
+        find
+
+        The search stops early at the `time.monotonic` time `deadline`,
+        if given, returning the best found so far, which the bound is
+        then likely to be above.
+        """
+        # Look the flag up once, since this loop is hot
+        verbose = trace.detail
         startTime = time.time()
         best = 0
         statesSeen = 0
         mostGeode = [0] * self.totalMinutes
         mostGeodePrunes = 0
+        boundPrunes = 0
+        waitPrunes = 0
+        published = (0, 0, 0, 0)
+
+        def publish() -> None:
+            nonlocal published
+            STATES.inc(statesSeen - published[0])
+            GEODE_PRUNES.inc(mostGeodePrunes - published[1])
+            BOUND_PRUNES.inc(boundPrunes - published[2])
+            WAIT_PRUNES.inc(waitPrunes - published[3])
+            BEST_GEODES.set(best)
+            published = (
+                statesSeen,
+                mostGeodePrunes,
+                boundPrunes,
+                waitPrunes,
+            )
+
         # These strategies were a technique for seeding the search space with
         # a given buy strategy to start, before backtracking, with the intent
         # to allow us to do early elimination of a number of low-value paths
@@ -194,9 +331,63 @@ class Blueprint:
         )
         # strategies: list[tuple[int, ...]] = list()
         i = 0
+
+        saved = checkpoint.forSearch(
+            "day19",
+            self.totalMinutes,
+            self.oreRobotCost,
+            self.clayRobotCost,
+            self.obsidianRobotCost,
+            self.geodeRobotCost,
+        )
+        restored = None if saved is None else saved.load()
+        if restored is not None:
+            self.loadState(restored["state"])
+            i = restored["i"]
+            best = restored["best"]
+            statesSeen = restored["statesSeen"]
+            mostGeode = restored["mostGeode"]
+            mostGeodePrunes = restored["mostGeodePrunes"]
+            boundPrunes = restored["boundPrunes"]
+            waitPrunes = restored["waitPrunes"]
+            startTime -= restored["seconds"]
+            if trace.step:
+                trace.richPrint(
+                    f"Resuming {self.name} after"
+                    f" {convertToMillion(statesSeen)} states"
+                )
+
+        def progress() -> dict[str, Any]:
+            return dict(
+                state=self.saveState(),
+                i=i,
+                best=best,
+                statesSeen=statesSeen,
+                mostGeode=mostGeode,
+                mostGeodePrunes=mostGeodePrunes,
+                boundPrunes=boundPrunes,
+                waitPrunes=waitPrunes,
+                seconds=time.time() - startTime,
+            )
+
         while True:
+            # Each simulation starts from a consistent state, so this
+            # is where the search can be saved or stopped
+            if anytime.expired(deadline):
+                if saved is not None:
+                    # To be resumed later
+                    saved.save(progress())
+                publish()
+                return (
+                    best,
+                    int(time.time() - startTime),
+                    statesSeen,
+                    self.frontierBound(best),
+                )
+            if saved is not None and saved.due():
+                saved.save(progress())
             if verbose:
-                print("**** New simulation ****")
+                trace.richPrint("**** New simulation ****")
             if strategies and i < len(strategies):
                 strategy = strategies[i]
             else:
@@ -207,7 +398,7 @@ class Blueprint:
             while len(self.state) <= self.totalMinutes:
                 minute = len(self.state) - 1
                 if verbose:
-                    print(f"== Minute {minute + 1} ==")
+                    trace.richPrint(f"== Minute {minute + 1} ==")
 
                 # Optimization 1
                 # Prune any path that has fewer geode robots than previously seen
@@ -221,11 +412,17 @@ class Blueprint:
                     # break to prune all adjacent paths as well
                     break
 
+                # Prune any path which couldn't beat the best so far
+                # even if ore were free
+                if self.upperBound(minute) <= best:
+                    boundPrunes += 1
+                    break
+
                 # Set buyOrder
                 self.executeBuyOrderStrategy(strategy, minute)
 
                 # Create next state based on current state
-                self.state.append(copy.deepcopy(self.state[minute]))
+                self.state.append(self.state[minute].copy())
                 self.state[minute + 1].buyOrder = (
                     BuyOrder.UNINITIALIZED
                 )
@@ -248,10 +445,11 @@ class Blueprint:
                     )
                 ):
                     # continue to instead skip this path but try the next adjacent one
+                    waitPrunes += 1
                     break
 
                 if verbose:
-                    print(
+                    trace.richPrint(
                         "Have"
                         f" {self.state[minute].resources.ore} ore,"
                         f" {self.state[minute].resources.clay} clay,"
@@ -266,7 +464,7 @@ class Blueprint:
                             minute + 1
                         ].resources.ore -= self.oreRobotCost
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 f"Spend {self.oreRobotCost} ore to"
                                 " start building a ore-collecting"
                                 " robot."
@@ -276,7 +474,7 @@ class Blueprint:
                             minute + 1
                         ].resources.ore -= self.clayRobotCost
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 f"Spend {self.clayRobotCost} ore to"
                                 " start building a clay-collecting"
                                 " robot."
@@ -289,7 +487,7 @@ class Blueprint:
                             minute + 1
                         ].resources.clay -= self.obsidianRobotCost[1]
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "Spend"
                                 f" {self.obsidianRobotCost[0]} ore"
                                 " and"
@@ -305,7 +503,7 @@ class Blueprint:
                             minute + 1
                         ].resources.obsidian -= self.geodeRobotCost[1]
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 f"Spend {self.geodeRobotCost[0]} ore"
                                 f" and {self.geodeRobotCost[1]} clay"
                                 " to start building a geode-cracking"
@@ -327,7 +525,7 @@ class Blueprint:
                         minute + 1
                     ].resources.ore += self.state[minute].robots.ore
                     if verbose:
-                        print(
+                        trace.richPrint(
                             f"{self.state[minute].robots.ore} ore-collecting"
                             " robot collects"
                             f" {self.state[minute].robots.ore} ore;"
@@ -339,7 +537,7 @@ class Blueprint:
                         minute + 1
                     ].resources.clay += self.state[minute].robots.clay
                     if verbose:
-                        print(
+                        trace.richPrint(
                             f"{self.state[minute].robots.clay} clay-collecting"
                             " robot collects"
                             f" {self.state[minute].robots.clay} clay;"
@@ -353,7 +551,7 @@ class Blueprint:
                         minute
                     ].robots.obsidian
                     if verbose:
-                        print(
+                        trace.richPrint(
                             f"{self.state[minute].robots.obsidian} obsidian-collecting"
                             " robot collects"
                             f" {self.state[minute].robots.obsidian} obsidian;"
@@ -367,7 +565,7 @@ class Blueprint:
                         minute
                     ].robots.geode
                     if verbose:
-                        print(
+                        trace.richPrint(
                             f"{self.state[minute].robots.geode} geode-cracking"
                             " robot collects"
                             f" {self.state[minute].robots.geode} geode;"
@@ -380,7 +578,7 @@ class Blueprint:
                     case BuyOrder.BUY_ORE:
                         self.state[minute + 1].robots.ore += 1
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "The new ore-collecting robot is"
                                 " ready; you now have"
                                 f" {self.state[minute + 1].robots.ore} of"
@@ -389,7 +587,7 @@ class Blueprint:
                     case BuyOrder.BUY_CLAY:
                         self.state[minute + 1].robots.clay += 1
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "The new clay-collecting robot is"
                                 " ready; you now have"
                                 f" {self.state[minute + 1].robots.clay} of"
@@ -398,7 +596,7 @@ class Blueprint:
                     case BuyOrder.BUY_OBSIDIAN:
                         self.state[minute + 1].robots.obsidian += 1
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "The new obsidian-collecting robot"
                                 " is ready; you now have"
                                 f" {self.state[minute + 1].robots.obsidian} of"
@@ -407,7 +605,7 @@ class Blueprint:
                     case BuyOrder.BUY_GEODE:
                         self.state[minute + 1].robots.geode += 1
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "The new geode-cracking robot is"
                                 " ready; you now have"
                                 f" {self.state[minute + 1].robots.geode} of"
@@ -419,29 +617,42 @@ class Blueprint:
                         assert False
 
             if verbose:
-                print("\n**** Setting up next simulation ****")
+                trace.richPrint(
+                    "\n**** Setting up next simulation ****"
+                )
             lastState = self.state.pop()
             statesSeen += 1
             best = self.recordProgress(
                 best, statesSeen, strategy, lastState
             )
+            if statesSeen % PUBLISH_EVERY == 0:
+                publish()
 
             if strategy is None:
                 while True:
                     if len(self.state) == 0:
+                        if saved is not None:
+                            saved.remove()
+                        publish()
+                        BLUEPRINT_SECONDS.observe(
+                            time.time() - startTime
+                        )
                         return (
                             best,
                             int(time.time() - startTime),
                             statesSeen,
+                            best,
                         )
                     else:
                         if verbose:
-                            print(f"Popping {len(self.state)}")
+                            trace.richPrint(
+                                f"Popping {len(self.state)}"
+                            )
                         poppedState = self.state.pop()
                     validOrder = poppedState.nextOrder()
                     if validOrder is True:
                         if verbose:
-                            print(
+                            trace.richPrint(
                                 "Order is valid so continuing to sim"
                             )
                         self.state.append(poppedState)
@@ -456,6 +667,16 @@ class Blueprint:
         strategy: Optional[tuple[int, ...]],
         lastState: State,
     ) -> int:
+        best = previousBest
+        newBestStar = " "
+        if lastState.resources.geode > previousBest:
+            best = lastState.resources.geode
+            newBestStar = "*"
+        if not trace.step:
+            return best
+        # Only needed for output, which is usually turned off
+        import random
+
         ALWAYS_PRINT = False
         NEVER_PRINT = False
         # printChance = 100
@@ -472,16 +693,11 @@ class Blueprint:
         if NEVER_PRINT is True:
             shouldPrint = False
 
-        best = previousBest
-        newBestStar = " "
-        if lastState.resources.geode > previousBest:
-            best = lastState.resources.geode
-            newBestStar = "*"
-            if NEVER_PRINT is not True:
-                shouldPrint = True
+        if newBestStar == "*" and NEVER_PRINT is not True:
+            shouldPrint = True
 
         if shouldPrint:
-            print(
+            trace.richPrint(
                 (
                     rf"\[{self.name}]\[{lastState.resources.geode:2}/{best:2}{newBestStar}] "
                 ),
@@ -492,21 +708,21 @@ class Blueprint:
             for s in self.state:
                 match s.buyOrder:
                     case BuyOrder.BUY_ORE:
-                        print("[green]o[/green]", end="")
+                        trace.richPrint("[green]o[/green]", end="")
                     case BuyOrder.BUY_CLAY:
-                        print("[yellow]c[/yellow]", end="")
+                        trace.richPrint("[yellow]c[/yellow]", end="")
                     case BuyOrder.BUY_OBSIDIAN:
-                        print("[red]b[/red]", end="")
+                        trace.richPrint("[red]b[/red]", end="")
                     case BuyOrder.BUY_GEODE:
-                        print("[blue]g[/blue]", end="")
+                        trace.richPrint("[blue]g[/blue]", end="")
                     case BuyOrder.BUY_NONE:
-                        print(".", end="")
+                        trace.richPrint(".", end="")
                     case _:
                         assert False
             for _ in range(len(self.state), self.totalMinutes):
-                print("?", end="")
+                trace.richPrint("?", end="")
             statesSeenM = convertToMillion(statesSeen)
-            print(
+            trace.richPrint(
                 (
                     f" {lastState.robots.ore:2}[green]o[/green],"
                     f" {lastState.robots.clay:2}[yellow]c[/yellow],"
@@ -517,12 +733,12 @@ class Blueprint:
                 end="",
             )
             if strategy is not None:
-                print(
+                trace.richPrint(
                     f" strat=(o={strategy[0]}, c={strategy[1]},"
                     f" b={strategy[2]})"
                 )
             else:
-                print(" strat=DFS")
+                trace.richPrint(" strat=DFS")
             pass
             if strategy is not None:
                 pass
@@ -570,8 +786,11 @@ def solve(
     part1: bool,
     minutes: int,
     blueprints: Optional[int],
-    solution: int,
-) -> None:
+    deadline: Optional[float] = None,
+) -> int:
+    """Return the total quality level of the blueprints (part 1) or the
+    product of their most geodes (part 2), or the best found in
+    `deadline` seconds if given"""
     patternStr = (
         r"Blueprint (\d+): Each ore robot costs (\d+) ore. Each clay"
         r" robot costs (\d+) ore. Each obsidian robot costs (\d+) ore"
@@ -584,6 +803,9 @@ def solve(
         calculated = 0
     else:
         calculated = 1
+    # What the solution could be at most, if stopped early
+    upperBound = calculated
+    stopAt = anytime.deadlineAfter(deadline)
 
     statesExploredTotal = 0
     elapsedTimeTotal = 0
@@ -593,109 +815,115 @@ def solve(
         lines = lines[0:blueprints]
     iTotal = len(lines)
     for i, line in enumerate(lines, start=1):
-        m = pattern.match(line)
-        assert m is not None
-        b = Blueprint(
-            name=f"{name}-{m.group(1)}/{iTotal}",
-            minutes=minutes,
-            oreRobotCost=m.group(2),
-            clayRobotCost=m.group(3),
-            obsidianRobotCost=m.group(4, 5),
-            geodeRobotCost=m.group(6, 7),
-        )
+        with timing.phase("parse"):
+            m = pattern.match(line)
+            assert m is not None
+            b = Blueprint(
+                name=f"{name}-{m.group(1)}/{iTotal}",
+                minutes=minutes,
+                oreRobotCost=m.group(2),
+                clayRobotCost=m.group(3),
+                obsidianRobotCost=m.group(4, 5),
+                geodeRobotCost=m.group(6, 7),
+            )
 
         assert m
 
-        print(
-            f"\nSimulating blueprint {i}/{iTotal} for"
-            f" {minutes} minutes..."
-        )
-        best, elapsedTime, statesExplored = b.sim()
+        if trace.step:
+            trace.richPrint(
+                f"\nSimulating blueprint {i}/{iTotal} for"
+                f" {minutes} minutes..."
+            )
+        # Share the time left between the blueprints left
+        with timing.phase("sim"):
+            best, elapsedTime, statesExplored, bound = b.sim(
+                anytime.share(stopAt, iTotal - i + 1)
+            )
         elapsedTimeTotal += elapsedTime
         statesExploredTotal += statesExplored
 
-        print(f"=> Received best geode count of {best}")
+        if trace.step:
+            trace.richPrint(f"=> Received best geode count of {best}")
         if part1:
             ql = best * i
-            print(f"=> Quality level is {ql}")
+            if trace.step:
+                trace.richPrint(f"=> Quality level is {ql}")
             calculated += ql
+            upperBound += bound * i
         else:
             calculated *= best
-        print(f"=> Runtime: {elapsedTime:.1f} seconds")
-        print(
-            f"=> States explored: {convertToMillion(statesExplored)}"
-        )
-
-    print()
-    print(f"Done running {iTotal} blueprints")
-    print(f"Calculated solution:  {calculated}")
-    if solution:
-        print(f"=> Expected solution: {solution}")
-    assert solution is None or calculated == solution
-
-    print()
-    print("Stats")
-    print(f"=> Runtime: {elapsedTimeTotal:.1f} seconds")
-    print(
-        f"=> States explored: {convertToMillion(statesExploredTotal)}"
-    )
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day19-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    name="p1-mini",
-    part1=True,
-    minutes=24,
-    blueprints=1,
-    solution=9,
-)
-
-with open("day19-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    name="p1-test",
-    part1=True,
-    minutes=24,
-    blueprints=None,
-    solution=33,
-)
+            upperBound *= bound
+        if trace.step:
+            trace.richPrint(f"=> Runtime: {elapsedTime:.1f} seconds")
+            trace.richPrint(
+                "=> States explored:"
+                f" {convertToMillion(statesExplored)}"
+            )
 
-with open("day19-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    name="p1",
-    part1=True,
-    minutes=24,
-    blueprints=None,
-    solution=1413,
-)
+    if trace.summary:
+        trace.richPrint()
+        trace.richPrint(f"Done running {iTotal} blueprints")
+        trace.richPrint(
+            "Calculated solution: "
+            f" {anytime.Bound(calculated, upperBound)}"
+        )
 
-# Part 2
-with open("day19-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    name="p2",
-    part1=False,
-    minutes=32,
-    blueprints=2,
-    solution=56 * 62,
+    if trace.summary:
+        trace.richPrint()
+        trace.richPrint("Stats")
+        trace.richPrint(f"=> Runtime: {elapsedTimeTotal:.1f} seconds")
+        trace.richPrint(
+            "=> States explored:"
+            f" {convertToMillion(statesExploredTotal)}"
+        )
+    return calculated
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day19-input-test.txt",
+        solution=9,
+        kwargs=dict(
+            name="p1-mini", part1=True, minutes=24, blueprints=1
+        ),
+    ),
+    Case(
+        1,
+        solve,
+        "day19-input-test.txt",
+        solution=33,
+        kwargs=dict(
+            name="p1-test", part1=True, minutes=24, blueprints=None
+        ),
+    ),
+    Case(
+        1,
+        solve,
+        "day19-input.txt",
+        solution=1413,
+        kwargs=dict(
+            name="p1", part1=True, minutes=24, blueprints=None
+        ),
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day19-input-test.txt",
+        solution=56 * 62,
+        kwargs=dict(name="p2", part1=False, minutes=32, blueprints=2),
+    ),
+    Case(
+        2,
+        solve,
+        "day19-input.txt",
+        solution=21080,
+        kwargs=dict(name="p2", part1=False, minutes=32, blueprints=3),
+    ),
 )
 
-with open("day19-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    name="p2",
-    part1=False,
-    minutes=32,
-    blueprints=3,
-    solution=21080,
-)
+if __name__ == "__main__":
+    runCases(CASES)
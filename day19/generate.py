@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Blueprints with robot costs in the same ranges as the real
+    puzzle input"""
+    for number in range(1, scaled(30, scale, minimum=3) + 1):
+        yield (
+            f"Blueprint {number}:"
+            f" Each ore robot costs {rng.randint(2, 4)} ore."
+            f" Each clay robot costs {rng.randint(2, 4)} ore."
+            f" Each obsidian robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} clay."
+            f" Each geode robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} obsidian."
+        )
@@ -1,7 +1,9 @@
-#!/usr/bin/env python3
 from __future__ import annotations
-import os
 from enum import IntEnum
+from typing import Iterable
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
 
 
 # @@@SNIPSTART day2-MoveType
@@ -43,15 +45,18 @@ class MoveType(IntEnum):
             or self == MoveType.SCISSORS and oMove == MoveType.PAPER
             # fmt: on
         ):
-            print(f"{self} vs {oMove} -> Win")
+            if trace.detail:
+                print(f"{self} vs {oMove} -> Win")
             return 6 + int(self)
         # Check for tie condition
         elif int(self) == int(oMove):
-            print(f"{self} vs {oMove} -> Tie")
+            if trace.detail:
+                print(f"{self} vs {oMove} -> Tie")
             return 3 + int(self)
         # Else must be lose condition
         else:
-            print(f"{self} vs {oMove} -> Lose")
+            if trace.detail:
+                print(f"{self} vs {oMove} -> Lose")
             return 0 + int(self)
             # @@@SNIPEND
 
@@ -83,8 +88,9 @@ class MoveType(IntEnum):
         # @@@SNIPEND
 
 
+@timing.timed("score")
 # @@@SNIPSTART day2-solvePart1
-def solvePart1(lines: list[str], solution: int) -> None:
+def solvePart1(lines: Iterable[str]) -> int:
     score = 0
     for line in lines:
         # Get the moves from the puzzle input
@@ -93,46 +99,41 @@ def solvePart1(lines: list[str], solution: int) -> None:
         ]
         # Calculate the score
         score += ourMove.scoreAgainst(theirMove)
-    print(f"Calculated:  {score:}")
-    if solution:
-        print(f"=> Expected: {solution}")
-    assert solution is None or score == solution
+    return score
     # @@@SNIPEND
 
 
+@timing.timed("score")
 # @@@SNIPSTART day2-solvePart2
-def solvePart2(lines: list[str], solution: int) -> None:
+def solvePart2(lines: Iterable[str]) -> int:
     score = 0
     for line in lines:
         theirMoveStr, desiredOutcome = line.split()
         theirMove = MoveType.from_str(theirMoveStr)
         ourMove = theirMove.deriveMove(desiredOutcome)
         score += ourMove.scoreAgainst(theirMove)
-    print(f"Calculated:  {score}")
-    if solution:
-        print(f"=> Expected: {solution}")
-    assert solution is None or score == solution
+    return score
     # @@@SNIPEND
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day2-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart1(lines, solution=15)
-
-
-with open("day2-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart1(lines, solution=14297)
-
-# Part 2
-with open("day2-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, solution=12)
-
-
-with open("day2-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, solution=10498)
+CASES = (
+    Case(1, solvePart1, "day2-input-test.txt", solution=15),
+    Case(
+        1,
+        solvePart1,
+        "day2-input.txt",
+        solution=14297,
+        reader=streamLines,
+    ),
+    Case(2, solvePart2, "day2-input-test.txt", solution=12),
+    Case(
+        2,
+        solvePart2,
+        "day2-input.txt",
+        solution=10498,
+        reader=streamLines,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Rounds of rock, paper, scissors"""
+    for _ in range(scaled(2500, scale)):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
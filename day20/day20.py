@@ -1,11 +1,7 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-import os
-from typing import Optional
-
-from rich import print  # type: ignore
+from aoc import Case, runCases, timing, trace
+from aoc.reader import InputFile
 
 
 class Program:
@@ -19,10 +15,11 @@ class Program:
     def recordSignalStrength(self) -> None:
         thisSignalStrength = self.x * self.cycle
         self.signalStrength += thisSignalStrength
-        print(
-            f"[{self.cycle:3}] recordSignalStrength of"
-            f" {thisSignalStrength}"
-        )
+        if trace.detail:
+            trace.richPrint(
+                f"[{self.cycle:3}] recordSignalStrength of"
+                f" {thisSignalStrength}"
+            )
 
     def advanceCycle(self, cycleCost: int) -> None:
         assert (
@@ -37,20 +34,22 @@ class Program:
                 self.recordSignalStrength()
 
     def addx(self, value: int) -> None:
-        print(f"[{self.cycle:3}] addx {value}")
+        if trace.detail:
+            trace.richPrint(f"[{self.cycle:3}] addx {value}")
         self.advanceCycle(1)
         self.x += value
         self.advanceCycle(1)
 
     def noop(self) -> None:
-        print(f"[{self.cycle:3}] noop")
+        if trace.detail:
+            trace.richPrint(f"[{self.cycle:3}] noop")
         cycleCost = 1
         self.advanceCycle(cycleCost)
 
 
 class Number:
-    def __init__(self, value: str, decryptionKey: int = 1) -> None:
-        self.value = int(value) * decryptionKey
+    def __init__(self, value: int, decryptionKey: int = 1) -> None:
+        self.value = value * decryptionKey
 
     def __repr__(self) -> str:
         return f"{self.value}"
@@ -66,79 +65,79 @@ def move(numbers: list[Number], numberToMove: Number) -> None:
 
 
 def solve(
-    lines: list[str],
+    inputFile: InputFile,
     times: int = 1,
     decryptionKey: int = 1,
-    solution: Optional[int] = None,
-) -> None:
-    input = list()
-    zero = None
-    # Read in data
-    for line in lines:
-        n = Number(line, decryptionKey)
-        input.append(n)
-        if line == "0":
-            zero = n
+) -> int:
+    with timing.phase("parse"):
+        input = list()
+        zero = None
+        # Read in data
+        for value in inputFile.intArray():
+            n = Number(value, decryptionKey)
+            input.append(n)
+            if value == 0:
+                zero = n
     assert zero is not None
 
-    initialInput = input[:]
-    for _ in range(times):
-        for n in initialInput:
-            move(input, n)
+    with timing.phase("mix"):
+        initialInput = input[:]
+        for _ in range(times):
+            for n in initialInput:
+                move(input, n)
 
-    print(f"Final is {input}")
+    if trace.summary:
+        trace.richPrint(f"Final is {input}")
     zi = input.index(zero)
-    print(f"Zero is at index {zi}")
+    if trace.summary:
+        trace.richPrint(f"Zero is at index {zi}")
 
     s = 0
     for x in (1000, 2000, 3000):
         v = input[(zi + x) % (len(input) - 0)]
         s += v.value
-        print(f"{x} is {v}")
-    print(s)
+        if trace.summary:
+            trace.richPrint(f"{x} is {v}")
+    if trace.summary:
+        trace.richPrint(s)
 
-    print(f"Calculated:  {s}")
-    print(f"=> Expecting {solution}")
-    assert s == solution
+    return s
 
 
-if __name__ == "__main__":
-    os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
+CASES = (
     # Part 1
-    with open(
-        "day20-input-test.txt", "r", encoding="utf-8"
-    ) as inputFile:
-        lines = inputFile.read().splitlines()
-    solve(
-        lines,
+    Case(
+        1,
+        solve,
+        "day20-input-test.txt",
         solution=3,
-    )
-
-    with open("day20-input.txt", "r", encoding="utf-8") as inputFile:
-        lines = inputFile.read().splitlines()
-    solve(
-        lines,
+        reader=InputFile.open,
+    ),
+    Case(
+        1,
+        solve,
+        "day20-input.txt",
         solution=10831,
-    )
-
+        reader=InputFile.open,
+    ),
     # Part 2
-    with open(
-        "day20-input-test.txt", "r", encoding="utf-8"
-    ) as inputFile:
-        lines = inputFile.read().splitlines()
-    solve(
-        lines,
-        times=10,
-        decryptionKey=811589153,
+    Case(
+        2,
+        solve,
+        "day20-input-test.txt",
         solution=1623178306,
-    )
-
-    with open("day20-input.txt", "r", encoding="utf-8") as inputFile:
-        lines = inputFile.read().splitlines()
-    solve(
-        lines,
-        times=10,
-        decryptionKey=811589153,
+        kwargs=dict(times=10, decryptionKey=811589153),
+        reader=InputFile.open,
+    ),
+    Case(
+        2,
+        solve,
+        "day20-input.txt",
         solution=6420481789383,
-    )
+        kwargs=dict(times=10, decryptionKey=811589153),
+        reader=InputFile.open,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """An encrypted file of numbers, exactly one of which is zero"""
+    count = scaled(5000, scale, minimum=2)
+    zero = rng.randrange(count)
+    for i in range(count):
+        if i == zero:
+            yield "0"
+        else:
+            yield str(rng.choice((-1, 1)) * rng.randint(1, 10000))
@@ -1,5 +1,3 @@
-#!/usr/bin/env python3
-
 # type: ignore
 
 # mypy typing is a bit of a pain in this solution
@@ -12,11 +10,9 @@
 from __future__ import annotations
 import operator
 
-import os
 import re
-import logging
 
-logging.basicConfig(format="%(message)s", level=logging.INFO)
+from aoc import Case, runCases, timing, trace
 
 
 def operatorConst(left, right):
@@ -171,100 +167,110 @@ class Node:
 
     def substitute(self, nodes):
         if isinstance(self.left, str):
-            logging.debug(f"Substituting left node of '{self.left}'")
+            if trace.detail:
+                print(f"Substituting left node of '{self.left}'")
             self.left = self._substitute(self.left, nodes)
-            logging.debug(f"=> Received '{self.left}'")
+            if trace.detail:
+                print(f"=> Received '{self.left}'")
             if isinstance(self.left, Node):
                 self.left.substitute(nodes)
         if isinstance(self.right, str):
-            logging.debug(
-                f"Substituting right node of '{self.right}'"
-            )
+            if trace.detail:
+                print(f"Substituting right node of '{self.right}'")
             self.right = self._substitute(self.right, nodes)
-            logging.debug(f"=> Received '{self.right}'")
+            if trace.detail:
+                print(f"=> Received '{self.right}'")
             if isinstance(self.right, Node):
                 self.right.substitute(nodes)
 
 
-def solve(lines, part1, solution) -> None:
-    pattern = re.compile(r"(\S+): (.*)")
-    nodes = dict()
-    for _, line in enumerate(lines):
-        m = pattern.match(line)
-        name = m.group(1)
-        value = m.group(2).split()
-        if part1 is False:
-            if name == "root":
-                value[1] = "="
-            if name == "humn":
-                value = (None, operatorSymbol, None)
-        if len(value) == 1:
-            value = (int(value[0]),)
-            node = Node(name, operatorConst, value[0])
-        else:
-            node = Node(name, value[1], value[0], value[2])
-        nodes[node.name] = node
-        logging.debug(node)
+def solve(lines, part1) -> int:
+    with timing.phase("parse"):
+        pattern = re.compile(r"(\S+): (.*)")
+        nodes = dict()
+        for _, line in enumerate(lines):
+            m = pattern.match(line)
+            name = m.group(1)
+            value = m.group(2).split()
+            if part1 is False:
+                if name == "root":
+                    value[1] = "="
+                if name == "humn":
+                    value = (None, operatorSymbol, None)
+            if len(value) == 1:
+                value = (int(value[0]),)
+                node = Node(name, operatorConst, value[0])
+            else:
+                node = Node(name, value[1], value[0], value[2])
+            nodes[node.name] = node
+            if trace.detail:
+                print(node)
 
     if part1:
         root = nodes["root"]
-        root.substitute(nodes)
-        root.operate()
+        with timing.phase("substitute"):
+            root.substitute(nodes)
+        with timing.phase("operate"):
+            root.operate()
         assert root.op == operatorConst
         calculated = int(root.left)
     else:
         root = nodes["root"]
-        logging.debug("-" * 10)
-        root.substitute(nodes)
-        logging.debug("-" * 10)
-        for _ in range(500):
+        if trace.detail:
+            print("-" * 10)
+        with timing.phase("substitute"):
+            root.substitute(nodes)
+        if trace.detail:
+            print("-" * 10)
+        with timing.phase("operate"):
+            for _ in range(500):
+                root.operate()
+                if trace.detail:
+                    print("-" * 10)
             root.operate()
-            logging.debug("-" * 10)
-        root.operate()
         assert root.op == operatorEqual
         if root.left.name == "humn":
             calculated = int(root.right.left)
         else:
             calculated = int(root.left.left)
 
-    logging.info(f"Calculated is {calculated}")
-    logging.info(f"=> Expecting  {solution}")
-    assert calculated == solution
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day21-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    solution=152,
-)
-
-with open("day21-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=True,
-    solution=155708040358220,
+    if trace.summary:
+        print(f"Calculated is {calculated}")
+    return calculated
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day21-input-test.txt",
+        solution=152,
+        kwargs=dict(part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day21-input.txt",
+        solution=155708040358220,
+        kwargs=dict(part1=True),
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day21-input-test.txt",
+        solution=301,
+        kwargs=dict(part1=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day21-input.txt",
+        solution=3342154812537,
+        kwargs=dict(part1=False),
+    ),
 )
 
-
-# Part 2
-with open("day21-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    solution=301,
-)
-
-with open("day21-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    part1=False,
-    solution=3342154812537,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+# Part 2 peels one operation off the path down to `humn` in each of a
+# fixed 500 passes, and the solver recurses once per level of the tree
+MAX_DEPTH = 400
+# Keep values exactly representable, as the solver uses true division
+MAX_VALUE = 2**40
+
+
+class Namer:
+    def __init__(self, rng: random.Random) -> None:
+        names = [
+            "".join(name)
+            for name in itertools.product(
+                string.ascii_lowercase, repeat=4
+            )
+        ]
+        names.remove("root")
+        names.remove("humn")
+        rng.shuffle(names)
+        self.names = iter(names)
+
+    def __call__(self) -> str:
+        return next(self.names)
+
+
+def split(rng: random.Random, value: int) -> tuple[int, str, int]:
+    """Choose an operation and a pair of operands which give
+    `value`"""
+    while True:
+        op = rng.choice("+-*/")
+        if op == "+" and value >= 2:
+            left = rng.randint(1, value - 1)
+            return left, op, value - left
+        if op == "-":
+            right = rng.randint(1, 100)
+            if value + right < MAX_VALUE:
+                return value + right, op, right
+        if op == "*":
+            divisors = [d for d in range(2, 20) if value % d == 0]
+            if divisors:
+                right = rng.choice(divisors)
+                return value // right, op, right
+        if op == "/":
+            right = rng.randint(2, 10)
+            if value * right < MAX_VALUE:
+                return value * right, op, right
+
+
+def expression(
+    rng: random.Random,
+    name: str,
+    value: int,
+    size: int,
+    namer: Namer,
+) -> Iterator[str]:
+    """Yield monkeys which yell `value` between them, from a balanced
+    tree of `size` operations"""
+    stack = [(name, value, size)]
+    while stack:
+        name, value, size = stack.pop()
+        if not size:
+            yield f"{name}: {value}"
+            continue
+        left, op, right = split(rng, value)
+        leftName, rightName = namer(), namer()
+        yield f"{name}: {leftName} {op} {rightName}"
+        leftSize = (size - 1) // 2
+        stack.append((leftName, left, leftSize))
+        stack.append((rightName, right, size - 1 - leftSize))
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Monkeys yelling a tree of expressions, where `humn` sits deep
+    in one half of `root` and both halves give the same value
+
+    As the halves are equal, the number `humn` yells is also the
+    answer to part 2.
+    """
+    namer = Namer(rng)
+    operations = scaled(1260, scale, minimum=2)
+    depth = min(scaled(70, scale), MAX_DEPTH)
+    # Share out the operations which aren't on the path to `humn`
+    # among the expressions hanging off it
+    sizes = [0] * (depth + 1)
+    for _ in range(max(0, operations - depth - 1)):
+        sizes[rng.randrange(depth + 1)] += 1
+
+    half = rng.randint(1000, 100000)
+    path, other = namer(), namer()
+    monkeys = [f"root: {path} + {other}"]
+    monkeys.extend(expression(rng, other, half, sizes.pop(), namer))
+
+    # Walk down from `root` towards `humn`, hanging an expression
+    # off the other side at each step
+    value = half
+    for i, size in enumerate(sizes):
+        left, op, right = split(rng, value)
+        nextPath = "humn" if i == len(sizes) - 1 else namer()
+        other = namer()
+        # The solver can only undo division by a known divisor
+        if op == "/" or rng.random() < 0.5:
+            monkeys.append(f"{path}: {nextPath} {op} {other}")
+            value, otherValue = left, right
+        else:
+            monkeys.append(f"{path}: {other} {op} {nextPath}")
+            value, otherValue = right, left
+        monkeys.extend(
+            expression(rng, other, otherValue, size, namer)
+        )
+        path = nextPath
+    monkeys.append(f"humn: {value}")
+
+    rng.shuffle(monkeys)
+    yield from monkeys
@@ -1,294 +1,191 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-from dataclasses import dataclass
-import logging
-import os
-from collections import defaultdict
-from typing import Optional, Sequence
-
-logging.basicConfig(format="%(message)s", level=logging.INFO)
-
-
-@dataclass(frozen=True)
-class Plan:
-    source: Pos
-    destination: Pos
-
-
-@dataclass(frozen=True)
-class Pos:
-    y: int
-    x: int
-
-    def north(self) -> Sequence[Pos]:
-        return (
-            Pos(self.y - 1, self.x - 1),
-            Pos(self.y - 1, self.x + 0),
-            Pos(self.y - 1, self.x + 1),
-        )
-
-    def south(self) -> Sequence[Pos]:
-        return (
-            Pos(self.y + 1, self.x - 1),
-            Pos(self.y + 1, self.x + 0),
-            Pos(self.y + 1, self.x + 1),
-        )
-
-    def east(self) -> Sequence[Pos]:
-        return (
-            Pos(self.y - 1, self.x + 1),
-            Pos(self.y + 0, self.x + 1),
-            Pos(self.y + 1, self.x + 1),
-        )
-
-    def west(self) -> Sequence[Pos]:
-        return (
-            Pos(self.y - 1, self.x - 1),
-            Pos(self.y + 0, self.x - 1),
-            Pos(self.y + 1, self.x - 1),
-        )
+from typing import Optional
 
-    def all(self) -> Sequence[Pos]:
-        ret = list(self.north())
-        ret.extend(self.south())
-        # For east and west, only need pure-east and pure-west
-        ret.extend(self.east()[1:2])
-        ret.extend(self.west()[1:2])
-        return ret
+import numpy as np
+import numpy.typing as npt
 
+from aoc import Case, metrics, runCases, timing, trace
+from aoc.grid import NEIGHBOURS_DIAGONAL, Grid, boundingBox, shift
 
-def score(table: defaultdict[Pos, str]) -> int:
-    minX = None
-    maxX = None
-    minY = None
-    maxY = None
-    for pos, v in list(table.items()):
-        if v == "#":
-            if minX is None or minX > pos.x:
-                minX = pos.x
-            if minY is None or minY > pos.y:
-                minY = pos.y
-
-            if maxX is None or maxX < pos.x:
-                maxX = pos.x
-            if maxY is None or maxY < pos.y:
-                maxY = pos.y
+# The directions in the order they're considered in the first round:
+# the name, the move, and the three positions which must be free of
+# elves for that move to be proposed
+DIRECTIONS = (
+    ("north", (-1, 0), ((-1, -1), (-1, 0), (-1, 1))),
+    ("south", (1, 0), ((1, -1), (1, 0), (1, 1))),
+    ("west", (0, -1), ((-1, -1), (0, -1), (1, -1))),
+    ("east", (0, 1), ((-1, 1), (0, 1), (1, 1))),
+)
 
-    s = 0
-    assert minX is not None
-    assert maxX is not None
-    assert minY is not None
-    assert maxY is not None
-    for y in range(minY, maxY + 1):
-        for x in range(minX, maxX + 1):
-            v = table[Pos(y=y, x=x)]
-            if v == ".":
-                s += 1
+# How much to grow the map by whenever the elves reach its edge
+GROWTH = 16
 
-    return s
+ROUNDS = metrics.counter("day23_rounds_total", "Rounds simulated")
+MOVES = metrics.counter("day23_moves_total", "Moves made by elves")
+MAP_CELLS = metrics.gauge(
+    "day23_map_cells", "Cells in the map, which grows with the elves"
+)
 
 
-def printMap(table: defaultdict[Pos, str]) -> None:
-    minX = None
-    maxX = None
-    minY = None
-    maxY = None
-    for pos, v in list(table.items()):
-        if v == "#":
-            if minX is None or minX > pos.x:
-                minX = pos.x
-            if minY is None or minY > pos.y:
-                minY = pos.y
+def score(elves: npt.NDArray[np.bool_]) -> int:
+    box = boundingBox(elves)
+    assert box is not None
+    minY, maxY, minX, maxX = box
+    area = (maxY - minY + 1) * (maxX - minX + 1)
+    return area - int(elves.sum())
 
-            if maxX is None or maxX < pos.x:
-                maxX = pos.x
-            if maxY is None or maxY < pos.y:
-                maxY = pos.y
 
+def printMap(elves: npt.NDArray[np.bool_]) -> None:
+    box = boundingBox(elves)
+    assert box is not None
+    minY, maxY, minX, maxX = box
     margin = 2
-    assert minX is not None
-    assert maxX is not None
-    assert minY is not None
-    assert maxY is not None
-    for y in range(minY - margin, maxY + 1 + margin):
-        for x in range(minX - margin, maxX + 1 + margin):
-            print(table[Pos(y=y, x=x)], end="")
-        print()
+    cells = np.where(elves, ord("#"), ord("."))
+    grid = Grid(cells).padded(margin, ord("."))
+    for line in grid.toLines()[minY : maxY + 1 + 2 * margin]:
+        print(line[minX : maxX + 1 + 2 * margin])
     print()
 
 
+@timing.timed("spread")
+def spread(
+    elves: npt.NDArray[np.bool_], round: int
+) -> Optional[npt.NDArray[np.bool_]]:
+    """Return where `elves` are after `round`, or `None` if none of
+    them moved"""
+    # Keep a border of empty ground, so that every elf can move
+    # without falling off the edge of the map
+    if (
+        elves[0].any()
+        or elves[-1].any()
+        or elves[:, 0].any()
+        or elves[:, -1].any()
+    ):
+        elves = np.pad(elves, GROWTH, constant_values=False)
+
+    # Whether there's an elf (dy, dx) from each position
+    around = {
+        (dy, dx): shift(elves, -dy, -dx, False)
+        for dy, dx in NEIGHBOURS_DIAGONAL
+    }
+    # Elves only move if there's another elf around them
+    movable = elves & np.logical_or.reduce(list(around.values()))
+
+    proposals = []
+    proposed = np.zeros_like(elves)
+    # How many elves propose moving to each position
+    destinations = np.zeros(elves.shape, dtype=np.int8)
+    for i in range(4):
+        name, (dy, dx), checks = DIRECTIONS[((round - 1) + i) % 4]
+        free = ~(
+            around[checks[0]] | around[checks[1]] | around[checks[2]]
+        )
+        proposers = movable & free & ~proposed
+        if trace.detail:
+            print(f"  {proposers.sum()} elves propose going {name}")
+        proposed |= proposers
+        proposals.append((proposers, dy, dx))
+        destinations += shift(proposers, dy, dx, False)
+
+    if not proposed.any():
+        if trace.step:
+            print(f"=> All elves stopped moving at round {round}")
+        return None
+
+    # Do moves, except where several elves proposed the same
+    # destination
+    uncontested = destinations == 1
+    moved = np.zeros_like(elves)
+    arrived = np.zeros_like(elves)
+    for proposers, dy, dx in proposals:
+        movers = proposers & shift(uncontested, -dy, -dx, False)
+        moved |= movers
+        arrived |= shift(movers, dy, dx, False)
+    elves = (elves & ~moved) | arrived
+    ROUNDS.inc()
+    MOVES.inc(int(moved.sum()))
+    MAP_CELLS.set(elves.size)
+    if trace.step:
+        print(f"=> {moved.sum()} elves moved this round")
+        print(f"Round {round} complete")
+    if trace.detail:
+        printMap(elves)
+    return elves
+
+
 def solve(
     lines: list[str],
     rounds: Optional[int],
-    solutionEmptyGroundTiles: Optional[int],
-    solutionRoundCompletion: Optional[int],
-) -> None:
-    table: defaultdict[Pos, str] = defaultdict(lambda: ".")
-    for y, line in enumerate(lines, start=0):
-        for x, v in enumerate(line, start=0):
-            pos = Pos(y=y, x=x)
-            # TODO: Consider having true/false indicate elf presence
-            # and not storing empty spots
-            table[pos] = v
-
-    shouldPrintMap = False
-
+) -> int:
+    """Simulate the elves spreading out for `rounds` rounds,
+    returning the number of empty ground tiles (part 1),
+    or until they stop moving if `rounds` is `None`,
+    returning the round at which that happened (part 2)"""
+    with timing.phase("parse"):
+        elves = Grid.fromLines(lines).cells == ord("#")
+
+    untilStopped = rounds is None
     if rounds is None:
         rounds = 100000
 
     for round in range(1, rounds + 1):
-        logging.info(f"Simulating round {round}...")
-        plans: dict[Pos, Optional[Plan]] = dict()
-        for pos, v in list(table.items()):
-            if v == "#":
-                logging.debug(f"\n[{pos}] Calculating move")
-                # Check around
-                allPos = pos.all()
-                for cc in allPos:
-                    if table[cc] == "#":
-                        logging.debug(
-                            f"  [{pos}] There is an elf around"
-                        )
-                        around = True
-                        break
-                else:
-                    logging.debug(
-                        f"  [{pos}] There isn't an elf around"
-                    )
-                    around = False
-                # Propose
-                if around:
-                    # four cardinal directions
-                    for i in range(4):
-                        match ((round - 1) + i) % 4:
-                            case 0:
-                                direction = pos.north
-                            case 1:
-                                direction = pos.south
-                            case 2:
-                                direction = pos.west
-                            case 3:
-                                direction = pos.east
-                            case _:
-                                assert False
-                        logging.debug(
-                            f"  [{pos}] Checking {direction.__name__}"
-                        )
-                        c = direction()
-                        for cc in c:
-                            if table[cc] == "#":
-                                logging.debug(
-                                    f"    [{pos}] There is an elf"
-                                    " in the"
-                                    f" {direction.__name__} direction"
-                                    " so NOT going to propose a"
-                                    " move"
-                                )
-                                move = False
-                                break
-                        else:
-                            logging.debug(
-                                f"    [{pos}] There isn't an elf"
-                                " in the"
-                                f" {direction.__name__} direction"
-                                " so going to propose a move via"
-                                f" {direction.__name__}"
-                            )
-                            move = True
-
-                        if move:
-                            # When moving, we only move in one of the four cardinal directions
-                            # which corresponds with the middle value in the tuple we receive
-                            _, dest, _ = direction()
-                            logging.debug(
-                                f"  [{pos}] Proposing move to {dest}"
-                            )
-                            if dest in plans:
-                                plans[dest] = None
-                            else:
-                                thisPlan = Plan(
-                                    source=pos, destination=dest
-                                )
-                                plans[dest] = thisPlan
-                            break
-        # Do moves
-        for p in plans.values():
-            if p is None:
-                continue
-            logging.debug(
-                f"Moving elf from {p.source} to {p.destination}"
-            )
-            assert table[p.source] == "#"
-            table[p.source] = "."
-            assert table[p.destination] == "."
-            table[p.destination] = "#"
-        logging.info(f"=> {len(plans)} elves moved this round")
-        if len(plans) == 0:
-            logging.info(
-                f"=> All elves stopped moving at round {round}"
-            )
+        if trace.step:
+            print(f"Simulating round {round}...")
+        nextElves = spread(elves, round)
+        if nextElves is None:
             break
-        plans.clear()
-        logging.info(f"Round {round} complete")
-        if shouldPrintMap:
-            printMap(table)
-
-    logging.info(f"Completed after round {round}")
-    if solutionRoundCompletion is not None:
-        logging.info(
-            f"=> Expected solution: {solutionRoundCompletion}"
-        )
-        assert round == solutionRoundCompletion
-
-    emptyGroundTiles = score(table)
-    logging.info(
-        f"Calculated empty ground tiles:  {emptyGroundTiles}"
-    )
-    if solutionEmptyGroundTiles is not None:
-        logging.info(
-            f"=> Expected solution: {solutionEmptyGroundTiles}"
-        )
-        assert emptyGroundTiles == solutionEmptyGroundTiles
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day23-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=10,
-    solutionEmptyGroundTiles=110,
-    solutionRoundCompletion=None,
-)
-
-with open("day23-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=10,
-    solutionEmptyGroundTiles=4075,
-    solutionRoundCompletion=None,
-)
-
-# Part 2
-with open("day23-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=None,
-    solutionEmptyGroundTiles=None,
-    solutionRoundCompletion=20,
+        elves = nextElves
+
+    if trace.summary:
+        print(f"Completed after round {round}")
+    if untilStopped:
+        return round
+
+    with timing.phase("score"):
+        emptyGroundTiles = score(elves)
+    if trace.summary:
+        print(f"Calculated empty ground tiles:  {emptyGroundTiles}")
+    return emptyGroundTiles
+
+
+# Bytes the full input may take to read or solve, with room to spare
+MEMORY_BUDGET = 2 * 2**20
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day23-input-test.txt",
+        solution=110,
+        kwargs=dict(rounds=10),
+    ),
+    Case(
+        1,
+        solve,
+        "day23-input.txt",
+        solution=4075,
+        kwargs=dict(rounds=10),
+        memoryBudget=MEMORY_BUDGET,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day23-input-test.txt",
+        solution=20,
+        kwargs=dict(rounds=None),
+    ),
+    Case(
+        2,
+        solve,
+        "day23-input.txt",
+        solution=950,
+        kwargs=dict(rounds=None),
+        memoryBudget=MEMORY_BUDGET,
+    ),
 )
 
-with open("day23-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    rounds=None,
-    solutionEmptyGroundTiles=None,
-    solutionRoundCompletion=950,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaledSide
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A square scan of the grove with elves on about half of the
+    ground"""
+    side = scaledSide(72, scale)
+    for _ in range(side):
+        yield "".join(rng.choice("#.") for _ in range(side))
@@ -1,241 +1,189 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-from dataclasses import dataclass
-import os
-from collections import defaultdict
-from typing import Sequence
-
-
-@dataclass(frozen=True)
-class Pos:
-    y: int
-    x: int
+import math
 
-    def left(self) -> Pos:
-        return Pos(self.y, self.x - 1)
+import numpy as np
+import numpy.typing as npt
 
-    def right(self) -> Pos:
-        return Pos(self.y, self.x + 1)
+from aoc import (
+    Case,
+    intermediates,
+    metrics,
+    runCases,
+    timing,
+    trace,
+)
+from aoc.bitgrid import BitGrid
+from aoc.grid import Grid
+
+# How each kind of blizzard moves, as (dy, dx)
+BLIZZARDS = {
+    "<": (0, -1),
+    ">": (0, 1),
+    "^": (-1, 0),
+    "v": (1, 0),
+}
+
+MINUTES = metrics.counter("day24_minutes_total", "Minutes searched")
+REACHABLE = metrics.histogram(
+    "day24_reachable_positions",
+    "Positions reachable at the end of each minute",
+)
 
-    def up(self) -> Pos:
-        return Pos(self.y - 1, self.x)
 
-    def down(self) -> Pos:
-        return Pos(self.y + 1, self.x)
+class Table:
+    def __init__(self, grid: Grid) -> None:
+        self.walls: npt.NDArray[np.bool_] = grid.cells == ord("#")
+        self.maxY = grid.height - 1
+        self.maxX = grid.width - 1
+        # Blizzards wrap around within the walls, so they're kept
+        # separately for each direction, without the walls
+        inside = grid.cells[1:-1, 1:-1]
+        self.blizzards = {c: inside == ord(c) for c in BLIZZARDS}
 
-    def all(self) -> Sequence[Pos]:
-        return tuple(
-            (
-                self.left(),
-                self.right(),
-                self.up(),
-                self.down(),
-                # Include wait
-                self,
+    def sim(self) -> None:
+        for c, (dy, dx) in BLIZZARDS.items():
+            self.blizzards[c] = np.roll(
+                self.blizzards[c], (dy, dx), axis=(0, 1)
             )
-        )
-
 
-class Table:
-    def __init__(self) -> None:
-        self.map: defaultdict[Pos, list[str]] = defaultdict(list)
-        self.maxX = 0
-        self.maxY = 0
-        self.positions = list()
-        self.positions.append(Pos(y=0, x=1))
-
-    def inBounds(self, pos: Pos) -> bool:
-        if pos.x < 0 or pos.x > self.maxX:
-            return False
-        if pos.y < 0 or pos.y > self.maxY:
-            return False
-        return True
-
-    def inWall(self, pos: Pos) -> bool:
-        assert self.inBounds(pos)
-        if pos.y == 0 and pos.x == 1:
-            return False
-        if pos.y == self.maxY and pos.x == self.maxX - 1:
-            return False
-
-        return (
-            pos.y == 0
-            or pos.y == self.maxY
-            or pos.x == 0
-            or pos.x == self.maxX
-        )
-
-    def wrapAroundWall(self, pos: Pos) -> Pos:
-        assert self.inWall(pos)
-        if pos.y == 0:
-            pos = Pos(y=self.maxY - 1, x=pos.x)
-        elif pos.y == self.maxY:
-            pos = Pos(y=1, x=pos.x)
-        elif pos.x == 0:
-            pos = Pos(y=pos.y, x=self.maxX - 1)
-        elif pos.x == self.maxX:
-            pos = Pos(y=pos.y, x=1)
-        else:
-            assert False
-        return pos
-
-    def inBlizzardInNextStep(self, pos: Pos) -> bool:
-        assert self.inBounds(pos)
-        nextPos = self.get(pos)
-        for c in ("<", ">", "^", "v"):
-            if c in nextPos:
-                return True
-        else:
-            return False
-
-    def set(self, pos: Pos, value: str) -> None:
-        prev = self.map[pos]
-        currentLen = len(prev)
-        assert currentLen == 0
-        self.map[pos].append(value)
-        if "#" == value:
-            if pos.x > self.maxX:
-                self.maxX = pos.x
-            if pos.y > self.maxY:
-                self.maxY = pos.y
-
-    def append(self, pos: Pos, value: str) -> None:
-        prev = self.map[pos]
-        assert "#" not in prev
-        self.map[pos].append(value)
-
-    def get(self, pos: Pos) -> list[str]:
-        targetData = self.map.get(pos, None)
-        if targetData is None:
-            return list(".")
-        else:
-            return targetData
+    def blocked(self) -> npt.NDArray[np.bool_]:
+        """Return a mask of the walls and the blizzards"""
+        blocked = self.walls.copy()
+        for blizzards in self.blizzards.values():
+            blocked[1:-1, 1:-1] |= blizzards
+        return blocked
+
+
+class ClearEachMinute:
+    """The cells clear of walls and blizzards at the end of each
+    minute, simulated as far as they've been asked for
+
+    The blizzards are back where they started after `cycle` minutes,
+    so no more than that are ever simulated.
+    """
+
+    def __init__(self, table: Table, bits: BitGrid) -> None:
+        self.table = table
+        self.bits = bits
+        self.cycle = math.lcm(table.maxY - 1, table.maxX - 1)
+        self.known: list[int] = []
+
+    def __getitem__(self, minute: int) -> int:
+        minute %= self.cycle
+        if len(self.known) <= minute:
+            with timing.phase("sim"):
+                while len(self.known) <= minute:
+                    self.table.sim()
+                    self.known.append(
+                        self.bits.fromMask(~self.table.blocked())
+                    )
+        return self.known[minute]
+
+
+def clearEachMinute(lines: list[str]) -> list[int]:
+    """Return the cells clear of walls and blizzards at the end of
+    each minute, until the blizzards are back where they started"""
+    table = Table(Grid.fromLines(lines))
+    clear = ClearEachMinute(
+        table, BitGrid(table.maxY + 1, table.maxX + 1)
+    )
+    return [clear[minute] for minute in range(clear.cycle)]
+
+
+def solve(lines: list[str], trips: int) -> int:
+    with timing.phase("parse"):
+        table = Table(Grid.fromLines(lines))
+    bits = BitGrid(table.maxY + 1, table.maxX + 1)
+    clear = ClearEachMinute(table, bits)
+    # Both parts, and every trip, go through the same blizzards, so
+    # when caching they're worked out once and kept between runs.
+    # Otherwise only the minutes the search gets to are simulated.
+    if intermediates.directory is not None:
+        with timing.phase("sim"):
+            clear.known = intermediates.cached(
+                "day24-clear",
+                1,
+                lines,
+                lambda: clearEachMinute(lines),
+            )
 
-    def sim(self) -> None:
-        previous = self.map.copy()
-        self.map.clear()
-        # Do a first pass to set the walls
-        for pos, vList in previous.items():
-            for v in vList:
-                if v == "#":
-                    self.set(pos, v)
-        # Find and move the blizzards
-        for pos, vList in previous.items():
-            nextPos = None
-            for v in vList:
-                match v:
-                    case "#":
-                        continue
-                    case ".":
-                        # Just drop the empty spots
-                        continue
-                    case ">":
-                        nextPos = pos.right()
-                    case "<":
-                        nextPos = pos.left()
-                    case "^":
-                        nextPos = pos.up()
-                    case "v":
-                        nextPos = pos.down()
-                    case _:
-                        assert False
-                if nextPos:
-                    if self.inWall(nextPos):
-                        nextPos2 = self.wrapAroundWall(nextPos)
-                        nextPos = nextPos2
-                    else:
-                        pass
-                    self.append(nextPos, v)
-
-
-def solve(lines: list[str], trips: int, solutionMinutes: int) -> None:
-    table = Table()
-    for y, line in enumerate(lines, start=0):
-        for x, v in enumerate(line, start=0):
-            pos = Pos(y=y, x=x)
-            if v != ".":
-                table.set(pos, v)
-
-    initialPos = Pos(y=0, x=1)
-    finalPos = Pos(y=table.maxY, x=table.maxX - 1)
+    initialPos = (0, 1)
+    finalPos = (table.maxY, table.maxX - 1)
     targetPos = finalPos
 
-    statesToCheck = set([initialPos])
-    stage = 0
-    for minute in range(1000):
-        # Map should always reflect next blizzard state
-        table.sim()
-        statesToCheckNext = set()
-        assert len(statesToCheck) > 0, "No states to check?"
-        for thisPos in statesToCheck:
-            for nextPos in thisPos.all():
-                if not table.inBounds(nextPos):
-                    continue
-                if table.inWall(nextPos):
-                    continue
-                if table.inBlizzardInNextStep(nextPos):
-                    continue
-                statesToCheckNext.add(nextPos)
-        if targetPos in statesToCheckNext:
-            print(
-                f"Got to {targetPos} at min {minute + 1};"
-                f" stage={stage}"
+    with timing.phase("bfs"):
+        statesToCheck = bits.bit(*initialPos)
+        stage = 0
+        for minute in range(1000):
+            assert statesToCheck, "No states to check?"
+            # Move in any direction or wait, wherever's clear
+            statesToCheckNext = (
+                bits.spread(statesToCheck) & clear[minute]
             )
-            statesToCheckNext.clear()
-            statesToCheckNext.add(targetPos)
-            stage += 1
-            if targetPos == finalPos:
-                targetPos = initialPos
-            else:
-                targetPos = finalPos
-            if stage == trips:
+            reachable = statesToCheckNext.bit_count()
+            MINUTES.inc()
+            REACHABLE.observe(reachable)
+            if trace.step:
                 print(
-                    "=> Found new best solution after"
-                    f" {minute + 1} minutes"
+                    f"Minute {minute + 1}: {reachable} positions"
+                    " reachable"
                 )
-                print(
-                    "=> Expecting                    "
-                    f" {solutionMinutes} minutes"
-                )
-                assert minute + 1 == solutionMinutes
-                return
-        statesToCheck = statesToCheckNext
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day24-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionMinutes=18,
-    trips=1,
+            if statesToCheckNext & bits.bit(*targetPos):
+                if trace.summary:
+                    print(
+                        f"Got to {targetPos} at min {minute + 1};"
+                        f" stage={stage}"
+                    )
+                statesToCheckNext = bits.bit(*targetPos)
+                stage += 1
+                if targetPos == finalPos:
+                    targetPos = initialPos
+                else:
+                    targetPos = finalPos
+                if stage == trips:
+                    if trace.summary:
+                        print(
+                            "=> Found new best solution after"
+                            f" {minute + 1} minutes"
+                        )
+                    return minute + 1
+            statesToCheck = statesToCheckNext
+    assert False, "Did not complete the trips in time"
+
+
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day24-input-test.txt",
+        solution=18,
+        kwargs=dict(trips=1),
+    ),
+    Case(
+        1,
+        solve,
+        "day24-input.txt",
+        solution=249,
+        kwargs=dict(trips=1),
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day24-input-test.txt",
+        solution=54,
+        kwargs=dict(trips=3),
+    ),
+    Case(
+        2,
+        solve,
+        "day24-input.txt",
+        solution=735,
+        kwargs=dict(trips=3),
+    ),
 )
 
-with open("day24-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionMinutes=249,
-    trips=1,
-)
-
-# Part 2
-with open("day24-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionMinutes=54,
-    trips=3,
-)
-
-with open("day24-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionMinutes=735,
-    trips=3,
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaledSide
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A walled valley full of blizzards, with the entrance at the
+    top left and the exit at the bottom right
+
+    No blizzards blow up or down the entrance and exit columns, as
+    they'd otherwise blow straight out of the valley. Note that the
+    solver gives up after 1000 minutes, which larger valleys can
+    need more than for all three trips of part 2.
+    """
+    width = scaledSide(100, scale, minimum=3)
+    height = scaledSide(35, scale, minimum=1)
+    yield "#." + "#" * width
+    for _ in range(height):
+        row = []
+        for x in range(1, width + 1):
+            blizzards = "<>" if x in (1, width) else "<>^v"
+            if rng.random() < 0.9:
+                row.append(rng.choice(blizzards))
+            else:
+                row.append(".")
+        yield "#" + "".join(row) + "#"
+    yield "#" * width + ".#"
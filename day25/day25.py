@@ -1,7 +1,9 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
-import os
+
+from typing import Iterable
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
 
 
 def numberToBaseReversed(number: int, base: int = 5) -> list[int]:
@@ -26,6 +28,10 @@ def convertOneBaseFiveDigitToSnafu(
         case 4:
             digitSnafu = "-"
             carry = 1
+        # A carry into a 4
+        case 5:
+            digitSnafu = "0"
+            carry = 1
         case _:
             assert False
     return digitSnafu, carry
@@ -67,46 +73,41 @@ def toDec(input: str) -> int:
     return number
 
 
-def solve(
-    lines: list[str], solutionSnafu: str, solutionDec: int
-) -> None:
+def solve(lines: Iterable[str]) -> str:
     s = 0
 
-    for line in lines:
-        dec = toDec(line)
-        s += dec
-        print(f"{line} converts to {dec}")
-
-    print()
-    print(f"Sum of numbers is {s}")
-    print(f"=> Expecting      {solutionDec}")
-
-    s2 = toSnafu(s)
-    print()
-    print(f"Sum converted to snafu is {s2}")
-    print(f"=> Expecting              {solutionSnafu}")
-
-    assert s == solutionDec
-    assert s2 == solutionSnafu
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day24-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionDec=4890,
-    solutionSnafu="2=-1=0",
-)
-
-with open("day24-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines,
-    solutionDec=30535047052797,
-    solutionSnafu="2=001=-2=--0212-22-2",
+    with timing.phase("sum"):
+        for line in lines:
+            dec = toDec(line)
+            s += dec
+            if trace.step:
+                print(f"{line} converts to {dec}")
+
+    if trace.summary:
+        print()
+        print(f"Sum of numbers is {s}")
+
+    with timing.phase("toSnafu"):
+        s2 = toSnafu(s)
+    if trace.summary:
+        print()
+        print(f"Sum converted to snafu is {s2}")
+    return s2
+
+
+# The sums of these in decimal are 4890 and 30535047052797
+CASES = (
+    Case(1, solve, "day24-input-test.txt", solution="2=-1=0"),
+    Case(
+        1,
+        solve,
+        "day24-input.txt",
+        solution="2=001=-2=--0212-22-2",
+        reader=streamLines,
+    ),
 )
 
 # No part 2 in this one
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Fuel requirements as SNAFU numbers of up to 20 digits"""
+    for _ in range(scaled(107, scale)):
+        digits = [rng.choice("12")]
+        digits.extend(rng.choices("=-012", k=rng.randint(0, 19)))
+        yield "".join(digits)
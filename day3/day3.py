@@ -1,8 +1,8 @@
-#!/usr/bin/env python3
-import os
-
 from itertools import zip_longest
-from typing import Optional, no_type_check
+from typing import Iterable, Optional, no_type_check
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
 
 
 # @@@SNIPSTART day3-grouper
@@ -38,7 +38,8 @@ def getScorePart1(ruckA: str, ruckB: str) -> int:
     """
     for letter in ruckA:
         if letter in ruckB:
-            print(f"=> found '{letter}' in all")
+            if trace.detail:
+                print(f"=> found '{letter}' in all")
             if letter.islower():
                 return ord(letter) - ord("a") + 1
             else:
@@ -61,7 +62,8 @@ def getScorePart2(
     """
     for letter in ruckA:
         if letter in ruckB and (ruckC is None or letter in ruckC):
-            print(f"=> found '{letter}' in all")
+            if trace.detail:
+                print(f"=> found '{letter}' in all")
             if letter.islower():
                 return ord(letter) - ord("a") + 1
             else:
@@ -70,65 +72,65 @@ def getScorePart2(
     # @@@SNIPEND
 
 
-def checkSolution(calculated: int, expected: int) -> None:
-    print("*" * 10)
-    print(f"Score is     {calculated}")
-    if expected is not None:
-        print(f"=> Expecting {expected}")
-        assert calculated == expected
-
-
+@timing.timed("score")
 # @@@SNIPSTART day3-part1
-def solvePart1(lines: list[str], expected: int) -> None:
+def solvePart1(lines: Iterable[str]) -> int:
     calculated = 0
     spacer = "=" * 10
     for i, line in enumerate(lines, start=1):
-        print(f"{spacer} Part 1: Rucksack {i} {spacer}")
         halfway = int(len(line) / 2)
         # Divide into two compartments
         firstCompartment = line[0:halfway]
         secondCompartment = line[halfway:]
-        print(firstCompartment)
-        print(secondCompartment)
+        if trace.step:
+            print(f"{spacer} Part 1: Rucksack {i} {spacer}")
+            print(firstCompartment)
+            print(secondCompartment)
         # Find the first shared letter in the compartments
         calculated += getScorePart1(
             firstCompartment, secondCompartment
         )
-    checkSolution(calculated=calculated, expected=expected)
+    return calculated
     # @@@SNIPEND
 
 
+@timing.timed("score")
 # @@@SNIPSTART day3-part2
-def solvePart2(lines: list[str], expected: int) -> None:
+def solvePart2(lines: Iterable[str]) -> int:
     calculated = 0
     spacer = "=" * 10
     # Group in strict mode so if an iteration has fewer than
     # `n` items, `grouper` asserts
     iterator = grouper(iterable=lines, n=3, incomplete="strict")
     for i, elves in enumerate(iterator, start=1):
-        print(f"{spacer} Part 2: Rucksack {i} {spacer}")
-        for elf in elves:
-            print(elf)
+        if trace.step:
+            print(f"{spacer} Part 2: Rucksack {i} {spacer}")
+            for elf in elves:
+                print(elf)
         # Find the first shared letter in the compartments
         calculated += getScorePart2(*elves)
-    checkSolution(calculated=calculated, expected=expected)
+    return calculated
     # @@@SNIPEND
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-with open("day3-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart1(lines, expected=157)
-
-with open("day3-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart1(lines, expected=7746)
-
-with open("day3-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, expected=70)
-
-with open("day3-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solvePart2(lines, expected=2604)
+CASES = (
+    Case(1, solvePart1, "day3-input-test.txt", solution=157),
+    Case(
+        1,
+        solvePart1,
+        "day3-input.txt",
+        solution=7746,
+        reader=streamLines,
+    ),
+    Case(2, solvePart2, "day3-input-test.txt", solution=70),
+    Case(
+        2,
+        solvePart2,
+        "day3-input.txt",
+        solution=2604,
+        reader=streamLines,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
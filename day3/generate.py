@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+ITEMS = string.ascii_letters
+
+
+def rucksack(rng: random.Random, items: list[str], badge: str) -> str:
+    """Pack a rucksack from `items` and `badge` whose compartments
+    share exactly one item type"""
+    pool = items + [badge]
+    shared = rng.choice(pool)
+    others = [item for item in pool if item != shared]
+    rng.shuffle(others)
+    split = rng.randint(1, len(others) - 1)
+    left, right = others[:split], others[split:]
+    size = rng.randint(4, 24)
+    # Make sure the badge is packed into one compartment or other
+    leftItems = [shared] + [rng.choice(left) for _ in range(size - 1)]
+    rightItems = [shared] + [
+        rng.choice(right) for _ in range(size - 1)
+    ]
+    if badge in left:
+        leftItems[-1] = badge
+    elif badge in right:
+        rightItems[-1] = badge
+    rng.shuffle(leftItems)
+    rng.shuffle(rightItems)
+    return "".join(leftItems + rightItems)
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Groups of three rucksacks, where each group has exactly one
+    item type in common"""
+    for _ in range(scaled(100, scale)):
+        badge = rng.choice(ITEMS)
+        # Give each elf in the group their own item types so that
+        # only the badge is carried by all three
+        items = [item for item in ITEMS if item != badge]
+        rng.shuffle(items)
+        for elf in range(3):
+            yield rucksack(rng, items[elf::3], badge)
@@ -1,6 +1,7 @@
-#!/usr/bin/env python3
-import os
-from typing import List
+from typing import Iterable, List
+
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamLines
 
 
 # @@@SNIPSTART day4-elfpair
@@ -52,14 +53,13 @@ class ElfPair:
         # @@@SNIPEND
 
 
+@timing.timed("count")
 # @@@SNIPSTART day4-solve
-def solve(
-    lines: list[str], solution: int, requireFullOverlap: bool
-) -> None:
-    pairs = []
+def solve(lines: Iterable[str], requireFullOverlap: bool) -> int:
+    score = 0
 
-    # Read in data line-by-line
-    for line in lines:
+    # Read in data line-by-line, checking each pair as it's read
+    for i, line in enumerate(lines, start=1):
         # Split string on , to extract the ranges
         split = line.split(",")
         # Then split on - to get the bounds
@@ -69,38 +69,90 @@ def solve(
         # Ingest the upper and lower bounds into the `ElfPair`
         pair.addAssignment([int(x) for x in first])
         pair.addAssignment([int(x) for x in second])
-        pairs.append(pair)
 
-    # Iterate through elf pairs and find overlap
-    score = 0
-    for i, pair in enumerate(pairs, start=1):
-        print(f"Checking elf pair {i:>4}: {pair}", end="")
-        if pair.hasOverlap(requireFullOverlap):
+        # Find overlap
+        hasOverlap = pair.hasOverlap(requireFullOverlap)
+        if hasOverlap:
             score += 1
-            print(" -> has overlap")
-        else:
-            print(" -> does NOT have overlap")
+        if trace.step:
+            verdict = "has" if hasOverlap else "does NOT have"
+            print(
+                f"Checking elf pair {i:>4}: {pair} ->"
+                f" {verdict} overlap"
+            )
 
-    print(f"Solution is  {score}")
-    print(f"=> Expecting {solution}\n")
-    assert score == solution
+    return score
     # @@@SNIPEND
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-with open("day4-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=2, requireFullOverlap=True)
-
-with open("day4-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=513, requireFullOverlap=True)
-
-with open("day4-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=4, requireFullOverlap=False)
-
-with open("day4-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solution=878, requireFullOverlap=False)
+@timing.timed("count")
+def solveBounds(
+    lines: Iterable[str], requireFullOverlap: bool
+) -> int:
+    """Solve either part comparing the bounds of each pair of ranges,
+    rather than building a set of every section in them"""
+    score = 0
+    for line in lines:
+        first, second = line.split(",")
+        aStart, aEnd = map(int, first.split("-"))
+        bStart, bEnd = map(int, second.split("-"))
+        if requireFullOverlap:
+            score += (aStart <= bStart and bEnd <= aEnd) or (
+                bStart <= aStart and aEnd <= bEnd
+            )
+        else:
+            score += aStart <= bEnd and bStart <= aEnd
+    return score
+
+
+CASES = (
+    Case(
+        1,
+        solve,
+        "day4-input-test.txt",
+        solution=2,
+        kwargs=dict(requireFullOverlap=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day4-input.txt",
+        solution=513,
+        kwargs=dict(requireFullOverlap=True),
+        reader=streamLines,
+    ),
+    Case(
+        1,
+        solveBounds,
+        "day4-input.txt",
+        solution=513,
+        kwargs=dict(requireFullOverlap=True),
+        reader=streamLines,
+    ),
+    Case(
+        2,
+        solve,
+        "day4-input-test.txt",
+        solution=4,
+        kwargs=dict(requireFullOverlap=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day4-input.txt",
+        solution=878,
+        kwargs=dict(requireFullOverlap=False),
+        reader=streamLines,
+    ),
+    Case(
+        2,
+        solveBounds,
+        "day4-input.txt",
+        solution=878,
+        kwargs=dict(requireFullOverlap=False),
+        reader=streamLines,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
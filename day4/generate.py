@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def sectionRange(rng: random.Random) -> str:
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Pairs of elves, each assigned a range of sections"""
+    for _ in range(scaled(1000, scale)):
+        yield f"{sectionRange(rng)},{sectionRange(rng)}"
+
+
+def edgeCases() -> list[list[str]]:
+    return [
+        # Single sections, and ranges which only touch at one end
+        ["5-5,5-5", "5-5,6-6", "4-5,5-6", "5-6,4-5", "6-6,1-5"],
+        # Identical ranges, and each side containing the other
+        ["2-8,2-8", "2-8,3-7", "3-7,2-8", "2-8,2-7", "3-8,2-8"],
+        # Ranges far longer than the puzzle's
+        ["1-100000,50000-50000", "1-99999,100000-100000"],
+    ]
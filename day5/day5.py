@@ -1,11 +1,11 @@
-#!/usr/bin/env python3
-
-import os
 import re
 from collections import deque
 from typing import Any, Optional
 
+from aoc import Case, runCases, timing, trace
+
 
+@timing.timed("parse")
 # @@@SNIPSTART day5-parseCratePositions
 def parseCratePositions(
     lines: list[str],
@@ -13,16 +13,18 @@ def parseCratePositions(
     spots: Optional[list[deque[Any]]] = None
     while lines:
         line = lines.pop(0)
-        print(f"\nParsing line '{line}'")
+        if trace.step:
+            print(f"\nParsing line '{line}'")
         # There's likely a more elegant way of detecting
         # the transition from crate state to movement list
         # however for now it's likely fine to just look for the
         # column numbers like " 1   2   3"
         if "1" in line:
-            print(
-                "=> Detected a '1' in the line"
-                " => Assuming end of crate list"
-            )
+            if trace.step:
+                print(
+                    "=> Detected a '1' in the line"
+                    " => Assuming end of crate list"
+                )
             # Also pop the next line, which should be empty
             nextLine = lines.pop(0)
             assert nextLine == ""
@@ -47,7 +49,8 @@ def parseCratePositions(
             if index > len(line):
                 # Done reading all crates at this height
                 break
-        print(f"=> Received {values}")
+        if trace.step:
+            print(f"=> Received {values}")
         assert values
         # Lazily allocate this since we don't know up front
         # how many columns we need
@@ -57,12 +60,14 @@ def parseCratePositions(
         # Append this line's crate positions into `spots`
         for i, letter in enumerate(values):
             if letter is not None:
-                print(f"==> {letter} is at index {i + 1}")
+                if trace.detail:
+                    print(f"==> {letter} is at index {i + 1}")
                 spots[i + 1].append(letter)
     assert False
     # @@@SNIPEND
 
 
+@timing.timed("move")
 # @@@SNIPSTART day5-executeCrateMoves
 def executeCrateMoves(
     spots: list[deque[str]], lines: list[str], moveMultiple: bool
@@ -70,7 +75,8 @@ def executeCrateMoves(
     pattern = re.compile(r"move (\d+) from (\d+) to (\d+)")
     for line in lines:
         # Parse the line into relevant variables
-        print(f"\nParsing line '{line}'")
+        if trace.step:
+            print(f"\nParsing line '{line}'")
         matches = re.match(pattern, line)
         assert matches
         moves = int(matches.group(1))
@@ -81,7 +87,10 @@ def executeCrateMoves(
         # Part 1 - move each crate directly to the destination, one by one
         if not moveMultiple:
             for move in range(moves):
-                print(f"=> Moving #{move} from {source} to {dest}")
+                if trace.detail:
+                    print(
+                        f"=> Moving #{move} from {source} to {dest}"
+                    )
                 crate = spots[source].popleft()
                 spots[dest].appendleft(crate)
         # Part 2 - move each crate to `cratesToMove` temporarily
@@ -91,7 +100,10 @@ def executeCrateMoves(
         else:
             cratesToMove: deque[str] = deque()
             for move in range(moves):
-                print(f"=> Moving #{move} from {source} to {dest}")
+                if trace.detail:
+                    print(
+                        f"=> Moving #{move} from {source} to {dest}"
+                    )
                 crate = spots[source].popleft()
                 cratesToMove.appendleft(crate)
             for crate in cratesToMove:
@@ -99,6 +111,7 @@ def executeCrateMoves(
     # @@@SNIPEND
 
 
+@timing.timed("report")
 # @@@SNIPSTART day5-extractSolution
 def extractSolution(spots: list[deque[str]]) -> str:
     # Returns the topmost crate if it exists,
@@ -115,41 +128,52 @@ def extractSolution(spots: list[deque[str]]) -> str:
 
 
 # @@@SNIPSTART day5-solve
-def solve(
-    lines: list[str], moveMultiple: bool, solution: str
-) -> None:
+def solve(lines: list[str], moveMultiple: bool) -> str:
     # Step 1: Parse initial state
-    print("*** Parsing initial crate state ***")
+    if trace.summary:
+        print("*** Parsing initial crate state ***")
     spots = parseCratePositions(lines)
 
     # Step 2: Execute crate movement from list
-    print("\n*** Executing crate moves ***")
+    if trace.summary:
+        print("\n*** Executing crate moves ***")
     executeCrateMoves(spots, lines, moveMultiple)
 
     # Step 3: Extract solution topmost crates in each column
-    calculated = extractSolution(spots)
-
-    print()
-    print(f"Solution is {calculated}")
-    print(f"Expecting   {solution}")
-    assert calculated == solution
+    return extractSolution(spots)
     # @@@SNIPEND
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-with open("day5-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, moveMultiple=False, solution="CMZ")
-
-with open("day5-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, moveMultiple=False, solution="SPFMVDTZT")
-
-with open("day5-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, moveMultiple=True, solution="MCD")
-
-with open("day5-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, moveMultiple=True, solution="ZFSJBPRFP")
+CASES = (
+    Case(
+        1,
+        solve,
+        "day5-input-test.txt",
+        solution="CMZ",
+        kwargs=dict(moveMultiple=False),
+    ),
+    Case(
+        1,
+        solve,
+        "day5-input.txt",
+        solution="SPFMVDTZT",
+        kwargs=dict(moveMultiple=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day5-input-test.txt",
+        solution="MCD",
+        kwargs=dict(moveMultiple=True),
+    ),
+    Case(
+        2,
+        solve,
+        "day5-input.txt",
+        solution="ZFSJBPRFP",
+        kwargs=dict(moveMultiple=True),
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+STACKS = 9
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A drawing of stacks of crates followed by moves between them,
+    none of which take more crates than a stack holds"""
+    averageHeight = scaled(6, scale)
+    stacks = [
+        [
+            rng.choice(string.ascii_uppercase)
+            for _ in range(rng.randint(1, 2 * averageHeight))
+        ]
+        for _ in range(STACKS)
+    ]
+
+    # The solver relies on every row of the drawing being padded
+    # out to the full width
+    for height in range(max(map(len, stacks)), 0, -1):
+        yield " ".join(
+            (
+                f"[{stack[height - 1]}]"
+                if len(stack) >= height
+                else "   "
+            )
+            for stack in stacks
+        )
+    yield " ".join(f" {i} " for i in range(1, STACKS + 1))
+    yield ""
+
+    for _ in range(scaled(500, scale)):
+        source = rng.choice([i for i, s in enumerate(stacks) if s])
+        dest = rng.choice([i for i in range(STACKS) if i != source])
+        count = rng.randint(1, len(stacks[source]))
+        stacks[dest].extend(stacks[source][-count:])
+        del stacks[source][-count:]
+        yield f"move {count} from {source + 1} to {dest + 1}"
+
+
+def edgeCases() -> list[list[str]]:
+    return [
+        # A stack which starts empty, in the middle of the drawing,
+        # and one which is emptied then refilled
+        [
+            "[A]     [C]",
+            "[B]     [D]",
+            " 1   2   3 ",
+            "",
+            "move 2 from 1 to 2",
+            "move 2 from 3 to 1",
+            "move 1 from 2 to 3",
+        ],
+        # A single crate moved around every stack
+        [
+            "    [A]    ",
+            " 1   2   3 ",
+            "",
+            "move 1 from 2 to 3",
+            "move 1 from 3 to 1",
+            "move 1 from 1 to 2",
+        ],
+    ]
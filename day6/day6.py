@@ -1,43 +1,86 @@
-#!/usr/bin/env python3
-import os
+import itertools
 from collections import deque
+from typing import Iterable
 
+from aoc import Case, runCases, timing, trace
+from aoc.lines import streamChars
 
-def solve(lines: list[str], size: int, solutions: list[int]) -> None:
-    for line, solution in zip(lines, solutions):
-        print("***")
-        print(line)
 
-        answer = 0
-        window: deque[str] = deque(maxlen=size)
-        for i, c in enumerate(line):
-            window.append(c)
-            if len(set(window)) == size:
-                print(f"{list(window)} is all unique")
-                answer = i + 1
-                break
-
-        print(f"Solution is {answer}")
-        print(f"Expecting   {solution}")
-        assert answer == solution
+def findMarker(datastream: Iterable[str], size: int) -> int:
+    """Return how many characters of `datastream` are read before the
+    last `size` are all different, or 0 if they never are
 
+    Only the last `size` characters are kept, so `datastream` can be
+    as long as it likes, such as a file read by `streamChars`.
+    """
+    window: deque[str] = deque(maxlen=size)
+    for i, c in enumerate(datastream):
+        window.append(c)
+        if len(set(window)) == size:
+            if trace.summary:
+                print(f"{list(window)} is all unique")
+            return i + 1
+    return 0
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
 
-# Part 1
-with open("day6-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, size=4, solutions=[7, 5, 6, 10, 11])
+def solve(chars: Iterable[str], size: int, stream: int = 0) -> int:
+    # Each line of input is a separate datastream;
+    # `stream` selects which one to find the marker in
+    chars = iter(chars)
+    with timing.phase("read"):
+        for _ in range(stream):
+            for c in chars:
+                if c == "\n":
+                    break
+    if trace.summary:
+        print(f"*** Datastream {stream}")
+    datastream = itertools.takewhile(lambda c: c not in "\r\n", chars)
+    with timing.phase("search"):
+        return findMarker(datastream, size)
 
-with open("day6-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, size=4, solutions=[1909])
 
-# Part 2
-with open("day6-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, size=14, solutions=[19, 23, 23, 29, 26])
+CASES = (
+    # Part 1
+    *(
+        Case(
+            1,
+            solve,
+            "day6-input-test.txt",
+            solution=solution,
+            kwargs=dict(size=4, stream=stream),
+            reader=streamChars,
+        )
+        for stream, solution in enumerate([7, 5, 6, 10, 11])
+    ),
+    Case(
+        1,
+        solve,
+        "day6-input.txt",
+        solution=1909,
+        kwargs=dict(size=4),
+        reader=streamChars,
+    ),
+    # Part 2
+    *(
+        Case(
+            2,
+            solve,
+            "day6-input-test.txt",
+            solution=solution,
+            kwargs=dict(size=14, stream=stream),
+            reader=streamChars,
+        )
+        for stream, solution in enumerate([19, 23, 23, 29, 26])
+    ),
+    Case(
+        2,
+        solve,
+        "day6-input.txt",
+        solution=3380,
+        kwargs=dict(size=14),
+        reader=streamChars,
+    ),
+)
 
-with open("day6-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, size=14, solutions=[3380])
+if __name__ == "__main__":
+    runCases(CASES)
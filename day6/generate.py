@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A datastream whose start-of-packet and start-of-message
+    markers are both right at the end, so all of it is searched"""
+    # No run of four distinct characters can be drawn from only three
+    letters = rng.sample(string.ascii_lowercase, 17)
+    stream = [
+        rng.choice(letters[:3]) for _ in range(scaled(4096, scale))
+    ]
+    stream.extend(letters[3:])
+    yield "".join(stream)
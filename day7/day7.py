@@ -1,10 +1,9 @@
-#!/usr/bin/env python3
-
-import os
 import re
 from pathlib import Path
 import sys
 
+from aoc import Case, runCases, timing, trace
+
 
 class FilesystemItem:
     def __init__(self, path: Path) -> None:
@@ -43,32 +42,32 @@ class FilesystemItem:
         return best
 
 
-def solve(
-    lines: list[str],
-    limit: int,
-    solutionPart1: int,
-    solutionPart2: int,
-) -> None:
-    sum = 0
+def parseTree(lines: list[str]) -> FilesystemItem:
+    """Return the root of the tree of directories the commands and
+    their output in `lines` explore"""
     currentCommand = None
     currentCommandOption = None
     root = FilesystemItem(Path("/"))
     currentWorkingDirectory = root
     seen = {root.path: root}
     for line in lines:
-        print(f"\nLine: '{line}'")
+        if trace.step:
+            print(f"\nLine: '{line}'")
         matchCommand = re.match(r"^\$ (\S+)\s*(\S*)", line)
         if matchCommand:
-            print(
-                f"=> Detected new command: {matchCommand.groups()} @"
-                f" {currentWorkingDirectory.path}"
-            )
+            if trace.step:
+                print(
+                    "=> Detected new command:"
+                    f" {matchCommand.groups()} @"
+                    f" {currentWorkingDirectory.path}"
+                )
             currentCommand = matchCommand.group(1)
             if matchCommand.group(2):
                 currentCommandOption = matchCommand.group(2)
             else:
                 currentCommandOption = None
-            print(f"=> {currentCommand} {currentCommandOption}")
+            if trace.step:
+                print(f"=> {currentCommand} {currentCommandOption}")
             if currentCommand == "cd":
                 assert currentCommandOption is not None
                 targetPath = Path(currentCommandOption)
@@ -93,28 +92,31 @@ def solve(
                     and currentWorkingDirectory.path
                     != nextWorkingDirectory.path
                 ):
-                    print(
-                        f"{currentWorkingDirectory} is a parent of"
-                        f" {nextWorkingDirectory}"
-                    )
+                    if trace.step:
+                        print(
+                            f"{currentWorkingDirectory} is a parent"
+                            f" of {nextWorkingDirectory}"
+                        )
                     currentWorkingDirectory.children.append(
                         nextWorkingDirectory
                     )
                 currentWorkingDirectory = nextWorkingDirectory
                 del nextWorkingDirectory
-                print(
-                    "=> Changed directory to"
-                    f" {currentWorkingDirectory.path}"
-                )
+                if trace.step:
+                    print(
+                        "=> Changed directory to"
+                        f" {currentWorkingDirectory.path}"
+                    )
             elif currentCommand == "ls":
                 pass
             else:
                 assert False
         else:
-            print(
-                "=> Detected output from previous command"
-                f" ({currentCommand} {currentCommandOption})"
-            )
+            if trace.step:
+                print(
+                    "=> Detected output from previous command"
+                    f" ({currentCommand} {currentCommandOption})"
+                )
             if currentCommand == "cd":
                 assert False, "Should have no output"
             elif currentCommand == "ls":
@@ -126,53 +128,103 @@ def solve(
                 else:
                     size = int(size)
                 target = matchOutput.group(2)
-                print(f"=> Target: {target}; size: {size}")
+                if trace.step:
+                    print(f"=> Target: {target}; size: {size}")
                 currentWorkingDirectory.size += size
             else:
                 assert False
+    return root
 
-    print("\nCalculating solutions...")
+
+def solve(lines: list[str], part1: bool, limit: int = 100000) -> int:
+    with timing.phase("parse"):
+        root = parseTree(lines)
+
+    if trace.summary:
+        print("\nCalculating solutions...")
     diskTotal = 70000000
     diskTargetFree = 30000000
-    root.calculateSize()
+    with timing.phase("calculateSize"):
+        root.calculateSize()
     diskCurrentFree = diskTotal - root.totalSize
     targetDeletionSize = diskTargetFree - diskCurrentFree
 
-    print("{:>20}: {:>10}".format("diskTotal", diskTotal))
-    print("{:>20}: {:>10}".format("diskTargetFree", diskTargetFree))
-
-    print("{:>20}: {:>10}".format("diskCurrentUsed", root.totalSize))
-    print("{:>20}: {:>10}".format("diskCurrentFree", diskCurrentFree))
-    print(
-        "{:>20}: {:>10}".format(
-            "targetDeletionSize", targetDeletionSize
+    if trace.summary:
+        print("{:>20}: {:>10}".format("diskTotal", diskTotal))
+        print(
+            "{:>20}: {:>10}".format("diskTargetFree", diskTargetFree)
         )
-    )
 
-    # Part 1
-    sum = root.sumUnderLimit(limit)
-    print(f"Part 1: sum of folders under {limit} is {sum}")
-    assert solutionPart1 is None or solutionPart1 == sum
+        print(
+            "{:>20}: {:>10}".format("diskCurrentUsed", root.totalSize)
+        )
+        print(
+            "{:>20}: {:>10}".format(
+                "diskCurrentFree", diskCurrentFree
+            )
+        )
+        print(
+            "{:>20}: {:>10}".format(
+                "targetDeletionSize", targetDeletionSize
+            )
+        )
 
-    # Part 2
-    smallestToDelete = root.findDelete(targetSize=targetDeletionSize)
-    print(
-        "Part 2: size of smallest folder we can delete is"
-        f" {smallestToDelete}"
-    )
-    assert solutionPart2 is None or solutionPart2 == smallestToDelete
+    if part1:
+        with timing.phase("query"):
+            sum = root.sumUnderLimit(limit)
+        if trace.summary:
+            print(f"Part 1: sum of folders under {limit} is {sum}")
+        return sum
+    else:
+        with timing.phase("query"):
+            smallestToDelete = root.findDelete(
+                targetSize=targetDeletionSize
+            )
+        if trace.summary:
+            print(
+                "Part 2: size of smallest folder we can delete is"
+                f" {smallestToDelete}"
+            )
+        return smallestToDelete
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
+# Bytes the full input may take to read or solve, with room to spare
+MEMORY_BUDGET = 256 * 2**10
 
-with open("day7-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines, limit=100000, solutionPart1=95437, solutionPart2=24933642
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day7-input-test.txt",
+        solution=95437,
+        kwargs=dict(part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day7-input.txt",
+        solution=1886043,
+        kwargs=dict(part1=True),
+        memoryBudget=MEMORY_BUDGET,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day7-input-test.txt",
+        solution=24933642,
+        kwargs=dict(part1=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day7-input.txt",
+        solution=3842121,
+        kwargs=dict(part1=False),
+        memoryBudget=MEMORY_BUDGET,
+    ),
 )
 
-with open("day7-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(
-    lines, limit=100000, solutionPart1=1886043, solutionPart2=3842121
-)
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+class Directory:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.children: list[Directory] = []
+        self.files: dict[str, int] = {}
+
+
+def randomName(rng: random.Random, taken: set[str]) -> str:
+    while True:
+        name = "".join(
+            rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))
+        )
+        if rng.random() < 0.5:
+            name += "." + "".join(
+                rng.choices(string.ascii_lowercase, k=3)
+            )
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def browse(directory: Directory) -> Iterator[str]:
+    yield "$ ls"
+    for child in directory.children:
+        yield f"dir {child.name}"
+    for name, size in directory.files.items():
+        yield f"{size} {name}"
+    for child in directory.children:
+        yield f"$ cd {child.name}"
+        yield from browse(child)
+        yield "$ cd .."
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """The terminal output from exploring a random directory tree
+
+    The total size is kept within the 70000000 disk, but above the
+    40000000 needed to leave room for the update, as for the real
+    puzzle input.
+    """
+    root = Directory("/")
+    directories = [root]
+    names: dict[Directory, set[str]] = {root: set()}
+    for _ in range(scaled(180, scale) - 1):
+        parent = rng.choice(directories)
+        child = Directory(randomName(rng, names[parent]))
+        parent.children.append(child)
+        directories.append(child)
+        names[child] = set()
+
+    fileCount = scaled(440, scale)
+    weights = [rng.random() for _ in range(fileCount)]
+    sizePerWeight = rng.randint(42000000, 68000000) / sum(weights)
+    for weight in weights:
+        directory = rng.choice(directories)
+        name = randomName(rng, names[directory])
+        size = int(weight * sizePerWeight)
+        directory.files[name] = max(1, size)
+
+    yield "$ cd /"
+    yield from browse(root)
@@ -1,146 +1,108 @@
-#!/usr/bin/env python3
-
-from collections import defaultdict
-import functools
-import operator
-import os
-
-
-class Spot:
-    def __init__(self, y: int, x: int, char: str) -> None:
-        self.y = y
-        self.x = x
-        self.height = int(char)
-        self.visible = False
-        self.viewingDistances: list[int] = []
-
-    def __repr__(self) -> str:
-        return f"Spot{{{self.height}@{self.y},{self.x}}}"
-
-    def score(self) -> int:
-        return functools.reduce(
-            operator.mul, self.viewingDistances, 1
-        )
-
-
-def solve(
-    lines: list[str], solutionPart1: int, solutionPart2: int
-) -> None:
-    # Parse into data structure
-    table: defaultdict[int, dict[int, Spot]] = defaultdict(dict)
-    maxY = 0
-    maxX = 0
-    for y, line in enumerate(lines):
-        for x, char in enumerate(line):
-            print(f"[{y}][{x}]: {char}")
-            table[y][x] = Spot(y, x, char)
-    maxY = len(table)
-    maxX = len(table[y])
-    print("----")
-    visibleCount = 0
-    print(f"maxY: {maxY}")
-    print(f"maxX: {maxX}")
-    bestScore = 0
-    for y in range(maxY):
-        for x in range(maxX):
-            print(f"\n[{y}][{x}]: {table[y][x]}")
-            print("=> Considering if visible")
-
-            if y == 0 or y == maxY - 1 or x == 0 or x == maxX - 1:
-                print("==> Is on the periphery => Visible")
-                table[y][x].visible = True
-            else:
-                xi = x
-                print("==> Checking up (subtract y)")
-                for i, yi in enumerate(range(y - 1, -1, -1)):
-                    print(
-                        f"===> Checking [{yi}][{xi}] =>"
-                        f" {table[yi][xi].height}"
-                    )
-                    if table[yi][xi].height >= table[y][x].height:
-                        table[y][x].viewingDistances.append(i + 1)
-                        break
-                else:
-                    print("==> Visible")
-                    table[y][x].viewingDistances.append(i + 1)
-                    table[y][x].visible = True
-                print(f"==> Viewing distance is {i + 1}")
-
-                print("==> Checking down (add y)")
-                xi = x
-                for i, yi in enumerate(range(y + 1, maxY, +1)):
-                    print(
-                        f"===> Checking [{yi}][{xi}] =>"
-                        f" {table[yi][xi].height}"
-                    )
-                    if table[yi][xi].height >= table[y][x].height:
-                        table[y][x].viewingDistances.append(i + 1)
-                        break
-                else:
-                    print("==> Visible")
-                    table[y][x].viewingDistances.append(i + 1)
-                    table[y][x].visible = True
-                print(f"==> Viewing distance is {i + 1}")
-
-                print("==> Checking left (subtract x)")
-                yi = y
-                for i, xi in enumerate(range(x - 1, -1, -1)):
-                    print(
-                        f"===> Checking [{yi}][{xi}] =>"
-                        f" {table[yi][xi].height}"
-                    )
-                    if table[yi][xi].height >= table[y][x].height:
-                        table[y][x].viewingDistances.append(i + 1)
-                        break
-                else:
-                    print("==> Visible")
-                    table[y][x].viewingDistances.append(i + 1)
-                    table[y][x].visible = True
-                print(f"==> Viewing distance is {i + 1}")
-
-                print("==> Checking right (add x)")
-                yi = y
-                for i, xi in enumerate(range(x + 1, maxX, +1)):
-                    print(
-                        f"===> Checking [{yi}][{xi}] =>"
-                        f" {table[yi][xi].height}"
-                    )
-                    if table[yi][xi].height >= table[y][x].height:
-                        table[y][x].viewingDistances.append(i + 1)
-                        break
-                else:
-                    print("==> Visible")
-                    table[y][x].viewingDistances.append(i + 1)
-                    table[y][x].visible = True
-                print(f"==> Viewing distance is {i + 1}")
-
-            # Done checking heights in cardinal directions
-            if table[y][x].visible:
-                visibleCount += 1
+import numpy as np
+import numpy.typing as npt
+
+from aoc import Case, runCases, timing, trace
+from aoc.grid import NEIGHBOURS, Grid, shift
+
+# Stands in for the trees beyond the edge of the grid
+EDGE = -1
+
+
+@timing.timed("look")
+def look(
+    heights: npt.NDArray[np.int16], dy: int, dx: int
+) -> tuple[npt.NDArray[np.int16], npt.NDArray[np.bool_]]:
+    """Look from every tree at once in the (dy, dx) direction,
+    returning how many trees each can see and whether each can see
+    all the way to the edge"""
+    distances = np.zeros_like(heights)
+    visible = np.zeros(heights.shape, dtype=bool)
+    # Trees whose view hasn't been blocked yet
+    looking = np.ones(heights.shape, dtype=bool)
+    distance = 0
+    while looking.any():
+        distance += 1
+        other = shift(heights, -dy * distance, -dx * distance, EDGE)
+        atEdge = other == EDGE
+        visible |= looking & atEdge
+        looking &= ~atEdge
+        distances[looking] = distance
+        looking &= other < heights
+    return distances, visible
+
+
+def solve(lines: list[str], part1: bool) -> int:
+    with timing.phase("parse"):
+        grid = Grid.fromLines(lines)
+        heights = grid.cells.astype(np.int16) - ord("0")
+    if trace.summary:
+        print("----")
+        print(f"maxY: {grid.height}")
+        print(f"maxX: {grid.width}")
+
+    visible = np.zeros(heights.shape, dtype=bool)
+    scores = np.ones(heights.shape, dtype=np.int64)
+    for dy, dx in NEIGHBOURS:
+        distances, visibleFrom = look(heights, dy, dx)
+        if trace.step:
             print(
-                "==> Viewing distances are"
-                f" {table[y][x].viewingDistances}"
+                f"Looking ({dy},{dx}): {visibleFrom.sum()} trees can"
+                " see the edge"
             )
-            print(f"==> Viewing score is {table[y][x].score()}")
-            bestScore = max(bestScore, table[y][x].score())
+        if trace.detail:
+            print(distances)
+        visible |= visibleFrom
+        scores *= distances
+
+    if part1:
+        visibleCount = int(visible.sum())
+        if trace.summary:
+            print(f"\nTotal of {visibleCount} trees visible")
+        return visibleCount
+    else:
+        bestScore = int(scores.max())
+        if trace.summary:
+            print(f"\nBest viewing score is {bestScore}")
+        return bestScore
+
+
+# Bytes the full input may take to read or solve, with room to spare
+MEMORY_BUDGET = 512 * 2**10
+
+CASES = (
     # Part 1
-    print(f"\nTotal of {visibleCount} trees visible")
-    if solutionPart1:
-        print(f"=> Expecting {solutionPart1} trees")
-        assert visibleCount == solutionPart1
+    Case(
+        1,
+        solve,
+        "day8-input-test.txt",
+        solution=21,
+        kwargs=dict(part1=True),
+    ),
+    Case(
+        1,
+        solve,
+        "day8-input.txt",
+        solution=1736,
+        kwargs=dict(part1=True),
+        memoryBudget=MEMORY_BUDGET,
+    ),
     # Part 2
-    print(f"\nBest viewing score is {bestScore}")
-    if solutionPart2:
-        print(f"=> Expecting best viewing score of {solutionPart2}")
-        assert bestScore == solutionPart2
-
-
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-with open("day8-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solutionPart1=21, solutionPart2=8)
-
-with open("day8-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, solutionPart1=1736, solutionPart2=268800)
+    Case(
+        2,
+        solve,
+        "day8-input-test.txt",
+        solution=8,
+        kwargs=dict(part1=False),
+    ),
+    Case(
+        2,
+        solve,
+        "day8-input.txt",
+        solution=268800,
+        kwargs=dict(part1=False),
+        memoryBudget=MEMORY_BUDGET,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaledSide
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """A square grid of tree heights"""
+    side = scaledSide(99, scale)
+    for _ in range(side):
+        yield "".join(rng.choices("0123456789", k=side))
@@ -1,122 +1,127 @@
-#!/usr/bin/env python3
-
 from __future__ import annotations
 
-import os
-from typing import Tuple
+from typing import Iterable
 
+from aoc import Case, runCases, timing, trace
+from aoc.coords import inRange, offset2, pack2, unpack2
+from aoc.lines import streamLines
 
-class RopeEnd:
-    def __init__(self, name: str, x: int = 0, y: int = 0) -> None:
-        self.x = x
-        self.y = y
-        self.name = name
 
-    def __repr__(self) -> str:
-        return f"{self.name}{{{self.x},{self.y}}}"
-
-    def move(self, xRel: int, yRel: int) -> None:
-        self.x += xRel
-        self.y += yRel
-        print(f"=> Moved  {xRel}, {yRel} to {self}")
-
-    def updateTail(self, head: RopeEnd) -> None:
-        # self is tail
-        while True:
-            xDist = head.x - self.x
-            yDist = head.y - self.y
-            print(f"==> xDist={xDist}; yDist={yDist}")
-            if abs(xDist) >= 2:
-                xChange = +1 if xDist > 0 else -1
-                if yDist != 0:
-                    yChange = +1 if yDist > 0 else -1
-                else:
-                    yChange = 0
-            elif abs(yDist) >= 2:
-                if xDist != 0:
-                    xChange = +1 if xDist > 0 else -1
-                else:
-                    xChange = 0
-                yChange = +1 if yDist > 0 else -1
-            else:
-                break
-            print(f"===> Moving {xChange}, {yChange}")
-            self.move(xChange, yChange)
+# How a knot follows the one ahead of it when they're (dx, dy) apart,
+# by offset. The knot ahead moves at most one step at a time in each
+# direction, so they never get more than two apart, and are only
+# missing from here when the knot doesn't need to move at all.
+FOLLOW = {
+    offset2(dx, dy): offset2((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+    for dx in range(-2, 3)
+    for dy in range(-2, 3)
+    if max(abs(dx), abs(dy)) >= 2
+}
 
 
 class Rope:
     def __init__(self, numberOfKnots: int) -> None:
         assert numberOfKnots >= 2
-        self.knots = [
-            RopeEnd(f"Knot{i}") for i in range(numberOfKnots)
-        ]
-        self.head = self.knots[0]
-        self.tailHistory: set[Tuple[int, int]] = set()
+        # Positions of the knots, head first, packed by `pack2`
+        self.knots = [pack2(0, 0)] * numberOfKnots
+        self.tailHistory = {self.knots[-1]}
 
     def __repr__(self) -> str:
-        return f"Rope{{{self.knots}}}"
+        return f"Rope{{{[unpack2(knot) for knot in self.knots]}}}"
+
+    def move(self, step: int) -> None:
+        knots = self.knots
+        knots[0] += step
+        for i in range(1, len(knots)):
+            follow = FOLLOW.get(knots[i - 1] - knots[i])
+            if follow is None:
+                # Nor will any of the knots behind this one
+                break
+            knots[i] += follow
+        else:
+            self.tailHistory.add(knots[-1])
+        if trace.detail:
+            print(f"==> {self}\n")
+
 
-    def move(self, xRel: int, yRel: int) -> None:
-        print(f"=> Moving {xRel}, {yRel}")
-        self.head.move(xRel, yRel)
-        for i, knot in enumerate(self.knots[1:]):
-            knot.updateTail(self.knots[i])
-        self.tailHistory.add((self.knots[-1].x, self.knots[-1].y))
-        print(f"==> {self}\n")
+DIRECTIONS = dict(L=(-1, 0), R=(+1, 0), U=(0, +1), D=(0, -1))
+STEPS = {
+    direction: offset2(dx, dy)
+    for direction, (dx, dy) in DIRECTIONS.items()
+}
 
 
-def solve(
-    lines: list[str], numberOfKnots: int, solution: int
-) -> None:
+@timing.timed("move")
+def solve(lines: Iterable[str], numberOfKnots: int) -> int:
     rope = Rope(numberOfKnots)
+    headX = headY = 0
     for line in lines:
         direction, countStr = line.split()
         count = int(countStr)
-        print(
-            f"\nMoving {count} in direction {direction} from {rope}"
-        )
+        # The other knots trail the head, so they never get further
+        # out than it has been, which is furthest after each move
+        dx, dy = DIRECTIONS[direction]
+        headX += dx * count
+        headY += dy * count
+        assert inRange(
+            headX, headY
+        ), f"The head moves to ({headX}, {headY}), too far to pack"
+        if trace.step:
+            print(
+                f"\nMoving {count} in direction {direction} from"
+                f" {rope}"
+            )
+        step = STEPS[direction]
         for _ in range(count):
-            match direction:
-                case "L":
-                    rope.move(-1, 0)
-                case "R":
-                    rope.move(+1, 0)
-                case "U":
-                    rope.move(0, +1)
-                case "D":
-                    rope.move(0, -1)
-                case _:
-                    assert False
+            rope.move(step)
 
-    # Part 1
     visitedLocations = len(rope.tailHistory)
-    print(f"Tail has visited {visitedLocations} locations")
-    print(f"=> Expecting {solution} locations")
-    assert visitedLocations == solution
+    if trace.summary:
+        print(f"Tail has visited {visitedLocations} locations")
+    return visitedLocations
 
 
-os.chdir(os.path.realpath(os.path.dirname(__file__)))
-
-# Part 1
-with open("day9-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, numberOfKnots=2, solution=13)
-
-with open("day9-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, numberOfKnots=2, solution=6354)
-
-# Part 2
-with open("day9-input-test.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, numberOfKnots=10, solution=1)
-
-with open(
-    "day9-input-test-part-2.txt", "r", encoding="utf-8"
-) as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, numberOfKnots=10, solution=36)
-
-with open("day9-input.txt", "r", encoding="utf-8") as inputFile:
-    lines = inputFile.read().splitlines()
-solve(lines, numberOfKnots=10, solution=2651)
+CASES = (
+    # Part 1
+    Case(
+        1,
+        solve,
+        "day9-input-test.txt",
+        solution=13,
+        kwargs=dict(numberOfKnots=2),
+    ),
+    Case(
+        1,
+        solve,
+        "day9-input.txt",
+        solution=6354,
+        kwargs=dict(numberOfKnots=2),
+        reader=streamLines,
+    ),
+    # Part 2
+    Case(
+        2,
+        solve,
+        "day9-input-test.txt",
+        solution=1,
+        kwargs=dict(numberOfKnots=10),
+    ),
+    Case(
+        2,
+        solve,
+        "day9-input-test-part-2.txt",
+        solution=36,
+        kwargs=dict(numberOfKnots=10),
+    ),
+    Case(
+        2,
+        solve,
+        "day9-input.txt",
+        solution=2651,
+        kwargs=dict(numberOfKnots=10),
+        reader=streamLines,
+    ),
+)
+
+if __name__ == "__main__":
+    runCases(CASES)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+from aoc.generate import scaled
+
+
+def generate(rng: random.Random, scale: float) -> Iterator[str]:
+    """Moves of the head of the rope"""
+    for _ in range(scaled(2000, scale)):
+        yield f"{rng.choice('LRUD')} {rng.randint(1, 20)}"
@@ -77,6 +77,11 @@ const config = {
             position: "left",
             label: "Solutions",
           },
+          {
+            to: "/leaderboard",
+            position: "left",
+            label: "Leaderboard",
+          },
           {
             href: "https://github.com/kbalston/advent-of-code-2022",
             label: "GitHub",
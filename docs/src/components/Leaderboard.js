@@ -0,0 +1,52 @@
+import React from "react";
+import Link from "@docusaurus/Link";
+import performance from "@site/src/data/performance.json";
+import { formatBytes, formatSeconds } from "@site/src/components/formatCost";
+
+export default function Leaderboard() {
+  return (
+    <>
+      <p>
+        Solving both parts of each day's puzzle input with its fastest
+        solvers, measured with Python {performance.python} on{" "}
+        {performance.machine}.
+      </p>
+      <table>
+        <thead>
+          <tr>
+            <th>Rank</th>
+            <th>Day</th>
+            <th>Total</th>
+            <th>Slowest phase</th>
+            <th>Peak RSS</th>
+          </tr>
+        </thead>
+        <tbody>
+          {performance.leaderboard.map((day, i) => {
+            const data = performance.days[day];
+            const slowest = data.benchmarks.reduce((a, b) =>
+              b.median > a.median ? b : a
+            );
+            const peakRss = Math.max(
+              ...data.benchmarks.map((b) => b.peakRss ?? 0)
+            );
+            return (
+              <tr key={day}>
+                <td>{i + 1}</td>
+                <td>
+                  <Link to={`/${day}`}>Day {day.replace("day", "")}</Link>
+                </td>
+                <td>{formatSeconds(data.total)}</td>
+                <td>
+                  {slowest.phase} <code>{slowest.solver}</code> (
+                  {formatSeconds(slowest.median)})
+                </td>
+                <td>{formatBytes(peakRss || null)}</td>
+              </tr>
+            );
+          })}
+        </tbody>
+      </table>
+    </>
+  );
+}
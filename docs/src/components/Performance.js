@@ -0,0 +1,56 @@
+import React from "react";
+import Link from "@docusaurus/Link";
+import performance from "@site/src/data/performance.json";
+import ScalingChart from "@site/src/components/ScalingChart";
+import {
+  formatBytes,
+  formatOrdinal,
+  formatSeconds,
+} from "@site/src/components/formatCost";
+
+export default function Performance({ day }) {
+  const data = performance.days[`day${day}`];
+  if (!data) {
+    return <p>This day hasn't been benchmarked yet.</p>;
+  }
+  const rank = performance.leaderboard.indexOf(`day${day}`) + 1;
+
+  return (
+    <>
+      <p>
+        Solving both parts of the puzzle input takes{" "}
+        {formatSeconds(data.total)} with the fastest solvers, making this
+        day the {formatOrdinal(rank)} slowest of{" "}
+        {performance.leaderboard.length} on the{" "}
+        <Link to="/leaderboard">leaderboard</Link>.
+        Measured with Python {performance.python} on{" "}
+        {performance.machine}.
+      </p>
+      <table>
+        <thead>
+          <tr>
+            <th>Phase</th>
+            <th>Solver</th>
+            <th>Median</th>
+            <th>p95</th>
+            <th>Peak RSS</th>
+          </tr>
+        </thead>
+        <tbody>
+          {data.benchmarks.map((b) => (
+            <tr key={`${b.phase} ${b.solver} ${b.input}`}>
+              <td>{b.phase}</td>
+              <td>
+                <code>{b.solver}</code>
+              </td>
+              <td>{formatSeconds(b.median)}</td>
+              <td>{formatSeconds(b.p95)}</td>
+              <td>{formatBytes(b.peakRss)}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+      {data.scaling.length > 0 && <ScalingChart points={data.scaling} />}
+    </>
+  );
+}
@@ -0,0 +1,97 @@
+import React from "react";
+import { formatSeconds } from "@site/src/components/formatCost";
+
+const WIDTH = 560;
+const HEIGHT = 260;
+const MARGIN = { top: 10, right: 150, bottom: 40, left: 70 };
+const COLOURS = ["#2e8555", "#d9534f", "#337ab7", "#f0ad4e", "#8e44ad"];
+
+// Both axes are logarithmic, so a solver whose time grows linearly with
+// its input is a straight line, and steeper lines grow faster than that
+function logScale(values, from, to) {
+  const low = Math.log(Math.min(...values));
+  const high = Math.log(Math.max(...values));
+  const span = high - low || 1;
+  return (value) => from + ((Math.log(value) - low) / span) * (to - from);
+}
+
+export default function ScalingChart({ points }) {
+  const series = new Map();
+  for (const point of points) {
+    const name = `${point.phase} ${point.solver}`;
+    if (!series.has(name)) {
+      series.set(name, []);
+    }
+    series.get(name).push(point);
+  }
+  const scales = [...new Set(points.map((point) => point.scale))];
+  const seconds = points.map((point) => point.seconds);
+  const x = logScale(scales, MARGIN.left, WIDTH - MARGIN.right);
+  const y = logScale(seconds, HEIGHT - MARGIN.bottom, MARGIN.top);
+
+  return (
+    <svg
+      viewBox={`0 0 ${WIDTH} ${HEIGHT}`}
+      width="100%"
+      role="img"
+      aria-label="Time taken against the size of the input"
+    >
+      <g fontSize="12" fill="currentColor">
+        {scales.map((scale) => (
+          <text
+            key={scale}
+            x={x(scale)}
+            y={HEIGHT - MARGIN.bottom + 16}
+            textAnchor="middle"
+          >
+            {scale}×
+          </text>
+        ))}
+        <text x={MARGIN.left} y={HEIGHT - 6}>
+          Size of input, relative to the puzzle's
+        </text>
+        {[Math.min(...seconds), Math.max(...seconds)].map((value) => (
+          <text
+            key={value}
+            x={MARGIN.left - 6}
+            y={y(value) + 4}
+            textAnchor="end"
+          >
+            {formatSeconds(value)}
+          </text>
+        ))}
+      </g>
+      {[...series.entries()].map(([name, line], i) => {
+        const colour = COLOURS[i % COLOURS.length];
+        const last = line[line.length - 1];
+        return (
+          <g key={name} stroke={colour} fill={colour}>
+            <polyline
+              fill="none"
+              strokeWidth="2"
+              points={line
+                .map((point) => `${x(point.scale)},${y(point.seconds)}`)
+                .join(" ")}
+            />
+            {line.map((point) => (
+              <circle
+                key={point.scale}
+                cx={x(point.scale)}
+                cy={y(point.seconds)}
+                r="3"
+              />
+            ))}
+            <text
+              x={x(last.scale) + 8}
+              y={y(last.seconds) + 4}
+              fontSize="12"
+              stroke="none"
+            >
+              {name}
+            </text>
+          </g>
+        );
+      })}
+    </svg>
+  );
+}
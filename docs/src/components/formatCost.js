@@ -0,0 +1,23 @@
+// Shared by the performance tables and the leaderboard
+export function formatSeconds(seconds) {
+  if (seconds >= 1) {
+    return `${seconds.toFixed(2)}s`;
+  }
+  if (seconds >= 0.001) {
+    return `${(seconds * 1000).toFixed(1)}ms`;
+  }
+  return `${(seconds * 1000000).toFixed(0)}µs`;
+}
+
+export function formatBytes(bytes) {
+  if (bytes === null || bytes === undefined) {
+    return "";
+  }
+  return `${(bytes / 2 ** 20).toFixed(1)}MiB`;
+}
+
+export function formatOrdinal(n) {
+  const suffixes = { one: "st", two: "nd", few: "rd", other: "th" };
+  const rule = new Intl.PluralRules("en", { type: "ordinal" }).select(n);
+  return `${n}${suffixes[rule]}`;
+}
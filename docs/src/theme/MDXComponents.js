@@ -5,6 +5,8 @@ import CalloutSolution from "@site/src/components/CalloutSolution";
 import CalloutSolutionNotYetAvailable from "@site/src/components/CalloutSolutionNotYetAvailable";
 import CalloutWriteup from "@site/src/components/CalloutWriteup";
 import CalloutWriteupNotYetAvailable from "@site/src/components/CalloutWriteupNotYetAvailable";
+import Leaderboard from "@site/src/components/Leaderboard";
+import Performance from "@site/src/components/Performance";
 
 export default {
   // Re-use the default mapping
@@ -14,4 +16,6 @@ export default {
   CalloutSolutionNotYetAvailable: CalloutSolutionNotYetAvailable,
   CalloutWriteup: CalloutWriteup,
   CalloutWriteupNotYetAvailable: CalloutWriteupNotYetAvailable,
+  Leaderboard: Leaderboard,
+  Performance: Performance,
 };